@@ -1,9 +1,32 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Filter expressions per scan tier, over cross-section metrics (close, volume,
+# bars, volatility, momentum, volume_surge, sma_<n>, rsi_<n>) and any
+# ScannerConfig field as a threshold. See application/filters.
+DEFAULT_FILTERS = {
+    'snapshot': [
+        'min_price <= close <= max_price',
+        'volume >= min_volume',
+    ],
+    'short_history': [
+        'min_volatility <= volatility <= max_volatility',
+    ],
+    'detailed': [
+        'bars >= min_history_bars',
+        'volume_surge > volume_surge_factor',
+        'close > sma_20',
+        'sma_20 > sma_50',
+        'min_rsi <= rsi_14 <= max_rsi',
+        'momentum > min_momentum',
+    ],
+}
 
 @dataclass
 class ScannerConfig:
     symbols: Optional[List[str]] = None
+    universe_version: Optional[str] = None       # None = latest snapshot
+    universe_indices: Optional[List[str]] = None # e.g. ['SP500', 'NDX100']; None = all
     batch_size: int = 100
     min_volume: int = 1_000_000
     min_price: float = 5.0
@@ -12,6 +35,16 @@ class ScannerConfig:
     max_volatility: float = 0.50
     momentum_lookback: int = 5
     min_momentum: float = 0.02
+    volume_surge_factor: float = 1.5   # Last 5 sessions' volume vs the window's average
+    min_rsi: float = 30.0
+    max_rsi: float = 70.0
+    min_history_bars: int = 60
+    filters: Dict[str, List[str]] = field(default_factory=lambda: {
+        tier: list(expressions) for tier, expressions in DEFAULT_FILTERS.items()
+    })
+    adaptive_filters: bool = True      # Reorder predicates by measured cost and selectivity
+    checkpoint_dir: Optional[str] = None   # Journal each batch here so a scan can resume
+    checkpoint_retention_days: float = 7.0
 
 class Config:
     def __init__(self):
@@ -24,8 +57,55 @@ class NewsConfig:
     min_sentiment_score: float = 0.2
     min_news_volume: float = 0.3
     days_to_analyze: int = 7
+    request_timeout: float = 10.0         # Per provider request attempt
+    scan_budget_seconds: float = 120.0    # All news requests of one enrichment pass, retries included
+
+@dataclass
+class ScoringConfig:
+    top_k: int = 25                    # Candidates kept, enriched (metadata, news) and reported
+    momentum_weight: float = 0.35
+    volume_weight: float = 0.25
+    rsi_weight: float = 0.15
+    sentiment_weight: float = 0.25     # Applied after enrichment, to re-order the top K
+    momentum_scale: float = 0.10       # Momentum earning the full momentum score
+    volume_surge_cap: float = 3.0      # Volume surge earning the full volume score
+
+@dataclass
+class FundamentalsConfig:
+    path: str = "data/fundamentals.json"
+    max_age_hours: float = 24.0           # Metadata older than this is refreshed
+    refresh_interval_minutes: float = 60.0
+    refresh_concurrency: int = 8
+
+@dataclass
+class SchedulerConfig:
+    universe_refresh_minutes: float = 24 * 60   # Reload constituents
+    history_refresh_minutes: float = 60.0       # Incremental bar refresh and rescan
+    news_refresh_minutes: float = 5.0           # Re-score news for the current results
+    news_feed_minutes: float = 2.0              # Poll market-wide news; re-analyze tickers in it
+    scan_after_close: bool = True               # One more scan once the session's final bars exist
+    close_grace_minutes: float = 15.0           # Wait after the close before that scan
+
+@dataclass
+class DataConfig:
+    local_data_dir: Optional[str] = None   # CSV/Parquet bars served alongside yfinance
+    hedge_quantile: float = 0.95           # Hedge a request once it's slower than this latency quantile
+
+@dataclass
+class LoggingConfig:
+    level: str = "INFO"
+    json_output: bool = False          # One JSON object per line (production)
+    color: Optional[bool] = None       # None = colorize only on a TTY
+    symbol_sample_rate: int = 1        # Keep 1 in N per-symbol info/debug records
+    symbol_rate_limit: float = 5.0     # Per-symbol records per second
+    symbol_burst: int = 10
 
 class Config:
     def __init__(self):
         self.scanner = ScannerConfig()
-        self.news = NewsConfig()
\ No newline at end of file
+        self.news = NewsConfig()
+        self.scoring = ScoringConfig()
+        self.fundamentals = FundamentalsConfig()
+        self.scheduler = SchedulerConfig()
+        self.logging = LoggingConfig()
+        self.data = DataConfig()
\ No newline at end of file
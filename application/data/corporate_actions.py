@@ -0,0 +1,163 @@
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .panel import FIELDS
+
+logger = logging.getLogger(__name__)
+
+SPLIT = 'split'
+DIVIDEND = 'dividend'
+
+# Columns yfinance adds to bars downloaded with actions=True
+ACTION_COLUMNS = {'Stock Splits': SPLIT, 'Dividends': DIVIDEND}
+
+
+@dataclass(frozen=True)
+class CorporateAction:
+    symbol: str
+    ex_date: date
+    kind: str       # SPLIT or DIVIDEND
+    value: float    # New shares per old share for a split, cash per share for a dividend
+
+    def factors(self, close_before: float, reflected: bool = False) -> Tuple[float, float]:
+        """Multipliers for prices and volumes of bars before the ex-date.
+
+        ``close_before`` is the last close before the ex-date; ``reflected``
+        says it is already adjusted for this action.
+        """
+        if self.kind == SPLIT:
+            return 1.0 / self.value, self.value
+        if close_before is None or np.isnan(close_before):
+            return 1.0, 1.0
+        if reflected:
+            close_before += self.value
+        if self.value >= close_before:
+            return 1.0, 1.0
+        # Same convention as Yahoo's adjusted close: the dividend as a share of the last close
+        return 1.0 - self.value / close_before, 1.0
+
+
+def split_actions(symbol: str, bars: pd.DataFrame) -> Tuple[pd.DataFrame, List[CorporateAction]]:
+    """Separate yfinance's action columns from a symbol's bars"""
+    present = [column for column in ACTION_COLUMNS if column in bars.columns]
+    if not present:
+        return bars, []
+    actions = []
+    for column in present:
+        values = bars[column]
+        for ts, value in values[values.fillna(0) > 0].items():
+            actions.append(CorporateAction(symbol, ts.date(), ACTION_COLUMNS[column], float(value)))
+    return bars.drop(columns=present), actions
+
+
+def _rows_before(index: pd.DatetimeIndex, day: date) -> int:
+    ts = pd.Timestamp(day)
+    if index.tz is not None:
+        ts = ts.tz_localize(index.tz)
+    return int(index.searchsorted(ts, side='left'))
+
+
+class CorporateActions:
+    """Tracks splits and dividends per symbol and keeps cached bars adjusted for them.
+
+    Cached bars must already reflect every action observed so far (as a
+    fresh auto-adjusted download does). When ``apply`` is given an action
+    newer than a symbol's cached bars, that frame is rescaled in place and
+    only the symbol's cached features are dropped, instead of the whole
+    history being downloaded again.
+    """
+
+    def __init__(self, feature_store=None):
+        self.feature_store = feature_store
+        self._actions: Dict[str, Dict[Tuple[date, str], CorporateAction]] = {}
+        self._factors: Dict[CorporateAction, Tuple[float, float]] = {}
+        self.applied = 0
+        self.rows_rescaled = 0
+
+    def actions(self, symbol: str) -> List[CorporateAction]:
+        return sorted(self._actions.get(symbol, {}).values(), key=lambda a: a.ex_date)
+
+    def observe(self, actions: Iterable[CorporateAction]) -> List[CorporateAction]:
+        """Record actions; returns those not seen before"""
+        new = []
+        for action in actions:
+            known = self._actions.setdefault(action.symbol, {})
+            key = (action.ex_date, action.kind)
+            if key not in known:
+                known[key] = action
+                new.append(action)
+        return new
+
+    def apply(self,
+              symbol: str,
+              actions: Iterable[CorporateAction],
+              bars: pd.DataFrame,
+              reference: Optional[pd.DataFrame] = None) -> bool:
+        """Rescale a symbol's cached ``bars`` in place for newly observed actions.
+
+        Actions dated on or before the last cached bar are already reflected
+        (the download that brought that bar saw them) and only recorded.
+        ``reference`` is the adjusted download the actions came with; when
+        it has the session before an ex-date, that close sizes the dividend.
+        Returns whether the bars were rescaled.
+        """
+        if bars.empty:
+            return False
+        last = bars.index[-1].date()
+        pending = [action for action in sorted(actions, key=lambda a: a.ex_date) if action.ex_date > last]
+        if not pending:
+            return False
+
+        step = np.ones(2)
+        last_close = float(bars['Close'].iloc[-1])
+        for action in pending:
+            # Every cached bar predates the ex-date
+            price_factor, volume_factor = self._reference_factors(action, reference)
+            if price_factor is None:
+                price_factor, volume_factor = self._action_factors(action, last_close * step[0])
+            step *= (price_factor, volume_factor)
+            self.applied += 1
+            self.rows_rescaled += len(bars)
+            logger.info(f"Adjusted {len(bars)} bars of {symbol} for a {action.kind} "
+                        f"({action.value:g}) going ex on {action.ex_date}")
+        self._rescale(bars, step)
+
+        if self.feature_store is not None:
+            self.feature_store.invalidate(symbol)
+        return True
+
+    def forget(self, symbol: str):
+        for action in self._actions.pop(symbol, {}).values():
+            self._factors.pop(action, None)
+
+    @staticmethod
+    def _rescale(bars: pd.DataFrame, step: np.ndarray):
+        # Column by column: the frame's other columns are neither copied nor touched
+        for column in FIELDS:
+            if column == 'Volume' or column not in bars.columns:
+                continue
+            bars[column] = bars[column] * step[0]
+        if 'Volume' in bars.columns and step[1] != 1.0:
+            volume = bars['Volume'] * step[1]
+            if np.issubdtype(bars['Volume'].dtype, np.integer):
+                volume = volume.round().astype(bars['Volume'].dtype)
+            bars['Volume'] = volume
+
+    def _reference_factors(self, action: CorporateAction, reference: Optional[pd.DataFrame]):
+        if action in self._factors or reference is None or 'Close' not in reference.columns:
+            return None, None
+        closes = reference['Close'].dropna()
+        rows = _rows_before(closes.index, action.ex_date)
+        if not rows:
+            return None, None
+        return self._action_factors(action, float(closes.iloc[rows - 1]), reflected=True)
+
+    def _action_factors(self, action: CorporateAction, close_before: float,
+                        reflected: bool = False) -> Tuple[float, float]:
+        factors = self._factors.get(action)
+        if factors is None:
+            factors = self._factors[action] = action.factors(close_before, reflected)
+        return factors
@@ -0,0 +1,243 @@
+import logging
+import os
+import tempfile
+import uuid
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+import numpy as np
+import pandas as pd
+from ..universe.universe import SymbolTable
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('Open', 'High', 'Low', 'Close', 'Volume')
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+# Per-symbol cost of a pandas frame beyond its values (index, blocks, column labels)
+_PANDAS_FRAME_OVERHEAD = 2_000
+
+
+class PanelError(Exception):
+    pass
+
+
+class BarPanel:
+    """Daily OHLCV for many symbols on one shared date axis.
+
+    Values live in contiguous blocks shaped ``(field, symbol, day)``, so
+    each symbol's series is contiguous. The default dtype is float32, which
+    keeps about 7 significant digits: cents on prices below about $100k,
+    and volumes to within 1e-7. Symbols are addressed by SymbolTable IDs.
+    With a ``memory_budget`` the newest days that fit stay in RAM and the
+    older ones spill to a memory-mapped file. The window has a fixed length:
+    appending a day drops the oldest one.
+    """
+
+    def __init__(self,
+                 dates: Sequence,
+                 symbols: Iterable[str],
+                 dtype=np.float32,
+                 memory_budget: Optional[int] = None,
+                 spill_dir: Optional[str] = None):
+        self.dates = np.asarray(pd.DatetimeIndex(dates).values.astype('datetime64[D]'))
+        self.symbols = symbols if isinstance(symbols, SymbolTable) else SymbolTable(symbols)
+        self.dtype = np.dtype(dtype)
+        self.memory_budget = memory_budget
+        self._spill_path: Optional[str] = None
+
+        n_symbols, n_days = len(self.symbols), len(self.dates)
+        bytes_per_day = len(FIELDS) * n_symbols * self.dtype.itemsize
+        hot_days = n_days
+        if memory_budget is not None and bytes_per_day:
+            hot_days = min(n_days, max(1, memory_budget // bytes_per_day))
+
+        # Blocks ordered oldest first; only the last one is in RAM
+        self._blocks: List[np.ndarray] = []
+        cold_days = n_days - hot_days
+        if cold_days:
+            directory = spill_dir or tempfile.gettempdir()
+            os.makedirs(directory, exist_ok=True)
+            self._spill_path = os.path.join(directory, f"panel-{uuid.uuid4().hex}.bin")
+            cold = np.memmap(self._spill_path, dtype=self.dtype, mode='w+',
+                             shape=(len(FIELDS), n_symbols, cold_days))
+            cold[:] = np.nan
+            self._blocks.append(cold)
+            logger.info(f"Panel spills {cold_days} of {n_days} days to {self._spill_path}")
+        self._blocks.append(np.full((len(FIELDS), n_symbols, hot_days), np.nan, dtype=self.dtype))
+
+    @classmethod
+    def from_block(cls, dates: np.ndarray, symbols: Iterable[str], block: np.ndarray) -> 'BarPanel':
+        """Wrap an existing ``(field, symbol, day)`` array (e.g. shared memory) without copying"""
+        panel = cls.__new__(cls)
+        panel.dates = dates
+        panel.symbols = symbols if isinstance(symbols, SymbolTable) else SymbolTable(symbols)
+        panel.dtype = block.dtype
+        panel.memory_budget = None
+        panel._spill_path = None
+        panel._blocks = [block]
+        return panel
+
+    def copy_into(self, out: np.ndarray):
+        """Write the whole window, spilled days included, into a ``shape``-sized array"""
+        offset = 0
+        for block in self._blocks:
+            out[:, :, offset:offset + block.shape[2]] = block
+            offset += block.shape[2]
+
+    @classmethod
+    def from_frames(cls,
+                    frames: Mapping[str, pd.DataFrame],
+                    days: Optional[int] = None,
+                    **kwargs) -> 'BarPanel':
+        """Build a panel from per-symbol OHLCV frames on the union of their dates"""
+        indexes = [frame.index for frame in frames.values() if len(frame)]
+        if not indexes:
+            raise PanelError("No bars to build a panel from")
+        dates = np.unique(np.concatenate([
+            _to_days(index) for index in indexes
+        ]))
+        if days is not None:
+            dates = dates[-days:]
+        panel = cls(dates, list(frames), **kwargs)
+        for symbol, frame in frames.items():
+            panel.set_frame(symbol, frame)
+        return panel
+
+    # Shape
+
+    @property
+    def shape(self):
+        return len(FIELDS), len(self.symbols), len(self.dates)
+
+    @property
+    def hot_days(self) -> int:
+        return self._blocks[-1].shape[2]
+
+    @property
+    def spilled(self) -> bool:
+        return len(self._blocks) > 1
+
+    # Writes
+
+    def set_frame(self, symbol: str, frame: pd.DataFrame):
+        """Write a symbol's bars; dates outside the panel's axis are ignored"""
+        symbol_id = self._id(symbol)
+        days = _to_days(frame.index)
+        if len(days) == len(self.dates) and np.array_equal(days, self.dates):
+            positions, inside = np.arange(len(days)), slice(None)
+        else:
+            positions = np.searchsorted(self.dates, days)
+            inside = positions < len(self.dates)
+            inside[inside] = self.dates[positions[inside]] == days[inside]
+            positions = positions[inside]
+        columns = frame.columns.get_indexer(FIELDS)
+        # One conversion of the whole (usually single-block) frame beats per-column access
+        values = frame.to_numpy(dtype=self.dtype)[inside]
+        for i, column in enumerate(columns):
+            if column >= 0:
+                self._write(i, symbol_id, positions, values[:, column])
+
+    def append_day(self, day, values: Mapping[str, np.ndarray]):
+        """Roll the window forward one day; ``values`` maps field -> array indexed by symbol ID"""
+        day = np.datetime64(pd.Timestamp(day).date(), 'D')
+        if day <= self.dates[-1]:
+            raise PanelError(f"{day} is not after the panel's last day {self.dates[-1]}")
+        # Oldest block first, so each block takes over the oldest day of the
+        # next one before that block shifts
+        for k, block in enumerate(self._blocks):
+            block[:, :, :-1] = block[:, :, 1:]
+            if k + 1 < len(self._blocks):
+                block[:, :, -1] = self._blocks[k + 1][:, :, 0]
+            else:
+                block[:, :, -1] = np.nan
+                for field, array in values.items():
+                    block[FIELD_INDEX[field], :, -1] = array
+        self.dates = np.append(self.dates[1:], day)
+
+    # Reads
+
+    def field(self, name: str, days: Optional[int] = None) -> np.ndarray:
+        """``(symbol, day)`` array of one field; a view unless it reaches into spilled days"""
+        return self._read(FIELD_INDEX[name], slice(None), days)
+
+    def series(self, symbol: str, name: str = 'Close', days: Optional[int] = None) -> np.ndarray:
+        return self._read(FIELD_INDEX[name], self._id(symbol), days)
+
+    def latest(self, name: str = 'Close') -> np.ndarray:
+        """Last day's value for every symbol (NaN where a symbol didn't trade)"""
+        return self._blocks[-1][FIELD_INDEX[name], :, -1]
+
+    def to_frame(self, symbol: str, days: Optional[int] = None) -> pd.DataFrame:
+        """One symbol's bars as a float64 DataFrame, for code that expects pandas"""
+        days = days or len(self.dates)
+        symbol_id = self._id(symbol)
+        frame = pd.DataFrame(
+            {field: self._read(i, symbol_id, days).astype(np.float64) for field, i in FIELD_INDEX.items()},
+            index=pd.DatetimeIndex(self.dates[-days:])
+        )
+        return frame.dropna(how='all')
+
+    def footprint(self) -> Dict[str, float]:
+        """Resident and mapped bytes, compared with per-symbol float64 pandas frames"""
+        resident = self._blocks[-1].nbytes + self.dates.nbytes
+        mapped = sum(block.nbytes for block in self._blocks[:-1])
+        n_fields, n_symbols, n_days = self.shape
+        pandas_equivalent = n_symbols * (n_days * (n_fields * 8 + 8) + _PANDAS_FRAME_OVERHEAD)
+        return {
+            'symbols': n_symbols,
+            'days': n_days,
+            'hot_days': self.hot_days,
+            'dtype': str(self.dtype),
+            'resident_bytes': resident,
+            'mapped_bytes': mapped,
+            'pandas_equivalent_bytes': pandas_equivalent,
+            'ratio': (resident + mapped) / pandas_equivalent if pandas_equivalent else 0.0,
+        }
+
+    def close(self):
+        """Release and delete the spill file"""
+        if self._spill_path:
+            # Views handed out earlier keep their mapping alive until released
+            self._blocks = self._blocks[-1:]
+            try:
+                os.remove(self._spill_path)
+            except FileNotFoundError:
+                pass
+            self._spill_path = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _id(self, symbol: str) -> int:
+        symbol_id = self.symbols.id_of(symbol)
+        if symbol_id is None:
+            raise PanelError(f"{symbol} is not in the panel")
+        return symbol_id
+
+    def _read(self, field: int, rows, days: Optional[int]) -> np.ndarray:
+        days = days or len(self.dates)
+        hot = self._blocks[-1]
+        if days <= hot.shape[2]:
+            return hot[field, rows, hot.shape[2] - days:]
+        return np.concatenate([block[field, rows] for block in self._blocks], axis=-1)[..., -days:]
+
+    def _write(self, field: int, symbol_id: int, positions: np.ndarray, values: np.ndarray):
+        if len(self._blocks) == 1:
+            self._blocks[0][field, symbol_id, positions] = values
+            return
+        offset = 0
+        for block in self._blocks:
+            width = block.shape[2]
+            mask = (positions >= offset) & (positions < offset + width)
+            if mask.any():
+                block[field, symbol_id, positions[mask] - offset] = values[mask]
+            offset += width
+
+
+def _to_days(index: pd.Index) -> np.ndarray:
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]')
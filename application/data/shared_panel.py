@@ -0,0 +1,172 @@
+import atexit
+import logging
+import os
+import tempfile
+import uuid
+import weakref
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Mapping, Optional, Tuple
+import numpy as np
+from .panel import BarPanel, PanelError
+
+logger = logging.getLogger(__name__)
+
+# tmpfs on Linux, so segments are plain shared pages; elsewhere the page cache does the sharing
+SEGMENT_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+SEGMENT_PREFIX = 'tp-panel-'
+_ALIGNMENT = 64
+_BARS = '__bars__'
+_DATES = '__dates__'
+
+
+@dataclass(frozen=True)
+class SharedPanelHandle:
+    """Everything a worker needs to attach; small and cheap to pickle"""
+    path: str
+    symbols: Tuple[str, ...]
+    # name -> (byte offset, shape, dtype)
+    layout: Tuple[Tuple[str, int, Tuple[int, ...], str], ...]
+    # First day the bars were requested from; the first panel date may be later (weekends, holidays)
+    start: Optional[date] = None
+
+    @property
+    def arrays(self) -> Tuple[str, ...]:
+        return tuple(name for name, *_ in self.layout if name not in (_BARS, _DATES))
+
+
+class SharedPanel:
+    """Publishes a BarPanel, plus optional indicator arrays, as one shared segment.
+
+    The owning process copies the data in once and hands ``handle`` to its
+    workers, which map the same pages read-only through SharedPanelView, so
+    adding workers adds no copies of the panel. Reading a symbol as a pandas
+    frame (``BarPanel.to_frame``) does copy it. The segment is a file named after the
+    owner's PID: it is removed on close, garbage collection or interpreter
+    exit, and segments left by an owner that was killed outright are swept
+    by the next SharedPanel created on the host.
+    """
+
+    def __init__(self,
+                 panel: BarPanel,
+                 arrays: Optional[Mapping[str, np.ndarray]] = None,
+                 directory: Optional[str] = None,
+                 start: Optional[date] = None):
+        directory = directory or SEGMENT_DIR
+        sweep_stale_segments(directory)
+
+        specs = [(_BARS, panel.shape, panel.dtype), (_DATES, panel.dates.shape, panel.dates.dtype)]
+        for name, array in (arrays or {}).items():
+            if name in (_BARS, _DATES):
+                raise PanelError(f"{name} is a reserved array name")
+            specs.append((name, array.shape, array.dtype))
+
+        layout, size = [], 0
+        for name, shape, dtype in specs:
+            size = -(-size // _ALIGNMENT) * _ALIGNMENT
+            layout.append((name, size, tuple(shape), np.dtype(dtype).str))
+            size += int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+        path = os.path.join(directory, f"{SEGMENT_PREFIX}{os.getpid()}-{uuid.uuid4().hex}.bin")
+        segment = np.memmap(path, dtype=np.uint8, mode='w+', shape=(max(size, 1),))
+        self._finalizer = weakref.finalize(self, _remove_segment, path, os.getpid())
+        atexit.register(self._finalizer)
+
+        views = _map(segment, layout)
+        panel.copy_into(views[_BARS])
+        views[_DATES][:] = panel.dates
+        for name, array in (arrays or {}).items():
+            views[name][:] = array
+        segment.flush()
+        del views, segment
+
+        self.handle = SharedPanelHandle(path, tuple(panel.symbols.symbols), tuple(layout), start)
+        self.nbytes = size
+        logger.info(f"Shared {len(panel.symbols)} symbols x {len(panel.dates)} days "
+                    f"({size / 1e6:.1f} MB) at {path}")
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self):
+        """Remove the segment; workers already attached keep their mapping until they close"""
+        self._finalizer()
+        atexit.unregister(self._finalizer)
+
+    def __enter__(self) -> 'SharedPanel':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedPanelView:
+    """Read-only attachment to a SharedPanel; ``panel`` has the BarPanel read API"""
+
+    def __init__(self, handle: SharedPanelHandle):
+        self.handle = handle
+        try:
+            self._segment = np.memmap(handle.path, dtype=np.uint8, mode='r')
+        except FileNotFoundError:
+            raise PanelError(f"Shared panel {handle.path} no longer exists")
+        self._arrays = _map(self._segment, handle.layout)
+        self.panel = BarPanel.from_block(self._arrays.pop(_DATES), handle.symbols, self._arrays.pop(_BARS))
+
+    def array(self, name: str) -> np.ndarray:
+        try:
+            return self._arrays[name]
+        except KeyError:
+            raise PanelError(f"No shared array named {name}")
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.panel.symbols
+
+    def close(self):
+        self._arrays.clear()
+        self.panel = None
+        self._segment = None
+
+
+def sweep_stale_segments(directory: Optional[str] = None) -> int:
+    """Delete segments whose owning process no longer exists; returns how many"""
+    directory = directory or SEGMENT_DIR
+    removed = 0
+    for name in os.listdir(directory):
+        if not name.startswith(SEGMENT_PREFIX):
+            continue
+        pid = name[len(SEGMENT_PREFIX):].split('-', 1)[0]
+        if pid.isdigit() and not _pid_alive(int(pid)):
+            _remove_segment(os.path.join(directory, name))
+            removed += 1
+    if removed:
+        logger.warning(f"Removed {removed} shared panel segments left by dead processes")
+    return removed
+
+
+def _map(segment: np.ndarray, layout) -> Dict[str, np.ndarray]:
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment, offset=offset)
+        for name, offset, shape, dtype in layout
+    }
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == 'nt':
+        return True  # Signal 0 would terminate the process on Windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Someone else's process
+    return True
+
+
+def _remove_segment(path: str, owner: Optional[int] = None):
+    if owner is not None and owner != os.getpid():
+        return  # A forked child exiting must not remove its parent's segment
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
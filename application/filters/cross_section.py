@@ -0,0 +1,141 @@
+import re
+import warnings
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Right-aligned (symbol, bar) matrix of one field, restricted to the rows being evaluated
+FieldGetter = Callable[[str], np.ndarray]
+
+
+class Metric(NamedTuple):
+    compute: Callable[..., np.ndarray]
+    params: Tuple[str, ...] = ()         # Thresholds the metric itself depends on
+    fields: Tuple[str, ...] = ('Close',)
+
+
+def _close(field: FieldGetter) -> np.ndarray:
+    return field('Close')[:, -1]
+
+
+def _volume(field: FieldGetter) -> np.ndarray:
+    return field('Volume')[:, -1]
+
+
+def _bars(field: FieldGetter) -> np.ndarray:
+    return np.count_nonzero(~np.isnan(field('Close')), axis=1).astype(np.float64)
+
+
+def _volatility(field: FieldGetter) -> np.ndarray:
+    """Annualized volatility of daily returns"""
+    close = field('Close')
+    returns = close[:, 1:] / close[:, :-1] - 1
+    return np.nanstd(returns, axis=1, ddof=1) * np.sqrt(252)
+
+
+def _momentum(field: FieldGetter, momentum_lookback: int) -> np.ndarray:
+    close = field('Close')
+    if close.shape[1] < momentum_lookback:
+        return np.full(len(close), np.nan)
+    return close[:, -1] / close[:, -momentum_lookback] - 1
+
+
+def _volume_surge(field: FieldGetter) -> np.ndarray:
+    """Mean volume of the last 5 bars relative to the whole window"""
+    volume = field('Volume')
+    return np.nanmean(volume[:, -5:], axis=1) / np.nanmean(volume, axis=1)
+
+
+def _sma(field: FieldGetter, window: int) -> np.ndarray:
+    close = field('Close')
+    if close.shape[1] < window:
+        return np.full(len(close), np.nan)
+    return close[:, -window:].mean(axis=1)
+
+
+def _rsi(field: FieldGetter, period: int) -> np.ndarray:
+    """Latest value of the simple-average RSI indicator"""
+    delta = np.diff(field('Close'), axis=1)[:, -period:]
+    if delta.shape[1] < period:
+        return np.full(len(delta), np.nan)
+    gain = np.where(delta > 0, delta, 0).mean(axis=1)
+    loss = np.where(delta < 0, -delta, 0).mean(axis=1)
+    return 100 - 100 / (1 + gain / loss)
+
+
+METRICS: Dict[str, Metric] = {
+    'close': Metric(_close),
+    'volume': Metric(_volume, fields=('Volume',)),
+    'bars': Metric(_bars),
+    'volatility': Metric(_volatility),
+    'momentum': Metric(_momentum, ('momentum_lookback',)),
+    'volume_surge': Metric(_volume_surge, fields=('Volume',)),
+}
+
+# Parameterized metrics, e.g. sma_20 or rsi_14
+PARAMETRIC_METRICS: Dict[str, Callable[..., np.ndarray]] = {
+    'sma': _sma,
+    'rsi': _rsi,
+}
+_PARAMETRIC = re.compile(r'^([a-z]+)_(\d+)$')
+
+
+def resolve_metric(name: str) -> Optional[Metric]:
+    """The Metric for a name used in a filter expression, or None if there is none"""
+    metric = METRICS.get(name)
+    if metric is not None:
+        return metric
+    match = _PARAMETRIC.match(name)
+    if match and match.group(1) in PARAMETRIC_METRICS:
+        compute, n = PARAMETRIC_METRICS[match.group(1)], int(match.group(2))
+        return Metric(lambda field: compute(field, n))
+    return None
+
+
+class CrossSection:
+    """Trailing bars of many symbols, right-aligned so column -1 is each symbol's latest bar.
+
+    Metrics are computed on demand for just the rows asked for and cached,
+    so re-filtering with new thresholds costs no recomputation or refetch.
+    """
+
+    def __init__(self, frames: Mapping[str, pd.DataFrame]):
+        self.symbols: List[str] = list(frames)
+        self._frames = frames
+        self.depth = max((len(frame) for frame in frames.values()), default=0)
+        self._fields: Dict[str, np.ndarray] = {}
+        # (metric, param values) -> (values, computed mask)
+        self._metrics: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def field(self, name: str) -> np.ndarray:
+        matrix = self._fields.get(name)
+        if matrix is None:
+            matrix = np.full((len(self.symbols), self.depth), np.nan)
+            for i, frame in enumerate(self._frames.values()):
+                if len(frame):
+                    matrix[i, self.depth - len(frame):] = frame[name].to_numpy(np.float64)
+            self._fields[name] = matrix
+        return matrix
+
+    def metric(self, name: str, rows: np.ndarray, params: object = None) -> np.ndarray:
+        """Metric values for the given row indices"""
+        metric = resolve_metric(name)
+        if metric is None:
+            raise KeyError(name)
+        values = {param: getattr(params, param) for param in metric.params}
+        key = (name, tuple(values.values()))
+        cached = self._metrics.get(key)
+        if cached is None:
+            cached = self._metrics[key] = (np.full(len(self.symbols), np.nan), np.zeros(len(self.symbols), bool))
+        result, computed = cached
+
+        missing = rows[~computed[rows]]
+        if len(missing):
+            with warnings.catch_warnings(), np.errstate(all='ignore'):
+                warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN rows
+                result[missing] = metric.compute(lambda field: self.field(field)[missing], **values)
+            computed[missing] = True
+        return result[rows]
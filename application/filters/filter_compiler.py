@@ -0,0 +1,180 @@
+import ast
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+import numpy as np
+from .cross_section import CrossSection, resolve_metric
+
+_COMPARISONS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+_ARITHMETIC = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+# Stand-in for "never eliminates anything" when ranking unmeasured or non-selective predicates
+_MIN_ELIMINATION = 1e-3
+
+
+class FilterError(Exception):
+    pass
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrites boolean logic into elementwise operators so expressions work on arrays"""
+
+    def visit_Compare(self, node: ast.Compare):
+        self.generic_visit(node)
+        # a <= b < c  ->  (a <= b) & (b < c)
+        parts = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            parts.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = right
+        return self._join(parts, ast.BitAnd())
+
+    def visit_BoolOp(self, node: ast.BoolOp):
+        self.generic_visit(node)
+        return self._join(node.values, ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr())
+
+    def visit_UnaryOp(self, node: ast.UnaryOp):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=node.operand)
+        return node
+
+    @staticmethod
+    def _join(parts, op):
+        result = parts[0]
+        for part in parts[1:]:
+            result = ast.BinOp(left=result, op=op, right=part)
+        return result
+
+
+def _validate(node: ast.AST, expression: str):
+    for child in ast.walk(node):
+        allowed = (
+            isinstance(child, (ast.Expression, ast.Compare, ast.BoolOp, ast.And, ast.Or,
+                               ast.Name, ast.Load, ast.BinOp, ast.UnaryOp, ast.Not, ast.USub)
+                       + _COMPARISONS + _ARITHMETIC)
+            or (isinstance(child, ast.Constant) and isinstance(child.value, (int, float))
+                and not isinstance(child.value, bool))
+        )
+        if not allowed:
+            raise FilterError(f"Unsupported syntax {type(child).__name__} in filter '{expression}'")
+
+
+class Predicate:
+    """One compiled filter expression, e.g. ``min_price <= close <= max_price``.
+
+    Names are metrics of the cross-section (see ``cross_section.METRICS``)
+    or thresholds read from the params object when the predicate runs.
+    """
+
+    def __init__(self, expression: str, params: object):
+        self.expression = expression
+        try:
+            tree = ast.parse(expression.strip(), mode='eval')
+        except SyntaxError as e:
+            raise FilterError(f"Invalid filter '{expression}': {e.msg}")
+        _validate(tree, expression)
+
+        names = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)})
+        self.thresholds = [name for name in names if hasattr(params, name)]
+        self.metrics = [name for name in names if name not in self.thresholds]
+        self.fields = set()
+        for name in self.metrics:
+            metric = resolve_metric(name)
+            if metric is None:
+                raise FilterError(f"Unknown metric or threshold '{name}' in filter '{expression}'")
+            self.fields.update(metric.fields)
+
+        tree = ast.fix_missing_locations(_Vectorize().visit(tree))
+        self._code = compile(tree, f"<filter {expression}>", 'eval')
+
+    def evaluate(self, section: CrossSection, rows: np.ndarray, params: object) -> np.ndarray:
+        """Boolean mask over ``rows``; NaN metrics never pass"""
+        namespace = {name: getattr(params, name) for name in self.thresholds}
+        for name in self.metrics:
+            namespace[name] = section.metric(name, rows, params)
+        with np.errstate(invalid='ignore'):
+            mask = eval(self._code, {'__builtins__': {}}, namespace)
+        return np.broadcast_to(np.asarray(mask, dtype=bool), rows.shape)
+
+
+@dataclass
+class PredicateStats:
+    expression: str
+    evaluated: int = 0      # Symbols the predicate ran on
+    passed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def eliminated(self) -> int:
+        return self.evaluated - self.passed
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.evaluated if self.evaluated else 1.0
+
+    @property
+    def cost_per_symbol(self) -> float:
+        return self.seconds / self.evaluated if self.evaluated else 0.0
+
+    @property
+    def rank(self) -> float:
+        """Cost per symbol eliminated; the cheapest, most selective predicate goes first"""
+        return self.cost_per_symbol / max(1.0 - self.pass_rate, _MIN_ELIMINATION)
+
+
+class FilterSet:
+    """A conjunction of predicates, evaluated only on the symbols still passing.
+
+    With ``adaptive`` the predicates are re-ordered after each run by their
+    measured cost and selectivity, so cheap predicates that eliminate many
+    symbols run first and expensive metrics are computed for few symbols.
+    """
+
+    def __init__(self, expressions: Sequence[str], params: object, adaptive: bool = True):
+        self.params = params
+        self.adaptive = adaptive
+        self.predicates = [Predicate(expression, params) for expression in expressions]
+        self.stats: Dict[str, PredicateStats] = {
+            predicate.expression: PredicateStats(predicate.expression) for predicate in self.predicates
+        }
+        # Symbols each predicate eliminated in the latest run
+        self.last_eliminated: Dict[str, int] = {}
+
+    def mask(self, section: CrossSection) -> np.ndarray:
+        passing = np.zeros(len(section), dtype=bool)
+        rows = np.arange(len(section))
+        self.last_eliminated = {}
+        # Loading bars is shared by every predicate, so keep it out of their measured cost
+        for name in set().union(*(predicate.fields for predicate in self.predicates)):
+            section.field(name)
+        for predicate in self.predicates:
+            if not len(rows):
+                break
+            started = time.perf_counter()
+            keep = predicate.evaluate(section, rows, self.params)
+            stats = self.stats[predicate.expression]
+            stats.seconds += time.perf_counter() - started
+            stats.evaluated += len(rows)
+            stats.passed += int(keep.sum())
+            self.last_eliminated[predicate.expression] = len(rows) - int(keep.sum())
+            rows = rows[keep]
+        passing[rows] = True
+        if self.adaptive:
+            # Unmeasured predicates rank 0, so each gets measured early
+            self.predicates.sort(key=lambda predicate: self.stats[predicate.expression].rank)
+        return passing
+
+    def apply(self, section: CrossSection) -> List[str]:
+        """Symbols passing every predicate, in the section's order"""
+        return [symbol for symbol, keep in zip(section.symbols, self.mask(section)) if keep]
+
+    def reset_stats(self):
+        for expression in self.stats:
+            self.stats[expression] = PredicateStats(expression)
+
+    def summary(self) -> List[str]:
+        return [
+            f"{s.expression}: {s.evaluated} -> {s.passed} ({s.eliminated} eliminated), "
+            f"{s.cost_per_symbol * 1e6:.1f}us/symbol"
+            for s in (self.stats[p.expression] for p in self.predicates)
+        ]
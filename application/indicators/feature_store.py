@@ -0,0 +1,111 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .indicator_interface import INDICATORS, Feature, Indicator
+
+logger = logging.getLogger(__name__)
+
+# (symbol, interval, last bar timestamp, bar count, last bar's values, feature)
+FeatureKey = Tuple[str, str, object, int, bytes, Feature]
+
+
+@dataclass
+class FeatureStoreStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes_used: int = 0
+
+
+def compute_features(bars: pd.DataFrame,
+                     features: Iterable[Feature],
+                     indicators: Mapping[str, Indicator] = INDICATORS) -> Dict[Feature, np.ndarray]:
+    """Compute features without caching (for callers that have no store)"""
+    return {f: indicators[f.name].compute(bars, **f.kwargs) for f in features}
+
+
+def _version(bars: pd.DataFrame) -> Tuple[object, int, bytes]:
+    if not len(bars):
+        return None, 0, b''
+    # Raw bytes, so a NaN in the last bar still matches itself
+    return bars.index[-1], len(bars), bars.iloc[-1].to_numpy(dtype=np.float64).tobytes()
+
+
+class FeatureStore:
+    """Indicator values computed once per data version and shared read-only.
+
+    Entries are keyed by symbol, interval, the last bar's timestamp, the
+    bar count and the last bar's values (together, the data version; the
+    values change when a partial bar is refetched), plus the feature and
+    its parameters. Returned arrays are marked non-writeable because every
+    consumer sees the same buffer. Least recently used entries are evicted
+    once ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 indicators: Optional[Mapping[str, Indicator]] = None):
+        self.max_bytes = max_bytes
+        self.indicators = dict(indicators or INDICATORS)
+        self.stats = FeatureStoreStats()
+        self._entries: "OrderedDict[FeatureKey, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, indicator: Indicator):
+        self.indicators[indicator.name] = indicator
+
+    def get(self, symbol: str, bars: pd.DataFrame, feature: Feature, interval: str = '1d') -> np.ndarray:
+        return self.get_many(symbol, bars, [feature], interval)[feature]
+
+    def get_many(self,
+                 symbol: str,
+                 bars: pd.DataFrame,
+                 features: Iterable[Feature],
+                 interval: str = '1d') -> Dict[Feature, np.ndarray]:
+        """Return every requested feature, computing the missing ones in one pass"""
+        version = _version(bars)
+        result, missing = {}, []
+        with self._lock:
+            for f in dict.fromkeys(features):
+                key = (symbol, interval, *version, f)
+                values = self._entries.get(key)
+                if values is None:
+                    missing.append(f)
+                else:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    result[f] = values
+
+        if missing:
+            computed = compute_features(bars, missing, self.indicators)
+            with self._lock:
+                for f, values in computed.items():
+                    values = np.ascontiguousarray(values)
+                    values.flags.writeable = False
+                    self._store((symbol, interval, *version, f), values)
+                    result[f] = values
+                self.stats.misses += len(missing)
+        return result
+
+    def invalidate(self, symbol: Optional[str] = None, interval: Optional[str] = None):
+        """Drop cached features for a symbol (optionally one interval), or everything"""
+        with self._lock:
+            for key in [key for key in self._entries
+                        if (symbol is None or key[0] == symbol)
+                        and (interval is None or key[1] == interval)]:
+                self.stats.bytes_used -= self._entries.pop(key).nbytes
+
+    def _store(self, key: FeatureKey, values: np.ndarray):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.stats.bytes_used -= previous.nbytes
+        self._entries[key] = values
+        self.stats.bytes_used += values.nbytes
+        while self.stats.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.stats.bytes_used -= evicted.nbytes
+            self.stats.evictions += 1
@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from typing import Dict, NamedTuple, Tuple
+import numpy as np
+import pandas as pd
+
+
+class Feature(NamedTuple):
+    """A named indicator plus its parameters, hashable so it can key a cache"""
+    name: str
+    params: Tuple[Tuple[str, object], ...] = ()
+
+    @property
+    def kwargs(self) -> Dict[str, object]:
+        return dict(self.params)
+
+    def __str__(self) -> str:
+        if not self.params:
+            return self.name
+        return f"{self.name}({', '.join(f'{k}={v}' for k, v in self.params)})"
+
+
+def feature(name: str, **params) -> Feature:
+    return Feature(name, tuple(sorted(params.items())))
+
+
+class Indicator(ABC):
+    """Computes one series aligned with the bars it was given"""
+    name: str
+
+    @abstractmethod
+    def compute(self, bars: pd.DataFrame, **params) -> np.ndarray:
+        pass
+
+
+class SMA(Indicator):
+    name = 'sma'
+
+    def compute(self, bars: pd.DataFrame, window: int = 20) -> np.ndarray:
+        return bars['Close'].rolling(window=window).mean().to_numpy(np.float64)
+
+
+class RSI(Indicator):
+    name = 'rsi'
+
+    def compute(self, bars: pd.DataFrame, period: int = 14) -> np.ndarray:
+        delta = bars['Close'].diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        rs = gain / loss
+        return (100 - (100 / (1 + rs))).to_numpy(np.float64)
+
+
+class Returns(Indicator):
+    name = 'returns'
+
+    def compute(self, bars: pd.DataFrame) -> np.ndarray:
+        return bars['Close'].pct_change().to_numpy(np.float64)
+
+
+class Momentum(Indicator):
+    """Rolling mean of daily returns"""
+    name = 'momentum'
+
+    def compute(self, bars: pd.DataFrame, window: int = 10) -> np.ndarray:
+        return bars['Close'].pct_change().rolling(window=window).mean().to_numpy(np.float64)
+
+
+class RollingVolatility(Indicator):
+    """Annualized std of log returns over ``window`` prices (``window - 1`` returns)"""
+    name = 'volatility'
+
+    def compute(self, bars: pd.DataFrame, window: int = 20) -> np.ndarray:
+        log_returns = np.log(bars['Close'] / bars['Close'].shift(1))
+        return (log_returns.rolling(window=window - 1).std() * np.sqrt(252)).to_numpy(np.float64)
+
+
+class VolumeSMA(Indicator):
+    name = 'volume_sma'
+
+    def compute(self, bars: pd.DataFrame, window: int = 20) -> np.ndarray:
+        return bars['Volume'].rolling(window=window).mean().to_numpy(np.float64)
+
+
+INDICATORS: Dict[str, Indicator] = {
+    indicator.name: indicator
+    for indicator in (SMA(), RSI(), Returns(), Momentum(), RollingVolatility(), VolumeSMA())
+}
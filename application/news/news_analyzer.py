@@ -2,6 +2,7 @@ from typing import List, Dict
 import logging
 from datetime import datetime
 from ..config.config import Config
+from ..utils.async_utils import CircuitOpenError, DeadlineExceeded
 from ...infrastructure.apis.news_providers.base import NewsProvider
 
 logger = logging.getLogger(__name__)
@@ -20,10 +21,17 @@ class NewsAnalyzer:
             try:
                 news = await provider.get_news(symbol, days_back)
                 all_news.extend(news)
+            except (CircuitOpenError, DeadlineExceeded) as e:
+                # Failing fast by design; analyze what the other providers returned
+                logger.warning(f"Skipping {type(provider).__name__} news for {symbol}: {str(e)}")
             except Exception as e:
                 logger.error(f"Error getting news from provider for {symbol}: {str(e)}")
         
-        if not all_news:
+        return self.analyze_articles(all_news)
+    
+    def analyze_articles(self, articles: List[Dict]) -> Dict:
+        """Sentiment and news-volume metrics for a list of articles, however they were fetched"""
+        if not articles:
             return {
                 'has_significant_news': False,
                 'sentiment_score': 0,
@@ -32,7 +40,7 @@ class NewsAnalyzer:
             }
         
         # Sort by date and calculate metrics
-        all_news.sort(key=lambda x: x['date'], reverse=True)
+        all_news = sorted(articles, key=lambda x: x['date'], reverse=True)
         
         # Calculate aggregate sentiment
         sentiments = [n['sentiment'] for n in all_news if 'sentiment' in n]
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from .news_analyzer import NewsAnalyzer
+from ...infrastructure.apis.news_providers.base import NewsProvider
+
+logger = logging.getLogger(__name__)
+
+
+def _article_key(article: Dict) -> str:
+    return article.get('url') or f"{article.get('title')}|{article.get('date')}"
+
+
+class TickerNewsIndex:
+    """Inverted index from ticker to its recent articles.
+
+    Articles are stored once, however many tickers they mention, and
+    deduplicated by URL across providers and polls. Each ticker keeps at
+    most ``max_per_ticker`` articles, newer than ``max_age_days``.
+    """
+
+    def __init__(self, max_age_days: float = 7.0, max_per_ticker: int = 50):
+        self.max_age = timedelta(days=max_age_days)
+        self.max_per_ticker = max_per_ticker
+        self._articles: Dict[str, Dict] = {}
+        self._by_ticker: Dict[str, List[str]] = {}   # Newest first
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def add(self, articles: Iterable[Dict]) -> Dict[str, int]:
+        """Index articles; returns ticker -> number of articles new to the index"""
+        gained: Dict[str, int] = {}
+        cutoff = (datetime.now() - self.max_age).isoformat()
+        for article in articles:
+            key = _article_key(article)
+            if key in self._articles or article['date'] < cutoff:
+                continue
+            self._articles[key] = article
+            for ticker in set(article.get('tickers', ())):
+                keys = self._by_ticker.setdefault(ticker, [])
+                keys.append(key)
+                gained[ticker] = gained.get(ticker, 0) + 1
+        for ticker in gained:
+            keys = self._by_ticker[ticker]
+            keys.sort(key=lambda k: self._articles[k]['date'], reverse=True)
+            del keys[self.max_per_ticker:]
+        return gained
+
+    def articles(self, ticker: str) -> List[Dict]:
+        """A ticker's recent articles, newest first, with that ticker's own sentiment when known"""
+        result = []
+        for key in self._by_ticker.get(ticker, ()):
+            article = self._articles.get(key)
+            if article is None:
+                continue
+            per_ticker = article.get('ticker_sentiment', {})
+            if ticker in per_ticker:
+                article = dict(article, sentiment=per_ticker[ticker])
+            result.append(article)
+        return result
+
+    def tickers(self) -> Set[str]:
+        return set(self._by_ticker)
+
+    def prune(self) -> int:
+        """Drop expired articles; returns how many"""
+        cutoff = (datetime.now() - self.max_age).isoformat()
+        expired = {key for key, article in self._articles.items() if article['date'] < cutoff}
+        for key in expired:
+            del self._articles[key]
+        if expired:
+            for ticker in list(self._by_ticker):
+                keys = [key for key in self._by_ticker[ticker] if key not in expired]
+                if keys:
+                    self._by_ticker[ticker] = keys
+                else:
+                    del self._by_ticker[ticker]
+        return len(expired)
+
+
+class ReanalysisQueue:
+    """FIFO of tickers awaiting re-analysis; a ticker already queued isn't queued twice"""
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, ticker: str) -> bool:
+        if ticker in self._pending:
+            return False
+        self._pending.add(ticker)
+        self._queue.put_nowait(ticker)
+        return True
+
+    async def get(self) -> str:
+        ticker = await self._queue.get()
+        self._pending.discard(ticker)
+        return ticker
+
+    def drain(self, limit: Optional[int] = None) -> List[str]:
+        """Everything queued right now (up to ``limit``), without waiting"""
+        tickers = []
+        while not self._queue.empty() and (limit is None or len(tickers) < limit):
+            ticker = self._queue.get_nowait()
+            self._pending.discard(ticker)
+            tickers.append(ticker)
+        return tickers
+
+
+class NewsIngestor:
+    """Polls providers' market-wide feeds into a TickerNewsIndex.
+
+    A ticker that gains new articles is re-scored from the index alone. If
+    its news is now significant, it is queued for re-analysis. Cost follows
+    the news flow: one request per provider per poll, plus work for the
+    tickers in the news.
+    """
+
+    def __init__(self,
+                 providers: List[NewsProvider],
+                 analyzer: NewsAnalyzer,
+                 index: Optional[TickerNewsIndex] = None,
+                 queue: Optional[ReanalysisQueue] = None,
+                 accept: Optional[Callable[[str], bool]] = None,
+                 lookback_days: float = 1.0):
+        self.providers = providers
+        self.analyzer = analyzer
+        self.index = index or TickerNewsIndex()
+        self.queue = queue or ReanalysisQueue()
+        self.accept = accept
+        self.lookback_days = lookback_days
+        self.polls = 0
+
+    async def poll_once(self) -> List[str]:
+        """Fetch every provider's feed once; returns the tickers queued for re-analysis"""
+        feeds = await asyncio.gather(
+            *(provider.get_market_news(self.lookback_days) for provider in self.providers),
+            return_exceptions=True
+        )
+        articles = []
+        for provider, feed in zip(self.providers, feeds):
+            if isinstance(feed, BaseException):
+                logger.error(f"Error polling {type(provider).__name__} market news: {str(feed)}")
+                continue
+            articles.extend(feed)
+
+        gained = self.index.add(articles)
+        self.index.prune()
+        self.polls += 1
+
+        queued = []
+        for ticker in sorted(gained):
+            if self.accept is not None and not self.accept(ticker):
+                continue
+            news_data = self.analyzer.analyze_articles(self.index.articles(ticker))
+            if news_data['has_significant_news'] and self.queue.put(ticker):
+                queued.append(ticker)
+        logger.info(f"News poll {self.polls}: {len(articles)} articles, {len(gained)} tickers "
+                    f"with new articles, {len(queued)} queued for re-analysis")
+        return queued
+
+    def news_for(self, ticker: str) -> Optional[Dict]:
+        """Analysis of a ticker's indexed news, or None if the index has none"""
+        articles = self.index.articles(ticker)
+        return self.analyzer.analyze_articles(articles) if articles else None
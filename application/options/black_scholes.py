@@ -0,0 +1,141 @@
+"""Vectorized Black-Scholes pricing, Greeks and implied volatility.
+
+Every function takes NumPy arrays (or scalars that broadcast) so a whole
+option chain is priced in a handful of array operations.
+"""
+import numpy as np
+
+MIN_VOL = 1e-4
+MAX_VOL = 5.0
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF via a Chebyshev erfc fit (relative error < 1.2e-7, tails included)"""
+    z = np.abs(np.asarray(x, dtype=np.float64)) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.5 * z)
+    tail = 0.5 * t * np.exp(-z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196
+                 + t * (0.09678418 + t * (-0.18628806 + t * (0.27886807 + t * (-1.13520398
+                 + t * (1.48851587 + t * (-0.82215223 + t * 0.17087277)))))))))
+    return np.where(x >= 0, 1.0 - tail, tail)
+
+
+def _d1_d2(spot, strike, t, rate, vol, div_yield):
+    sqrt_t = np.sqrt(t)
+    vol_sqrt_t = vol * sqrt_t
+    d1 = (np.log(spot / strike) + (rate - div_yield + 0.5 * vol * vol) * t) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t, sqrt_t
+
+
+def price(spot, strike, t, rate, vol, is_call, div_yield=0.0) -> np.ndarray:
+    """Black-Scholes price; ``is_call`` is a boolean array"""
+    d1, d2, _ = _d1_d2(spot, strike, t, rate, vol, div_yield)
+    disc_spot = spot * np.exp(-div_yield * t)
+    disc_strike = strike * np.exp(-rate * t)
+    call = disc_spot * norm_cdf(d1) - disc_strike * norm_cdf(d2)
+    put = disc_strike * norm_cdf(-d2) - disc_spot * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def vega(spot, strike, t, rate, vol, div_yield=0.0) -> np.ndarray:
+    """dPrice/dVol (per 1.00 of volatility)"""
+    d1, _, sqrt_t = _d1_d2(spot, strike, t, rate, vol, div_yield)
+    return spot * np.exp(-div_yield * t) * norm_pdf(d1) * sqrt_t
+
+
+def greeks(spot, strike, t, rate, vol, is_call, div_yield=0.0) -> dict:
+    """Delta, gamma, theta (per calendar day), vega and rho (per 1% move)"""
+    d1, d2, sqrt_t = _d1_d2(spot, strike, t, rate, vol, div_yield)
+    q_disc = np.exp(-div_yield * t)
+    r_disc = np.exp(-rate * t)
+    pdf_d1 = norm_pdf(d1)
+    cdf_d1 = norm_cdf(d1)
+    cdf_d2 = norm_cdf(d2)
+
+    delta = np.where(is_call, q_disc * cdf_d1, q_disc * (cdf_d1 - 1.0))
+    gamma = q_disc * pdf_d1 / (spot * vol * sqrt_t)
+    decay = -spot * q_disc * pdf_d1 * vol / (2.0 * sqrt_t)
+    theta_call = (decay - rate * strike * r_disc * cdf_d2
+                  + div_yield * spot * q_disc * cdf_d1)
+    theta_put = (decay + rate * strike * r_disc * (1.0 - cdf_d2)
+                 - div_yield * spot * q_disc * (1.0 - cdf_d1))
+    theta = np.where(is_call, theta_call, theta_put) / 365.0
+    rho = np.where(is_call, strike * t * r_disc * cdf_d2,
+                   -strike * t * r_disc * (1.0 - cdf_d2)) / 100.0
+
+    return {
+        'delta': delta,
+        'gamma': gamma,
+        'theta': theta,
+        'vega': spot * q_disc * pdf_d1 * sqrt_t / 100.0,
+        'rho': rho,
+    }
+
+
+def implied_volatility(market_price, spot, strike, t, rate, is_call,
+                       div_yield=0.0, tol: float = 1e-8, max_iter: int = 100) -> np.ndarray:
+    """Solve for volatility across all contracts at once.
+
+    Newton steps are safeguarded by a bisection bracket per contract (price
+    is increasing in volatility): a step that leaves the bracket, or a
+    vanishing vega, falls back to the bracket midpoint. Contracts priced
+    outside no-arbitrage bounds come back as NaN.
+    """
+    market_price, spot, strike, t, is_call = np.broadcast_arrays(
+        np.asarray(market_price, dtype=np.float64),
+        np.asarray(spot, dtype=np.float64),
+        np.asarray(strike, dtype=np.float64),
+        np.asarray(t, dtype=np.float64),
+        np.asarray(is_call, dtype=bool)
+    )
+    q_disc = np.exp(-div_yield * t)
+    r_disc = np.exp(-rate * t)
+    lower_bound = np.where(is_call,
+                           np.maximum(spot * q_disc - strike * r_disc, 0.0),
+                           np.maximum(strike * r_disc - spot * q_disc, 0.0))
+    upper_bound = np.where(is_call, spot * q_disc, strike * r_disc)
+    valid = ((t > 0) & (market_price > lower_bound) & (market_price < upper_bound)
+             & np.isfinite(market_price))
+
+    # In-the-money prices are mostly intrinsic value and pin down volatility
+    # poorly; solve on the out-of-the-money side via put-call parity instead
+    forward_gap = spot * q_disc - strike * r_disc
+    itm = np.where(is_call, forward_gap > 0, forward_gap < 0)
+    market_price = np.where(itm, market_price - np.where(is_call, forward_gap, -forward_gap),
+                            market_price)
+    is_call = is_call ^ itm
+
+    iv = np.full(market_price.shape, np.nan)
+    if not valid.any():
+        return iv
+
+    target = market_price[valid]
+    s, k, tt, call = spot[valid], strike[valid], t[valid], is_call[valid]
+    lo = np.full(target.shape, MIN_VOL)
+    hi = np.full(target.shape, MAX_VOL)
+    # Brenner-Subrahmanyam starting point, clipped into the bracket
+    vol = np.clip(np.sqrt(2.0 * np.pi / tt) * target / s, 0.05, 2.0)
+    active = np.ones(target.shape, dtype=bool)
+
+    for _ in range(max_iter):
+        diff = price(s, k, tt, rate, vol, call, div_yield) - target
+        converged = (np.abs(diff) <= tol * target) | (hi - lo < 1e-10)
+        active &= ~converged
+        if not active.any():
+            break
+        hi = np.where(active & (diff > 0), vol, hi)
+        lo = np.where(active & (diff < 0), vol, lo)
+
+        v = vega(s, k, tt, rate, vol, div_yield)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            newton = vol - diff / v
+        use_newton = (v > 1e-8) & (newton > lo) & (newton < hi)
+        step = np.where(use_newton, newton, 0.5 * (lo + hi))
+        vol = np.where(active, step, vol)
+
+    iv[valid] = vol
+    return iv
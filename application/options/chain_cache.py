@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from trading_platform.domain.models.instrument import Instrument
+from trading_platform.infrastructure.data_providers.provider_interface import MarketDataProvider
+from ..utils.async_utils import AsyncRateLimiter
+from ..utils.market_hours import is_market_open, market_now, next_market_open
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # requests that joined an in-flight fetch
+    errors: int = 0
+
+
+class OptionsChainCache:
+    """Option chains keyed by (symbol, expiration) with market-hours-aware TTLs.
+
+    During the regular session entries live for ``intraday_ttl`` seconds;
+    outside it quotes cannot move, so entries are kept until the next open.
+    Concurrent requests for the same key share a single provider call, and
+    only cache misses spend the options request budget.
+    """
+
+    def __init__(self,
+                 provider: MarketDataProvider,
+                 rate_limiter: Optional[AsyncRateLimiter] = None,
+                 intraday_ttl: float = 300.0,
+                 max_entries: int = 20_000):
+        self.provider = provider
+        self.rate_limiter = rate_limiter
+        self.intraday_ttl = intraday_ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    def _expires_at(self) -> float:
+        if is_market_open():
+            return time.time() + self.intraday_ttl
+        return time.time() + (next_market_open() - market_now()).total_seconds()
+
+    async def get_expirations(self, instrument: Instrument) -> list[str]:
+        return await self._get(
+            (instrument.symbol, '*'),
+            lambda: self.provider.get_option_expirations(instrument)
+        )
+
+    async def get_chain(self, instrument: Instrument, expiration: str) -> dict:
+        return await self._get(
+            (instrument.symbol, expiration),
+            lambda: self.provider.get_option_chain(instrument, expiration)
+        )
+
+    async def get_chains(self, instrument: Instrument, expirations: list[str]) -> dict[str, Optional[dict]]:
+        """Fetch several expirations in parallel; failed expirations map to None"""
+        chains = await asyncio.gather(
+            *(self.get_chain(instrument, expiration) for expiration in expirations),
+            return_exceptions=True
+        )
+        result = {}
+        for expiration, chain in zip(expirations, chains):
+            # BaseException: a cancelled fetch comes back as a CancelledError
+            if isinstance(chain, BaseException):
+                logger.error(f"Error fetching {expiration} chain for {instrument.symbol}: {str(chain)}")
+                chain = None
+            result[expiration] = chain
+        return result
+
+    def invalidate(self, symbol: Optional[str] = None):
+        if symbol is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[0] == symbol]:
+                del self._entries[key]
+
+    async def _get(self, key: Tuple[str, str], fetch: Callable[[], Awaitable[Any]]):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.time():
+            self.stats.hits += 1
+            return entry[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only our own cancellation propagates; if the fetch we joined was
+                # cancelled with its caller, issue it again ourselves
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self._get(key, fetch)
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.stats.errors += 1
+            future.set_exception(e)
+            # Nobody else may be waiting; don't leave "exception never retrieved" noise
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._store(key, value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def _store(self, key: Tuple[str, str], value: Any):
+        if len(self._entries) >= self.max_entries:
+            now = time.time()
+            for stale in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                del self._entries[stale]
+            if len(self._entries) >= self.max_entries:
+                # Still full: drop the oldest insertions
+                for oldest in list(self._entries)[:len(self._entries) // 10 or 1]:
+                    del self._entries[oldest]
+        self._entries[key] = (self._expires_at(), value)
@@ -0,0 +1,140 @@
+import logging
+from datetime import date, datetime
+import numpy as np
+import pandas as pd
+from trading_platform.domain.models.instrument import Instrument
+from trading_platform.infrastructure.data_providers.provider_interface import MarketDataProvider
+from trading_platform.config import Config
+from ..utils.async_utils import AsyncRateLimiter
+from . import black_scholes as bs
+from .chain_cache import OptionsChainCache
+
+logger = logging.getLogger(__name__)
+
+_CHAIN_COLUMNS = ('strike', 'bid', 'ask', 'lastPrice', 'volume', 'openInterest')
+
+
+class OptionsAnalyzer:
+    """Finds tradable contracts by evaluating whole option chains as arrays.
+
+    All expirations inside the configured DTE window are fetched
+    concurrently through an OptionsChainCache (so repeated analyses reuse
+    chains and only misses spend the options request budget), flattened
+    into columns, filtered with vectorized masks, and only the survivors
+    get an implied volatility solve and Greeks.
+    """
+
+    def __init__(self,
+                 provider: MarketDataProvider,
+                 config: Config,
+                 cache: OptionsChainCache | None = None):
+        self.provider = provider
+        self.config = config
+        self.cache = cache or OptionsChainCache(
+            provider,
+            rate_limiter=AsyncRateLimiter(
+                config.options_requests_per_hour, 3600, burst=config.options_request_burst
+            ),
+            intraday_ttl=config.options_cache_ttl_seconds
+        )
+
+    async def analyze(self, instrument: Instrument, price: float) -> list[dict]:
+        try:
+            expirations = await self.cache.get_expirations(instrument)
+        except Exception as e:
+            logger.error(f"Error fetching option expirations for {instrument.symbol}: {str(e)}")
+            return []
+
+        window = self._expirations_in_window(expirations)
+        if not window:
+            return []
+
+        chains = await self.cache.get_chains(instrument, [expiration for expiration, _ in window])
+        columns = self._to_columns(
+            [(expiration, dte, chains[expiration]) for expiration, dte in window if chains[expiration]]
+        )
+        if columns is None:
+            return []
+        return self.evaluate(columns, float(price))
+
+    def _expirations_in_window(self, expirations: list[str]) -> list[tuple[str, int]]:
+        today = date.today()
+        window = []
+        for expiration in expirations:
+            dte = (datetime.strptime(expiration, '%Y-%m-%d').date() - today).days
+            if self.config.days_to_expiry_min <= dte <= self.config.days_to_expiry_max:
+                window.append((expiration, dte))
+        return window
+
+    def _to_columns(self, chains: list[tuple[str, int, dict]]) -> dict | None:
+        """Flatten calls and puts of every expiration into one set of columns"""
+        frames, is_call, dte, expiry = [], [], [], []
+        for expiration, days, chain in chains:
+            for side, call in (('calls', True), ('puts', False)):
+                df = chain.get(side)
+                if df is None or df.empty:
+                    continue
+                frames.append(df)
+                is_call.append(np.full(len(df), call))
+                dte.append(np.full(len(df), days, dtype=np.float64))
+                expiry.append(np.full(len(df), expiration, dtype=object))
+        if not frames:
+            return None
+
+        chain = pd.concat(frames, ignore_index=True)
+        columns = {
+            name: pd.to_numeric(chain[name], errors='coerce').fillna(0).to_numpy(np.float64)
+            if name in chain else np.zeros(len(chain))
+            for name in _CHAIN_COLUMNS
+        }
+        columns['contract'] = chain['contractSymbol'].to_numpy(object) \
+            if 'contractSymbol' in chain else np.full(len(chain), '', dtype=object)
+        columns['is_call'] = np.concatenate(is_call)
+        columns['dte'] = np.concatenate(dte)
+        columns['expiration'] = np.concatenate(expiry)
+        return columns
+
+    def evaluate(self, columns: dict, spot: float) -> list[dict]:
+        """Apply the Config filters as masks, then price the surviving contracts"""
+        bid, ask = columns['bid'], columns['ask']
+        mid = np.where((bid > 0) & (ask > 0), 0.5 * (bid + ask), columns['lastPrice'])
+
+        mask = (
+            (mid > 0)
+            & (mid <= self.config.max_option_price)
+            & (columns['openInterest'] >= self.config.min_open_interest)
+            & (columns['volume'] >= self.config.min_volume)
+        )
+        if not mask.any():
+            return []
+
+        idx = np.flatnonzero(mask)
+        strike = columns['strike'][idx]
+        is_call = columns['is_call'][idx]
+        t = columns['dte'][idx] / 365.0
+        rate = self.config.risk_free_rate
+
+        iv = bs.implied_volatility(mid[idx], spot, strike, t, rate, is_call)
+        solved = np.isfinite(iv)
+        idx, strike, is_call, t, iv = idx[solved], strike[solved], is_call[solved], t[solved], iv[solved]
+        greeks = bs.greeks(spot, strike, t, rate, iv, is_call)
+
+        # Most liquid contracts first
+        order = np.argsort(-columns['openInterest'][idx], kind='stable')
+        return [
+            {
+                'contract': columns['contract'][idx[i]],
+                'type': 'CALL' if is_call[i] else 'PUT',
+                'expiration': columns['expiration'][idx[i]],
+                'days_to_expiry': int(columns['dte'][idx[i]]),
+                'strike': float(strike[i]),
+                'bid': float(bid[idx[i]]),
+                'ask': float(ask[idx[i]]),
+                'mid': float(mid[idx[i]]),
+                'volume': int(columns['volume'][idx[i]]),
+                'open_interest': int(columns['openInterest'][idx[i]]),
+                'implied_volatility': float(iv[i]),
+                **{name: float(values[i]) for name, values in greeks.items()}
+            }
+            for i in order
+        ]
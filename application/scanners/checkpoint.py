@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Set
+from .funnel import FunnelReport
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = '.jsonl'
+
+
+class CheckpointError(Exception):
+    pass
+
+
+def _dumps(record: Dict) -> str:
+    # Results carry numpy scalars and news timestamps
+    return json.dumps(record, separators=(',', ':'), default=_json_default)
+
+
+def _json_default(value):
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class ScanJournal:
+    """Append-only JSONL journal of one scan, so a restart resumes after the last completed batch.
+
+    Records, one per line, each fsynced:
+
+    - ``start``: scan ID and the parameters that fix the batch layout
+    - ``batch``: a finished batch's top candidates (metrics and scores) and funnel counts
+    - ``enriched``: the final enriched results
+    - ``complete``
+
+    A line cut short by a crash is ignored on reload, so at most the batch
+    in flight is lost.
+    """
+
+    def __init__(self, directory: str, scan_id: str):
+        self.scan_id = scan_id
+        self.path = os.path.join(directory, f"{scan_id}{JOURNAL_SUFFIX}")
+        self.header: Optional[Dict] = None
+        self.batches: Dict[int, Dict] = {}
+        self.enriched: Optional[List[Dict]] = None
+        self.complete = False
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        valid_bytes = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Cut short before its newline; the next append would run into it
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Torn write from a crash; everything after it is untrusted
+                valid_bytes += len(line)
+                kind = record.get('type')
+                if kind == 'start':
+                    self.header = record
+                elif kind == 'batch':
+                    self.batches[record['index']] = record
+                elif kind == 'enriched':
+                    self.enriched = record['results']
+                elif kind == 'complete':
+                    self.complete = True
+        if valid_bytes < os.path.getsize(self.path):
+            logger.warning(f"Dropping a partial record at the end of {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_bytes)
+        logger.info(f"Loaded journal {self.path}: {len(self.batches)} batches done"
+                    f"{', complete' if self.complete else ''}")
+
+    @property
+    def completed_batches(self) -> Set[int]:
+        return set(self.batches)
+
+    def start(self, universe_version: str, num_symbols: int, batch_size: int, top_k: int):
+        """Write the header, or check that a resumed scan is laid out the same way"""
+        params = {'universe_version': universe_version, 'num_symbols': num_symbols,
+                  'batch_size': batch_size, 'top_k': top_k}
+        if self.header is None:
+            self._append({'type': 'start', 'scan_id': self.scan_id, 'started': time.time(), **params})
+            return
+        changed = [key for key, value in params.items() if self.header.get(key) != value]
+        if changed:
+            raise CheckpointError(
+                f"Scan {self.scan_id} was started with different {', '.join(changed)}; "
+                f"use a new scan ID"
+            )
+
+    def record_batch(self, index: int, candidates: List[Dict], funnel: FunnelReport):
+        record = {'type': 'batch', 'index': index, 'candidates': candidates, 'funnel': funnel.to_dict()}
+        self._append(record)
+        self.batches[index] = record
+
+    def record_enriched(self, results: List[Dict]):
+        self._append({'type': 'enriched', 'results': results})
+        self.enriched = results
+
+    def record_complete(self):
+        self._append({'type': 'complete', 'finished': time.time()})
+        self.complete = True
+
+    def _append(self, record: Dict):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(_dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def prune_journals(directory: str, max_age_days: float) -> int:
+    """Delete journals not written to for ``max_age_days``; returns how many"""
+    if not os.path.isdir(directory):
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name.endswith(JOURNAL_SUFFIX) and os.path.getmtime(path) < cutoff:
+            os.remove(path)
+            removed += 1
+    return removed
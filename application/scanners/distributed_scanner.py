@@ -0,0 +1,357 @@
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Dict, List, Optional
+from ..config.config import Config
+from ..universe.universe import Universe
+from .funnel import FunnelReport
+from .ranking import TopK, rank_results
+from ...infrastructure.queue.broker_interface import ScanBroker, ShardResult, ShardTask, WorkerBroker
+
+if TYPE_CHECKING:
+    from ..data.shared_panel import SharedPanelHandle, SharedPanelView
+
+logger = logging.getLogger(__name__)
+
+
+class ScanWorker:
+    """Runs the scan stages for the shards it is handed"""
+
+    def __init__(self,
+                 config: Config,
+                 worker_id: Optional[str] = None,
+                 shared_bars: Optional['SharedPanelHandle'] = None):
+        self.config = config
+        self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self.shared_bars = shared_bars
+        self._scanner = None
+        self._view: Optional['SharedPanelView'] = None
+
+    @property
+    def scanner(self):
+        if self._scanner is None:
+            from .market_scanner import MarketScanner
+            self._scanner = MarketScanner(self.config)
+            if self.shared_bars is not None:
+                from ..data.shared_panel import SharedPanelView
+                self._view = SharedPanelView(self.shared_bars)
+                self._scanner.shared_bars = self._view
+        return self._scanner
+
+    async def run_shard(self, task: ShardTask) -> ShardResult:
+        started = time.monotonic()
+        # The shard's own top K is a superset of its share of the global top K
+        top = TopK(self.config.scoring.top_k)
+        self.scanner.funnel = FunnelReport()
+        try:
+            batch_size = self.config.scanner.batch_size
+            for i in range(0, len(task.symbols), batch_size):
+                await self.scanner.scan_batch(task.symbols[i:i + batch_size], top)
+        except Exception as e:
+            logger.error(f"{self.worker_id} failed shard {task.shard_index}: {str(e)}")
+            return ShardResult(task.scan_id, task.shard_index, task.attempt, self.worker_id,
+                               elapsed=time.monotonic() - started, error=str(e))
+        finally:
+            # Shards rarely repeat on a worker; kept bars would grow towards the whole universe
+            self.scanner.release_bars()
+        return ShardResult(task.scan_id, task.shard_index, task.attempt, self.worker_id,
+                           results=top.items(), elapsed=time.monotonic() - started,
+                           funnel=self.scanner.funnel.to_dict())
+
+    async def serve(self, broker: WorkerBroker):
+        """Consume shard tasks from a broker until cancelled"""
+        logger.info(f"{self.worker_id} waiting for shards")
+        while True:
+            task = await broker.next_task()
+            await broker.publish_started(task, self.worker_id)
+            result = await self.run_shard(task)
+            await broker.publish_result(task, result)
+
+
+class LocalBroker(WorkerBroker):
+    """In-process broker backed by asyncio queues, with in-process workers.
+
+    Stands in for a real message queue when testing the coordinator.
+    """
+
+    def __init__(self, config: Config, num_workers: int = 4):
+        self.config = config
+        self.num_workers = num_workers
+        self.tasks: asyncio.Queue = asyncio.Queue()
+        self.results: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self, scan_id: str):
+        for i in range(self.num_workers):
+            worker = ScanWorker(self.config, worker_id=f"local-{i}")
+            self._workers.append(asyncio.create_task(worker.serve(self)))
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def submit(self, task: ShardTask):
+        await self.tasks.put(task)
+
+    async def next_result(self, timeout: float) -> Optional[ShardResult]:
+        try:
+            return await asyncio.wait_for(self.results.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def next_task(self) -> ShardTask:
+        return await self.tasks.get()
+
+    async def publish_started(self, task: ShardTask, worker_id: str):
+        await self.results.put(ShardResult(task.scan_id, task.shard_index, task.attempt, worker_id, started=True))
+
+    async def publish_result(self, task: ShardTask, result: ShardResult):
+        await self.results.put(result)
+
+
+_process_worker: Optional[ScanWorker] = None
+
+
+def _init_process_worker(config: Config, shared_bars: Optional['SharedPanelHandle']):
+    # One ScanWorker (and MarketScanner) per pool process, reused across shards
+    global _process_worker
+    import os
+    _process_worker = ScanWorker(config, worker_id=f"process-{os.getpid()}", shared_bars=shared_bars)
+
+
+def _run_shard_in_process(task: ShardTask) -> ShardResult:
+    return asyncio.run(_process_worker.run_shard(task))
+
+
+class ProcessPoolBroker(ScanBroker):
+    """Runs shards on a pool of local worker processes.
+
+    With ``shared_bars`` every worker maps the parent's SharedPanel instead
+    of downloading (and holding) its own history. The pool runs tasks in
+    submission order, so a task counts as picked up once a process frees
+    up for it.
+    """
+
+    def __init__(self, config: Config, num_workers: int = 4,
+                 shared_bars: Optional['SharedPanelHandle'] = None):
+        self.config = config
+        self.num_workers = num_workers
+        self.shared_bars = shared_bars
+        self.results: asyncio.Queue = asyncio.Queue()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._futures = set()
+        self._running = 0
+        self._waiting: Deque[ShardTask] = deque()
+
+    async def start(self, scan_id: str):
+        self.executor = ProcessPoolExecutor(max_workers=self.num_workers,
+                                            initializer=_init_process_worker,
+                                            initargs=(self.config, self.shared_bars))
+
+    async def close(self):
+        for future in self._futures:
+            future.cancel()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self._running = 0
+        self._waiting.clear()
+
+    def _started(self, task: ShardTask):
+        self._running += 1
+        self.results.put_nowait(ShardResult(task.scan_id, task.shard_index, task.attempt,
+                                            'process-pool', started=True))
+
+    async def submit(self, task: ShardTask):
+        future = asyncio.get_running_loop().run_in_executor(
+            self.executor, _run_shard_in_process, task
+        )
+        self._futures.add(future)
+        if self._running < self.num_workers:
+            self._started(task)
+        else:
+            self._waiting.append(task)
+
+        def _done(f):
+            self._futures.discard(f)
+            if f.cancelled():
+                return
+            self._running -= 1
+            if self._waiting:
+                self._started(self._waiting.popleft())
+            if f.exception() is not None:
+                result = ShardResult(task.scan_id, task.shard_index, task.attempt,
+                                     'process-pool', error=str(f.exception()))
+            else:
+                result = f.result()
+            self.results.put_nowait(result)
+
+        future.add_done_callback(_done)
+
+    async def next_result(self, timeout: float) -> Optional[ShardResult]:
+        try:
+            return await asyncio.wait_for(self.results.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+@dataclass
+class ScanReport:
+    scan_id: str
+    results: List[Dict]
+    shards: int
+    failed_shards: List[int]
+    retries: int
+    speculative: int
+    elapsed: float
+    shard_times: Dict[int, float]
+    funnel: FunnelReport
+
+
+@dataclass
+class _PendingShard:
+    attempt: int         # Latest attempt submitted
+    submitted: float
+    started: Optional[float] = None   # When a worker picked that attempt up
+    copies: int = 1      # Copies of that attempt not yet reported back
+    duplicated: bool = False
+
+
+class ScanCoordinator:
+    """Partitions the universe into shards, farms them out and merges the results.
+
+    The universe is over-partitioned (``shards_per_worker`` shards per
+    worker) so idle workers keep pulling work. Failed shards are retried
+    up to ``max_retries`` times; shards running longer than
+    ``straggler_factor`` x the median shard time (counted from when a
+    worker picked them up, not from submission) are re-submitted and the
+    first result to arrive wins. Shards still outstanding after
+    ``scan_timeout`` seconds count as failed. Each shard returns its scored
+    top ``top_k``; the coordinator keeps the global top ``top_k`` and passes
+    only those to ``enrich`` (e.g. ``MarketScanner.enrich``).
+    """
+
+    def __init__(self,
+                 broker: ScanBroker,
+                 num_workers: int,
+                 shards_per_worker: int = 4,
+                 max_retries: int = 2,
+                 straggler_factor: float = 3.0,
+                 poll_interval: float = 1.0,
+                 scan_timeout: float = 3600.0,
+                 top_k: int = 25,
+                 enrich: Optional[Callable[[List[Dict]], Awaitable[List[Dict]]]] = None):
+        self.broker = broker
+        self.top_k = top_k
+        self.enrich = enrich
+        self.num_shards = max(1, num_workers * shards_per_worker)
+        self.max_retries = max_retries
+        self.straggler_factor = straggler_factor
+        self.poll_interval = poll_interval
+        self.scan_timeout = scan_timeout
+
+    async def run(self, universe: Universe, scan_id: Optional[str] = None) -> ScanReport:
+        scan_id = scan_id or uuid.uuid4().hex
+        started = time.monotonic()
+        shards = {i: symbols for i, symbols in enumerate(universe.shards(self.num_shards)) if symbols}
+
+        pending: Dict[int, _PendingShard] = {}
+        top = TopK(self.top_k)
+        shard_times: Dict[int, float] = {}
+        failed: List[int] = []
+        funnel = FunnelReport()
+        retries = speculative = 0
+
+        await self.broker.start(scan_id)
+        try:
+            for index, symbols in shards.items():
+                await self.broker.submit(ShardTask(scan_id, index, symbols))
+                pending[index] = _PendingShard(0, time.monotonic())
+            logger.info(f"Scan {scan_id}: {len(shards)} shards over {len(universe)} symbols")
+
+            while pending:
+                if time.monotonic() - started > self.scan_timeout:
+                    logger.error(f"Scan {scan_id} timed out after {self.scan_timeout:.0f}s; "
+                                 f"giving up on shards {sorted(pending)}")
+                    failed.extend(pending)
+                    break
+                result = await self.broker.next_result(self.poll_interval)
+                if result is not None and result.scan_id == scan_id and result.shard_index in pending:
+                    shard = pending[result.shard_index]
+                    if result.started:
+                        if result.attempt == shard.attempt and shard.started is None:
+                            shard.started = time.monotonic()
+                    elif result.error is None:
+                        del pending[result.shard_index]
+                        top.extend(result.results)
+                        funnel.merge(FunnelReport.from_dict(result.funnel))
+                        shard_times[result.shard_index] = result.elapsed
+                        logger.info(
+                            f"Shard {result.shard_index} done by {result.worker_id} "
+                            f"in {result.elapsed:.1f}s ({len(pending)} remaining)"
+                        )
+                    elif result.attempt == shard.attempt:
+                        shard.copies -= 1
+                        if shard.copies > 0:
+                            # The other copy of this attempt may still succeed
+                            logger.warning(f"Shard {result.shard_index} failed on {result.worker_id} "
+                                           f"({result.error}); waiting on its other copy")
+                        elif shard.attempt < self.max_retries:
+                            retries += 1
+                            logger.warning(
+                                f"Shard {result.shard_index} failed on {result.worker_id} "
+                                f"({result.error}); retrying"
+                            )
+                            await self.broker.submit(
+                                ShardTask(scan_id, result.shard_index, shards[result.shard_index], shard.attempt + 1)
+                            )
+                            pending[result.shard_index] = _PendingShard(shard.attempt + 1, time.monotonic())
+                        else:
+                            logger.error(f"Shard {result.shard_index} failed permanently: {result.error}")
+                            del pending[result.shard_index]
+                            failed.append(result.shard_index)
+
+                speculative += await self._rebalance_stragglers(scan_id, shards, pending, shard_times)
+        finally:
+            await self.broker.close()
+
+        results = top.items()
+        if self.enrich is not None:
+            results = await self.enrich(results)
+
+        return ScanReport(
+            scan_id=scan_id,
+            results=rank_results(results),
+            shards=len(shards),
+            failed_shards=sorted(failed),
+            retries=retries,
+            speculative=speculative,
+            elapsed=time.monotonic() - started,
+            shard_times=shard_times,
+            funnel=funnel
+        )
+
+    async def _rebalance_stragglers(self, scan_id: str, shards: Dict[int, List[str]],
+                                    pending: Dict[int, _PendingShard],
+                                    shard_times: Dict[int, float]) -> int:
+        # Need a few completed shards before "slow" means anything
+        if len(shard_times) < max(3, len(shards) // 4):
+            return 0
+        threshold = self.straggler_factor * statistics.median(shard_times.values())
+        now = time.monotonic()
+        resubmitted = 0
+        for index, shard in pending.items():
+            if not shard.duplicated and shard.started is not None and now - shard.started > threshold:
+                logger.info(f"Shard {index} is straggling ({now - shard.started:.1f}s); re-submitting")
+                await self.broker.submit(ShardTask(scan_id, index, shards[index], shard.attempt))
+                shard.copies += 1
+                shard.duplicated = True
+                resubmitted += 1
+        return resubmitted
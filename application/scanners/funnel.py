@@ -0,0 +1,76 @@
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
+
+# Tier 0: bulk latest-quote snapshot of the whole batch (price, volume)
+# Tier 1: short history for tier 0 survivors (volatility)
+# Tier 2: full history, detailed analysis and scoring for tier 1 survivors
+# Enrichment: metadata and news for the top-K candidates only
+TIERS = ('snapshot', 'short_history', 'detailed', 'enrichment')
+
+
+@dataclass
+class TierStats:
+    name: str
+    symbols_in: int = 0
+    symbols_out: int = 0
+    requests: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        return self.symbols_out / self.symbols_in if self.symbols_in else 0.0
+
+
+@dataclass
+class FunnelReport:
+    """How many symbols survive each scan tier, and what each tier cost"""
+    tiers: Dict[str, TierStats] = field(
+        default_factory=lambda: {name: TierStats(name) for name in TIERS}
+    )
+    # Filter expression -> symbols it eliminated
+    eliminated: Dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def timed(self, tier: str):
+        started = time.monotonic()
+        try:
+            yield self.tiers[tier]
+        finally:
+            self.tiers[tier].elapsed += time.monotonic() - started
+
+    def merge(self, other: 'FunnelReport'):
+        for name, stats in other.tiers.items():
+            mine = self.tiers.setdefault(name, TierStats(name))
+            mine.symbols_in += stats.symbols_in
+            mine.symbols_out += stats.symbols_out
+            mine.requests += stats.requests
+            mine.elapsed += stats.elapsed
+        self.count_eliminated(other.eliminated)
+
+    def count_eliminated(self, eliminated: Dict[str, int]):
+        for expression, count in eliminated.items():
+            self.eliminated[expression] = self.eliminated.get(expression, 0) + count
+
+    def to_dict(self) -> Dict:
+        return {
+            'tiers': {name: asdict(stats) for name, stats in self.tiers.items()},
+            'eliminated': dict(self.eliminated),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FunnelReport':
+        report = cls(tiers={name: TierStats(**stats) for name, stats in data.get('tiers', {}).items()})
+        report.eliminated = dict(data.get('eliminated', {}))
+        return report
+
+    def summary(self) -> List[str]:
+        return [
+            f"{s.name}: {s.symbols_in} -> {s.symbols_out} "
+            f"({s.pass_rate:.0%}), {s.requests} requests, {s.elapsed:.1f}s"
+            for s in self.tiers.values()
+        ] + [
+            f"  {expression}: eliminated {count}"
+            for expression, count in sorted(self.eliminated.items(), key=lambda item: -item[1])
+        ]
@@ -1,263 +1,562 @@
-from typing import List, Dict, Set
-import logging
+from typing import List, Dict, Optional
+import copy
 import asyncio
-import yfinance as yf
+import uuid
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from colorama import init, Fore, Style
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from ..config.config import Config
-from ...infrastructure.apis.news_providers.alpha_vantage import AlphaVantageNews
-from ...infrastructure.apis.news_providers.finnhub import FinnHubNews
+from ..data.corporate_actions import CorporateAction, CorporateActions, split_actions
+from ..filters.cross_section import CrossSection
+from ..filters.filter_compiler import FilterSet
+from ...domain.events.market_event import MarketEvent
+from ...domain.models.instrument import Instrument
+from ...infrastructure.monitoring.log_pipeline import ScanLogger
+from ...infrastructure.storage.fundamentals_store import CompanyFundamentals, FundamentalsStore
+from ..indicators.feature_store import FeatureStore
+from ..indicators.indicator_interface import feature
 from ..news.news_analyzer import NewsAnalyzer
+from ..news.news_index import NewsIngestor, TickerNewsIndex
+from ..utils.async_utils import RetryPolicy, deadline, retry_report
+from ..universe.universe import INDICES, Universe, UniverseLoader
+from .checkpoint import ScanJournal, prune_journals
+from .funnel import FunnelReport
+from .ranking import TopK, final_score, rank_results, technical_score
 
-# Initialize colorama
-init()
-
-class ColoredLogger:
-    def __init__(self, name):
-        self.logger = logging.getLogger(name)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter(
-                '%(asctime)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            ))
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
-
-    def info(self, msg):
-        self.logger.info(f"{Fore.GREEN}{msg}{Style.RESET_ALL}")
-
-    def warning(self, msg):
-        self.logger.warning(f"{Fore.YELLOW}{msg}{Style.RESET_ALL}")
+SNAPSHOT_DAYS = 7             # Calendar days; enough to find the latest session's bar
+SHORT_HISTORY_DAYS = 31       # Volatility screen
+HISTORY_DAYS = 90             # Calendar days, ~60 sessions for detailed analysis
 
-    def error(self, msg):
-        self.logger.error(f"{Fore.RED}{msg}{Style.RESET_ALL}")
-
-    def success(self, msg):
-        self.logger.info(f"{Fore.CYAN}{msg}{Style.RESET_ALL}")
+RSI_14 = feature('rsi', period=14)
 
 class MarketScanner:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, bar_provider=None, event_bus=None):
         self.config = config
-        self.logger = ColoredLogger(__name__)
-        self.filters = self._initialize_filters()
+        # MarketDataProvider for bulk daily bars; built from config.data on first use if not given
+        self.bar_provider = bar_provider
+        # Refreshed bars are published on it as MarketEvents (e.g. for an EventLog)
+        self.event_bus = event_bus
+        self.last_scan_id: Optional[str] = None
+        self.logger = ScanLogger(__name__)
+        self.filters = self._compile_filters()
+        self.universe_loader = UniverseLoader()
+        self.funnel = FunnelReport()
+        self.features = FeatureStore()
+        self.universe: Optional[Universe] = None
+        # Daily bars kept between scans (HISTORY_DAYS deep) so a long-running
+        # scanner only downloads bars newer than the ones it already has
+        self.bars: Dict[str, pd.DataFrame] = {}
+        self._covered_from: Dict[str, date] = {}
+        # Splits and dividends seen in downloads; cached bars are rescaled for new ones
+        self.corporate_actions = CorporateActions(feature_store=self.features)
+        self.last_results: List[Dict] = []
+        self._technical_results: Dict[str, Dict] = {}
+        # Read-only SharedPanelView of bars published by a parent process
+        self.shared_bars = None
+        self.fundamentals = FundamentalsStore(
+            config.fundamentals.path,
+            max_age_hours=config.fundamentals.max_age_hours,
+            refresh_concurrency=config.fundamentals.refresh_concurrency
+        )
         
-        # Initialize news providers
+        # Initialize news providers (imported only when configured: they pull in aiohttp)
         self.news_providers = []
+        retry_policy = RetryPolicy(base_delay=1.0, call_timeout=config.news.request_timeout)
         if config.news.alpha_vantage_key:
+            from ...infrastructure.apis.news_providers.alpha_vantage import AlphaVantageNews
             self.news_providers.append(
-                AlphaVantageNews(config.news.alpha_vantage_key)
+                AlphaVantageNews(config.news.alpha_vantage_key, retry_policy)
             )
         if config.news.finnhub_key:
+            from ...infrastructure.apis.news_providers.finnhub import FinnHubNews
             self.news_providers.append(
-                FinnHubNews(config.news.finnhub_key)
+                FinnHubNews(config.news.finnhub_key, retry_policy)
             )
         
         # Initialize news analyzer
         self.news_analyzer = NewsAnalyzer(config, self.news_providers)
+        # Market-wide feeds, indexed by ticker, to re-analyze just the names in the news
+        self.news_ingestor: Optional[NewsIngestor] = None
+        if self.news_providers:
+            self.news_ingestor = NewsIngestor(
+                self.news_providers, self.news_analyzer,
+                index=TickerNewsIndex(max_age_days=config.news.days_to_analyze),
+                accept=lambda symbol: self.universe is not None and symbol in self.universe
+            )
         
-    def _initialize_filters(self) -> Dict:
-        """Initialize filtering criteria"""
+    def _compile_filters(self) -> Dict[str, FilterSet]:
+        """Compile the configured filter expressions, one FilterSet per scan tier"""
+        scanner_config = self.config.scanner
         return {
-            'volume': {
-                'min': 1_000_000,        # Minimum daily volume
-                'surge_factor': 1.5      # Recent volume vs average
-            },
-            'price': {
-                'min': 5.0,              # Minimum price
-                'max': 1000.0            # Maximum price
-            },
-            'volatility': {
-                'min': 0.15,             # Minimum annualized volatility
-                'max': 0.50              # Maximum annualized volatility
-            },
-            'momentum': {
-                'lookback_days': 5,      # Days to look back
-                'min_return': 0.02       # Minimum return over period
-            },
-            'technical': {
-                'sma_periods': [20, 50], # Moving averages to check
-                'rsi_period': 14,        # RSI period
-                'rsi_thresholds': {      # RSI thresholds
-                    'oversold': 30,
-                    'overbought': 70
-                }
-            }
+            tier: FilterSet(expressions, scanner_config, adaptive=scanner_config.adaptive_filters)
+            for tier, expressions in scanner_config.filters.items()
         }
 
-    async def get_tradable_universe(self) -> Set[str]:
-        """Get list of tradable stocks from various sources"""
-        self.logger.info("Fetching tradable universe...")
-        tradable_stocks = set()
+    def reload_filters(self):
+        """Pick up edited filter expressions; threshold changes apply without this"""
+        self.filters = self._compile_filters()
+
+    async def get_tradable_universe(self) -> Universe:
+        """Load the tradable universe from the local constituent snapshot"""
+        self.logger.info("Loading tradable universe...")
+        scanner_config = self.config.scanner
+        universe = self.universe_loader.load(
+            scanner_config.universe_version, scanner_config.universe_indices
+        )
         
-        indices = {
-            '^GSPC': 'S&P 500',
-            '^NDX': 'NASDAQ 100',
-            '^RUT': 'Russell 2000'
-        }
+        for code, index_name in INDICES.items():
+            members = universe.members(code)
+            if members:
+                self.logger.info("%s: %d stocks", index_name, len(members))
         
-        for index_symbol, index_name in indices.items():
-            try:
-                self.logger.info(f"Fetching {index_name} components...")
-                index = yf.Ticker(index_symbol)
-                components = self._mock_get_index_components(index_name)
-                tradable_stocks.update(components)
-                self.logger.success(f"Added {len(components)} stocks from {index_name}")
-            except Exception as e:
-                self.logger.error(f"Error fetching {index_name} components: {str(e)}")
+        if scanner_config.symbols:
+            universe = universe.subset(scanner_config.symbols)
+        
+        # Names and sectors from the snapshot until the store has fetched real metadata
+        self.fundamentals.seed(
+            CompanyFundamentals(info.symbol, company_name=info.name, sector=info.sector)
+            for info in universe.infos
+        )
+        self.logger.success("Found %d total tradable stocks (universe %s)",
+                            len(universe), universe.version)
         
-        self.logger.success(f"Found {len(tradable_stocks)} total tradable stocks")
-        return tradable_stocks
-
-    def _mock_get_index_components(self, index_name: str) -> Set[str]:
-        """Mock function to return index components - replace with real data source"""
-        if index_name == 'S&P 500':
-            return {'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META'}  # Example stocks
-        return set()
-
-    async def scan_market(self) -> List[Dict]:
-        """Main scanning function that finds promising stocks"""
-        self.logger.info("Starting market scan...")
-        promising_stocks = []
-        tradable_universe = await self.get_tradable_universe()
+        # Forget bars of symbols that left the universe
+        for symbol in set(self.bars) - set(universe.symbols):
+            del self.bars[symbol]
+            self._covered_from.pop(symbol, None)
+            self.corporate_actions.forget(symbol)
+        self.universe = universe
+        return universe
+
+    def start_fundamentals_refresh(self):
+        """Keep fundamentals of the current universe fresh in the background (idempotent)"""
+        self.fundamentals.start(
+            lambda: self.universe.symbols if self.universe is not None else (),
+            interval_minutes=self.config.fundamentals.refresh_interval_minutes
+        )
+
+    async def scan_market(self, scan_id: Optional[str] = None) -> List[Dict]:
+        """Main scanning function that finds promising stocks.
+
+        Candidates from every batch go through one bounded top-K selector;
+        only the survivors are enriched with metadata and news. With
+        ``ScannerConfig.checkpoint_dir`` set, each finished batch is
+        journaled and re-running with the same ``scan_id`` resumes after
+        the last completed batch.
+        """
+        scan_id = scan_id or uuid.uuid4().hex
+        self.last_scan_id = scan_id
+        self.logger.info("Starting market scan %s...", scan_id)
+        self.funnel = FunnelReport()
+        self._technical_results = {}
+        tradable_universe = self.universe or await self.get_tradable_universe()
+        self.start_fundamentals_refresh()
+        top_k = self.config.scoring.top_k
+        top = TopK(top_k)
         
         # Process stocks in batches
-        batch_size = 100
-        total_batches = (len(tradable_universe) + batch_size - 1) // batch_size
+        batch_size = self.config.scanner.batch_size
+        total_batches = tradable_universe.num_batches(batch_size)
+        journal = self._open_journal(scan_id, tradable_universe, batch_size)
         
-        for batch_num, i in enumerate(range(0, len(tradable_universe), batch_size), 1):
-            batch = list(tradable_universe)[i:i+batch_size]
-            self.logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} stocks)")
-            
-            # Get initial metrics
-            metrics = await self._get_batch_metrics(batch)
-            
-            # Apply initial filters
-            filtered_batch = []
-            for symbol, metric in metrics.items():
-                if self._passes_initial_filters(metric):
-                    filtered_batch.append(symbol)
-            
-            if filtered_batch:
-                self.logger.success(f"Found {len(filtered_batch)} stocks passing initial filters")
-                
-                # Detailed analysis of remaining stocks
-                for symbol in filtered_batch:
-                    try:
-                        if await self._detailed_analysis(symbol):
-                            stock_data = await self._gather_stock_data(symbol)
-                            # Add news analysis
-                            stock_data = await self._analyze_with_news(symbol, stock_data)
-                            promising_stocks.append(stock_data)
-                            self.logger.success(f"Added promising stock: {symbol}")
-                    except Exception as e:
-                        self.logger.error(f"Error analyzing {symbol}: {str(e)}")
-            
+        if journal is not None and journal.enriched is not None:
+            self.logger.info("Scan %s already enriched; reusing journaled results", scan_id)
+            for batch in journal.batches.values():
+                self.funnel.merge(FunnelReport.from_dict(batch['funnel']))
+            return self._resume_results(journal.enriched)
+        
+        candidates = 0
+        for batch_num, batch in enumerate(tradable_universe.batches(batch_size), 1):
+            if journal is not None and batch_num in journal.batches:
+                record = journal.batches[batch_num]
+                top.extend(record['candidates'])
+                self.funnel.merge(FunnelReport.from_dict(record['funnel']))
+                continue
+            self.logger.info("Processing batch %d/%d (%d stocks)", batch_num, total_batches, len(batch))
+            # A batch's own top K is all it can contribute to the global one
+            batch_top = TopK(top_k)
+            scan_funnel, self.funnel = self.funnel, FunnelReport()
+            try:
+                candidates += await self.scan_batch(batch, batch_top)
+                if journal is not None:
+                    journal.record_batch(batch_num, batch_top.items(), self.funnel)
+            finally:
+                scan_funnel.merge(self.funnel)
+                self.funnel = scan_funnel
+            top.extend(batch_top.items())
             await asyncio.sleep(1)  # Rate limiting
         
-        self.logger.success(f"Scan complete. Found {len(promising_stocks)} promising stocks")
+        promising_stocks = await self.enrich(top.items())
+        if journal is not None:
+            journal.record_enriched(promising_stocks)
+            journal.record_complete()
+        self.logger.success("Scan complete. Kept %d of %d new candidates", len(promising_stocks), candidates)
+        for line in self.funnel.summary():
+            self.logger.info("Funnel %s", line)
+        for backend, report in retry_report().items():
+            self.logger.info("Retries %s: %s", backend, report)
+        self.last_results = promising_stocks
         return promising_stocks
 
-    async def _get_batch_metrics(self, symbols: List[str]) -> Dict:
-        """Get basic metrics for a batch of symbols"""
-        metrics = {}
-        for symbol in symbols:
-            try:
-                stock = yf.Ticker(symbol)
-                hist = stock.history(period="60d")
-                if len(hist) > 0:
-                    metrics[symbol] = {
-                        'price': hist['Close'][-1],
-                        'volume': hist['Volume'][-1],
-                        'avg_volume': hist['Volume'].mean(),
-                        'volatility': hist['Close'].pct_change().std() * np.sqrt(252)
-                    }
-            except Exception as e:
-                self.logger.error(f"Error fetching metrics for {symbol}: {str(e)}")
-        return metrics
-
-    def _passes_initial_filters(self, metrics: Dict) -> bool:
-        """Apply basic filters to quickly eliminate unsuitable stocks"""
-        filters = self.filters
-        
-        # Price filter
-        if not (filters['price']['min'] <= metrics['price'] <= filters['price']['max']):
-            return False
-            
-        # Volume filter
-        if metrics['volume'] < filters['volume']['min']:
-            return False
-            
-        # Volatility filter
-        if not (filters['volatility']['min'] <= metrics['volatility'] <= filters['volatility']['max']):
-            return False
-            
-        return True
+    def _open_journal(self, scan_id: str, universe: Universe, batch_size: int) -> Optional[ScanJournal]:
+        directory = self.config.scanner.checkpoint_dir
+        if not directory:
+            return None
+        prune_journals(directory, self.config.scanner.checkpoint_retention_days)
+        journal = ScanJournal(directory, scan_id)
+        journal.start(universe.version, len(universe), batch_size, self.config.scoring.top_k)
+        if journal.batches:
+            self.logger.info("Resuming scan %s: %d of %d batches already done", scan_id,
+                             len(journal.batches), universe.num_batches(batch_size))
+        return journal
+
+    def _resume_results(self, results: List[Dict]) -> List[Dict]:
+        """Adopt journaled results, rebuilding what refresh_news needs"""
+        for result in results:
+            candidate = {key: value for key, value in result.items() if key != 'news_data'}
+            self._technical_results[result['symbol']] = self._describe(candidate)
+        self.last_results = results
+        return results
+
+    async def enrich(self, candidates: List[Dict], news: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """Add metadata, reasons and news to scored candidates; returns them re-ranked.
+
+        ``news`` maps symbols to already-analyzed news, which saves the provider calls.
+        News requests share ``NewsConfig.scan_budget_seconds``; once it is
+        spent the remaining candidates are reported without news.
+        """
+        news = news or {}
+        enriched = []
+        with self.funnel.timed('enrichment') as tier, deadline(self.config.news.scan_budget_seconds):
+            tier.symbols_in += len(candidates)
+            for candidate in candidates:
+                symbol = candidate['symbol']
+                try:
+                    stock_data = self._describe(candidate)
+                    self._technical_results[symbol] = copy.deepcopy(stock_data)
+                    stock_data = await self._analyze_with_news(symbol, stock_data, news.get(symbol))
+                    if symbol not in news:
+                        tier.requests += len(self.news_providers)
+                    enriched.append(stock_data)
+                    self.logger.success("Added promising stock: %s", symbol, symbol=symbol)
+                except Exception as e:
+                    self.logger.error("Error enriching %s: %s", symbol, e, symbol=symbol)
+            tier.symbols_out += len(enriched)
+        return rank_results(enriched)
 
-    async def _detailed_analysis(self, symbol: str) -> bool:
-        """Perform deeper analysis on stocks that passed initial filters"""
+    async def refresh_news(self) -> List[Dict]:
+        """Re-run news analysis for the last scan's results without rescanning"""
+        refreshed = []
+        with deadline(self.config.news.scan_budget_seconds):
+            for result in self.last_results:
+                symbol = result['symbol']
+                technical = self._technical_results.get(symbol)
+                if technical is None:
+                    refreshed.append(result)
+                    continue
+                try:
+                    refreshed.append(await self._analyze_with_news(symbol, copy.deepcopy(technical)))
+                except Exception as e:
+                    self.logger.error("Error refreshing news for %s: %s", symbol, e, symbol=symbol)
+                    refreshed.append(result)
+        self.last_results = rank_results(refreshed)
+        return self.last_results
+
+    async def ingest_news(self) -> List[Dict]:
+        """Poll market-wide news and re-analyze the tickers it makes significant.
+
+        Returns the updated results, or an empty list if nothing was re-analyzed.
+        """
+        if self.news_ingestor is None:
+            return []
+        await self.news_ingestor.poll_once()
+        symbols = self.news_ingestor.queue.drain()
+        if not symbols:
+            return []
+        return await self.reanalyze(symbols)
+
+    async def reanalyze(self, symbols: List[str]) -> List[Dict]:
+        """Run a few symbols through every tier's filters and merge them into the last results.
+
+        Uses cached bars plus an incremental refresh, and indexed news where
+        the ingestor has it, so the cost depends on ``len(symbols)``, not
+        on the universe.
+        """
+        self.logger.info("Re-analyzing %d symbols on news: %s", len(symbols), ", ".join(symbols))
+        scan_funnel, self.funnel = self.funnel, FunnelReport()
         try:
-            stock = yf.Ticker(symbol)
-            hist = stock.history(period="60d")
+            await self._refresh_bars(symbols)
+            await self._ensure_history(symbols, HISTORY_DAYS)
+            windows = {symbol: self._window(symbol, HISTORY_DAYS) for symbol in symbols if symbol in self.bars}
+            passing = list(windows)
+            for tier in ('snapshot', 'short_history', 'detailed'):
+                passing = self._apply_filters(tier, {symbol: windows[symbol] for symbol in passing})
             
-            if len(hist) < 60:
-                return False
-                
-            # Calculate technical indicators
-            sma_20 = hist['Close'].rolling(window=20).mean()
-            sma_50 = hist['Close'].rolling(window=50).mean()
-            rsi = self._calculate_rsi(hist['Close'])
-            
-            conditions = [
-                hist['Volume'][-5:].mean() > hist['Volume'].mean() * self.filters['volume']['surge_factor'],
-                hist['Close'][-1] > sma_20[-1],  # Price above 20-day MA
-                sma_20[-1] > sma_50[-1],         # 20-day MA above 50-day MA
-                30 <= rsi[-1] <= 70,             # RSI not extreme
-                self._calculate_momentum(hist) > self.filters['momentum']['min_return']
-            ]
+            candidates = []
+            for symbol in passing:
+                try:
+                    candidates.append(self._score_candidate(symbol, windows[symbol]))
+                except Exception as e:
+                    self.logger.error("Error scoring %s: %s", symbol, e, symbol=symbol)
+            news = {}
+            if self.news_ingestor is not None:
+                for symbol in passing:
+                    news_data = self.news_ingestor.news_for(symbol)
+                    if news_data is not None:
+                        news[symbol] = news_data
+            enriched = await self.enrich(candidates, news)
+        finally:
+            self.funnel = scan_funnel
+        
+        # Symbols that no longer pass drop out of the results
+        reanalyzed = set(symbols)
+        top = TopK(self.config.scoring.top_k)
+        top.extend(result for result in self.last_results if result['symbol'] not in reanalyzed)
+        top.extend(enriched)
+        self.last_results = top.items()
+        return self.last_results
+
+    async def scan_batch(self, batch: List[str], top: TopK) -> int:
+        """Run the scan funnel for one batch of symbols, offering scored candidates to ``top``.
+
+        Each tier only fetches data for the previous tier's survivors, and
+        bars are kept between tiers and between scans, so a tier only
+        downloads history that is not already cached. Returns the number of
+        candidates found.
+        """
+        
+        # Tier 0: price and volume from one bulk quote snapshot
+        with self.funnel.timed('snapshot') as tier:
+            tier.symbols_in += len(batch)
+            snapshot = await self._refresh_bars(batch)
+            tier.requests += 1
+            survivors = self._apply_filters('snapshot', snapshot)
+            tier.symbols_out += len(survivors)
+        
+        if not survivors:
+            return 0
+        
+        # Tier 1: volatility from a short history of the survivors
+        with self.funnel.timed('short_history') as tier:
+            tier.symbols_in += len(survivors)
+            tier.requests += await self._ensure_history(survivors, SHORT_HISTORY_DAYS)
+            survivors = self._apply_filters('short_history', {
+                symbol: self._window(symbol, SHORT_HISTORY_DAYS)
+                for symbol in survivors if symbol in self.bars
+            })
+            tier.symbols_out += len(survivors)
+        
+        if not survivors:
+            return 0
+        
+        self.logger.success("Found %d stocks passing initial filters", len(survivors))
+        
+        # Tier 2: full history, detailed analysis and scoring
+        with self.funnel.timed('detailed') as tier:
+            tier.symbols_in += len(survivors)
+            tier.requests += await self._ensure_history(survivors, HISTORY_DAYS)
+            windows = {symbol: self._window(symbol, HISTORY_DAYS) for symbol in survivors}
             
-            return all(conditions)
+            candidates = 0
+            for symbol in self._apply_filters('detailed', windows):
+                try:
+                    candidate = self._score_candidate(symbol, windows[symbol])
+                except Exception as e:
+                    self.logger.error("Error scoring %s: %s", symbol, e, symbol=symbol)
+                    continue
+                top.push(candidate['score'], symbol, candidate)
+                candidates += 1
             
+            tier.symbols_out += candidates
+        
+        return candidates
+
+    async def download_history(self, symbols: List[str], days: int = HISTORY_DAYS) -> Dict[str, pd.DataFrame]:
+        """Daily bars for ``days`` calendar days, one bulk request per batch"""
+        start = date.today() - timedelta(days=days)
+        bars = {}
+        batch_size = self.config.scanner.batch_size
+        for i in range(0, len(symbols), batch_size):
+            bars.update(await self._download_bars(symbols[i:i + batch_size], start=start))
+        return bars
+
+    def release_bars(self):
+        """Drop cached bars (a worker backed by shared bars can re-read them for free)"""
+        self.bars.clear()
+        self._covered_from.clear()
+
+    async def _refresh_bars(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Bring cached bars up to date; when every symbol is cached only newer bars are fetched"""
+        if self.shared_bars is not None:
+            self._seed_from_shared(symbols)
+        if all(symbol in self.bars for symbol in symbols):
+            # Refetch the last stored session too: it may have been partial
+            since = min(self.bars[symbol].index[-1] for symbol in symbols).date()
+            fresh = await self._download_bars(symbols, start=since)
+        else:
+            fresh = await self._download_bars(symbols, start=date.today() - timedelta(days=SNAPSHOT_DAYS))
+        
+        for symbol, hist in fresh.items():
+            self._merge_bars(symbol, hist, covered_from=hist.index[0].date())
+        if self.event_bus is not None:
+            await self._publish_bars(fresh)
+        return {symbol: self.bars[symbol] for symbol in symbols if symbol in self.bars}
+
+    async def _ensure_history(self, symbols: List[str], days: int) -> int:
+        """Download older bars for symbols whose cache doesn't reach back ``days``; returns requests made"""
+        start = date.today() - timedelta(days=days)
+        missing = [
+            symbol for symbol in symbols
+            if self._covered_from.get(symbol, date.today()) > start
+        ]
+        if not missing:
+            return 0
+        
+        end = max(self._covered_from.get(symbol, date.today()) for symbol in missing) + timedelta(days=1)
+        older = await self._download_bars(missing, start=start, end=end)
+        for symbol in missing:
+            if symbol in older:
+                self._merge_bars(symbol, older[symbol], covered_from=start, prefer_existing=True)
+        return 1
+
+    def _seed_from_shared(self, symbols: List[str]):
+        """Start uncached symbols from the shared panel rather than downloading their history.
+
+        Each symbol is copied into a float64 frame; release_bars drops them again.
+        """
+        panel = self.shared_bars.panel
+        # The requested start, not the first trading day, or _ensure_history would refetch
+        covered_from = self.shared_bars.handle.start or pd.Timestamp(panel.dates[0]).date()
+        for symbol in symbols:
+            if symbol not in self.bars and symbol in panel.symbols:
+                hist = panel.to_frame(symbol)
+                if len(hist):
+                    self._merge_bars(symbol, hist, covered_from=covered_from)
+
+    def _merge_bars(self, symbol: str, hist: pd.DataFrame, covered_from: date, prefer_existing: bool = False):
+        cached = self.bars.get(symbol)
+        if cached is not None:
+            # Shared panels are tz-naive; downloads may not be
+            if cached.index.tz is None and hist.index.tz is not None:
+                hist = hist.tz_localize(None)
+            elif cached.index.tz is not None and hist.index.tz is None:
+                hist = hist.tz_localize(cached.index.tz)
+            frames = [hist, cached] if prefer_existing else [cached, hist]
+            hist = pd.concat(frames)
+            hist = hist[~hist.index.duplicated(keep='last')].sort_index()
+            covered_from = min(covered_from, self._covered_from[symbol])
+        
+        # Keep HISTORY_DAYS of bars; anything older is never read
+        cutoff = date.today() - timedelta(days=HISTORY_DAYS)
+        if covered_from < cutoff:
+            hist = hist[hist.index >= self._index_time(cutoff, hist.index)]
+            covered_from = cutoff
+        self.bars[symbol] = hist
+        self._covered_from[symbol] = covered_from
+
+    def _window(self, symbol: str, days: int) -> pd.DataFrame:
+        hist = self.bars[symbol]
+        return hist[hist.index >= self._index_time(date.today() - timedelta(days=days), hist.index)]
+
+    @staticmethod
+    def _index_time(day: date, index: pd.DatetimeIndex) -> pd.Timestamp:
+        ts = pd.Timestamp(day)
+        return ts.tz_localize(index.tz) if index.tz is not None else ts
+
+    async def _publish_bars(self, fresh: Dict[str, pd.DataFrame]):
+        now = datetime.now()
+        for symbol, hist in fresh.items():
+            await self.event_bus.publish(MarketEvent(
+                instrument=Instrument(symbol),
+                price=Decimal(str(hist['Close'].iloc[-1])),
+                timestamp=now,
+                event_type="BARS_REFRESHED",
+                # A copy: the cached frame may be rescaled before a subscriber reads it
+                data=hist.copy()
+            ))
+
+    def get_bar_provider(self):
+        """The MarketDataProvider bars are downloaded from (built from ``config.data`` unless given)"""
+        if self.bar_provider is None:
+            # Imported here: the providers pull in yfinance's dependencies
+            from ...config import Config as ProviderConfig, RequestTracker
+            from ...infrastructure.data_providers.composite_provider import build_market_data_provider
+            self.bar_provider = build_market_data_provider(ProviderConfig(), RequestTracker(), self.config.data)
+        return self.bar_provider
+
+    async def _download_bars(self, symbols: List[str], start: date, end: Optional[date] = None) -> Dict[str, pd.DataFrame]:
+        """Fetch daily bars for many symbols in a single bulk request to the bar provider"""
+        try:
+            frames = await self.get_bar_provider().get_bulk_historical_data(symbols, start, end)
         except Exception as e:
-            self.logger.error(f"Error in detailed analysis for {symbol}: {str(e)}")
-            return False
+            self.logger.error("Error downloading bars for %d symbols: %s", len(symbols), e)
+            return {}
+        
+        bars = {}
+        for symbol, frame in frames.items():
+            hist, actions = split_actions(symbol, frame)
+            hist = hist.dropna(how='all')
+            if actions:
+                self._adjust_for_actions(symbol, actions, hist)
+            if len(hist) > 0:
+                bars[symbol] = hist
+        return bars
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+    def _adjust_for_actions(self, symbol: str, actions: List[CorporateAction], fresh: pd.DataFrame):
+        """Rescale cached bars for splits and dividends they predate, before newer bars are merged in"""
+        new = self.corporate_actions.observe(actions)
+        if new and symbol in self.bars:
+            self.corporate_actions.apply(symbol, new, self.bars[symbol], reference=fresh)
+
+    def _apply_filters(self, tier: str, frames: Dict[str, pd.DataFrame]) -> List[str]:
+        """Symbols whose bars pass a tier's filters, vectorized over the whole batch"""
+        filters = self.filters.get(tier)
+        if filters is None or not frames:
+            return list(frames)
+        survivors = filters.apply(CrossSection(frames))
+        self.funnel.count_eliminated(filters.last_eliminated)
+        return survivors
 
     def _calculate_momentum(self, hist: pd.DataFrame) -> float:
         """Calculate price momentum"""
-        lookback = self.filters['momentum']['lookback_days']
-        return (hist['Close'][-1] / hist['Close'][-lookback] - 1)
+        lookback = self.config.scanner.momentum_lookback
+        return (hist['Close'].iloc[-1] / hist['Close'].iloc[-lookback] - 1)
 
-    async def _gather_stock_data(self, symbol: str) -> Dict:
-        """Gather comprehensive data for promising stocks"""
-        stock = yf.Ticker(symbol)
-        hist = stock.history(period="60d")
-        
-        info = {
+    def _calculate_volatility(self, hist: pd.DataFrame) -> float:
+        """Annualized volatility of daily returns"""
+        return hist['Close'].pct_change().std() * np.sqrt(252)
+
+    def _score_candidate(self, symbol: str, hist: pd.DataFrame) -> Dict:
+        """Technical data and score from cached bars alone (no provider calls)"""
+        technical = {
+            'momentum': self._calculate_momentum(hist),
+            'volatility': self._calculate_volatility(hist),
+            'rsi': self.features.get(symbol, hist, RSI_14)[-1],
+            'volume_surge': hist['Volume'].iloc[-5:].mean() / hist['Volume'].mean()
+        }
+        score = technical_score(technical, self.config.scoring)
+        return {
             'symbol': symbol,
-            'company_name': stock.info.get('longName', ''),
-            'sector': stock.info.get('sector', ''),
-            'market_cap': stock.info.get('marketCap', 0),
-            'current_price': hist['Close'][-1],
-            'volume': hist['Volume'][-1],
-            'scan_time': datetime.now().isoformat(),
-            'technical_data': {
-                'momentum': self._calculate_momentum(hist),
-                'volatility': hist['Close'].pct_change().std() * np.sqrt(252),
-                'rsi': self._calculate_rsi(hist['Close'])[-1],
-                'volume_surge': hist['Volume'][-5:].mean() / hist['Volume'].mean()
-            }
+            'current_price': hist['Close'].iloc[-1],
+            'volume': hist['Volume'].iloc[-1],
+            'technical_data': technical,
+            'technical_score': score,
+            'score': score,
         }
+
+    def _describe(self, candidate: Dict) -> Dict:
+        """Add company metadata and scan reasons to a candidate"""
+        # Metadata comes from memory; the store refreshes itself in the background
+        fundamentals = self.fundamentals.get(candidate['symbol']) or CompanyFundamentals(candidate['symbol'])
         
+        info = dict(candidate)
+        info.update({
+            'company_name': fundamentals.company_name,
+            'sector': fundamentals.sector,
+            'market_cap': fundamentals.market_cap,
+            'scan_time': datetime.now().isoformat(),
+        })
         info['reasons'] = self._generate_scan_reason(info)
         return info
 
@@ -265,13 +564,14 @@ class MarketScanner:
         """Generate explanations for why this stock was selected"""
         reasons = []
         tech_data = info['technical_data']
+        thresholds = self.config.scanner
         
         # Volume analysis
-        if tech_data['volume_surge'] > self.filters['volume']['surge_factor']:
+        if tech_data['volume_surge'] > thresholds.volume_surge_factor:
             reasons.append(f"Volume surge: {tech_data['volume_surge']:.1f}x average")
         
         # Momentum
-        if tech_data['momentum'] > self.filters['momentum']['min_return']:
+        if tech_data['momentum'] > thresholds.min_momentum:
             reasons.append(f"Strong momentum: {tech_data['momentum']:.1%}")
         
         # RSI
@@ -279,15 +579,17 @@ class MarketScanner:
             reasons.append(f"Neutral RSI: {tech_data['rsi']:.1f}")
         
         # Volatility
-        if self.filters['volatility']['min'] <= tech_data['volatility'] <= self.filters['volatility']['max']:
+        if thresholds.min_volatility <= tech_data['volatility'] <= thresholds.max_volatility:
             reasons.append(f"Healthy volatility: {tech_data['volatility']:.1%}")
         
         return reasons
 
-    async def _analyze_with_news(self, symbol: str, technical_data: Dict) -> Dict:
+    async def _analyze_with_news(self, symbol: str, technical_data: Dict,
+                                 news_data: Optional[Dict] = None) -> Dict:
         """Combine technical and news analysis"""
         # Get news analysis
-        news_data = await self.news_analyzer.analyze_stock_news(symbol)
+        if news_data is None:
+            news_data = await self.news_analyzer.analyze_stock_news(symbol)
         
         # Adjust technical scores based on news
         if news_data['has_significant_news']:
@@ -312,4 +614,5 @@ class MarketScanner:
             technical_data['reasons'].extend([f"Recent: {h}" for h in headlines])
         
         technical_data['news_data'] = news_data
+        technical_data['score'] = final_score(technical_data['technical_score'], news_data, self.config.scoring)
         return technical_data
\ No newline at end of file
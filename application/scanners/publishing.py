@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional
+from ...domain.events.market_event import ScanCompletedEvent
+from ...domain.models.instrument import Instrument
+
+if TYPE_CHECKING:
+    from ..services.analysis_service import AnalysisService
+    from .market_scanner import MarketScanner
+
+ANALYSIS_HISTORY_DAYS = 200    # Enough history for the strategies' indicators
+
+
+class ScanPublisher:
+    """A ScanScheduler ``on_results`` callback that publishes the scanner's output on an event bus.
+
+    Every result set goes out as a ScanCompletedEvent under its scan's ID, so
+    a news re-scoring replaces the stored results of the scan it updated.
+    With an AnalysisService, each history scan's hits are analyzed as well;
+    the service publishes their SignalEvents on the bus itself.
+    """
+
+    def __init__(self,
+                 scanner: 'MarketScanner',
+                 event_bus,
+                 analysis_service: Optional['AnalysisService'] = None):
+        self.scanner = scanner
+        self.event_bus = event_bus
+        self.analysis_service = analysis_service
+
+    async def __call__(self, results: List[Dict], job: str = 'history'):
+        await self.event_bus.publish(ScanCompletedEvent(
+            results=results, timestamp=datetime.now(), scan_id=self.scanner.last_scan_id
+        ))
+        if job == 'history' and self.analysis_service is not None:
+            async for _ in self.analysis_service.analyze_many(
+                [Instrument(result['symbol']) for result in results],
+                start_date=datetime.now() - timedelta(days=ANALYSIS_HISTORY_DAYS),
+                end_date=datetime.now()
+            ):
+                pass
+
+
+def build_signal_analysis(event_bus, provider) -> 'AnalysisService':
+    """The ML strategy over ``provider``'s bars, publishing market data and signals on ``event_bus``"""
+    # Imported here: only scanners that produce signals need the analysis stack
+    from ...config import Config
+    from ..services.analysis_service import AnalysisService
+    from ..services.market_data_service import MarketDataService
+    from ..strategies.ml_strategy import MLTradingStrategy
+    return AnalysisService(
+        MarketDataService(provider, event_bus=event_bus),
+        strategies=[MLTradingStrategy(Config())],
+        event_bus=event_bus
+    )
@@ -0,0 +1,97 @@
+import heapq
+import math
+from typing import Dict, Generic, Iterable, List, Optional, TypeVar
+from ..config.config import ScoringConfig
+
+T = TypeVar('T')
+
+
+def _clip(value: float, low: float, high: float) -> float:
+    if value is None or math.isnan(value):
+        return 0.0
+    return max(low, min(high, value))
+
+
+def technical_score(technical: Dict, config: ScoringConfig) -> float:
+    """Momentum, volume surge and RSI position combined into one score.
+
+    Each component is scaled to [-1, 1] (momentum) or [0, 1] before
+    weighting. RSI scores highest at 50 and zero at 30 or 70.
+    """
+    momentum = _clip(technical['momentum'] / config.momentum_scale, -1.0, 1.0)
+    volume = _clip((technical['volume_surge'] - 1.0) / (config.volume_surge_cap - 1.0), 0.0, 1.0)
+    rsi = _clip(1.0 - abs(technical['rsi'] - 50.0) / 20.0, 0.0, 1.0)
+    return float(config.momentum_weight * momentum
+                 + config.volume_weight * volume
+                 + config.rsi_weight * rsi)
+
+
+def final_score(technical: float, news_data: Optional[Dict], config: ScoringConfig) -> float:
+    """Technical score plus news sentiment, when the news is significant"""
+    if not news_data or not news_data.get('has_significant_news'):
+        return technical
+    return float(technical + config.sentiment_weight * _clip(news_data['sentiment_score'], -1.0, 1.0))
+
+
+class _Entry(Generic[T]):
+    __slots__ = ('score', 'symbol', 'item')
+
+    def __init__(self, score: float, symbol: str, item: T):
+        self.score = score
+        self.symbol = symbol
+        self.item = item
+
+    def __lt__(self, other: '_Entry') -> bool:
+        # "Worse than": lower score, then later symbol, so ties resolve the same in any arrival order
+        if self.score != other.score:
+            return self.score < other.score
+        return self.symbol > other.symbol
+
+
+class TopK(Generic[T]):
+    """Keeps the ``k`` best-scoring items seen so far in a bounded min-heap.
+
+    Memory is O(k) however many items are pushed, and the result doesn't
+    depend on push order, so per-shard selections can be merged.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[_Entry[T]] = []
+        self.seen = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def threshold(self) -> float:
+        """Score an item must beat to get in (-inf until the heap is full)"""
+        return self._heap[0].score if len(self._heap) >= self.k else -math.inf
+
+    def push(self, score: float, symbol: str, item: T) -> bool:
+        """Offer an item; returns whether it was kept"""
+        self.seen += 1
+        if self.k <= 0:
+            return False
+        entry = _Entry(score, symbol, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def extend(self, scored: Iterable[Dict]):
+        """Push result dicts carrying ``score`` and ``symbol``"""
+        for result in scored:
+            self.push(result['score'], result['symbol'], result)
+
+    def items(self) -> List[T]:
+        """Kept items, best first"""
+        return [entry.item for entry in sorted(self._heap, reverse=True)]
+
+
+def rank_results(results: List[Dict]) -> List[Dict]:
+    """Order scan results by score, independently of how the universe was sharded"""
+    return sorted(results, key=lambda r: (-r['score'], r['symbol']))
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional
+from ..config.config import SchedulerConfig
+from ..utils.market_hours import is_market_open, market_now, next_market_close, next_market_open
+from ...infrastructure.monitoring.log_pipeline import ScanLogger
+
+if TYPE_CHECKING:
+    from .market_scanner import MarketScanner
+
+# Called with the results and the job that produced them ('history' or 'news')
+ResultsCallback = Callable[[List[Dict], str], Awaitable[None]]
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    interval: timedelta
+    action: Callable[[], Awaitable[None]]
+    market_hours_only: bool = True
+    run_after_close: bool = False
+    next_run: Optional[datetime] = None
+    last_run: Optional[datetime] = None
+    last_duration: float = 0.0
+    failures: int = 0
+
+
+class ScanScheduler:
+    """Keeps one MarketScanner warm and runs its work on per-tier cadences.
+
+    The universe is reloaded on its own (daily) cadence. Bars are refreshed
+    incrementally and rescanned while the market is open, plus once after
+    the close. News for the current results is re-scored more often, and
+    market-wide news feeds are polled so tickers in the news are
+    re-analyzed on their own without a rescan.
+    Market-hours jobs sleep through nights, weekends and exchange holidays.
+    """
+
+    def __init__(self,
+                 scanner: 'MarketScanner',
+                 config: SchedulerConfig,
+                 on_results: Optional[ResultsCallback] = None):
+        self.scanner = scanner
+        self.config = config
+        self.on_results = on_results
+        self.logger = ScanLogger(__name__)
+        self._stopping: Optional[asyncio.Event] = None
+
+        now = market_now()
+        self.jobs = [
+            ScheduledJob('universe', timedelta(minutes=config.universe_refresh_minutes),
+                         self._refresh_universe, market_hours_only=False, next_run=now),
+            # Always scan once at startup so results exist before the next session
+            ScheduledJob('history', timedelta(minutes=config.history_refresh_minutes),
+                         self._rescan, run_after_close=config.scan_after_close, next_run=now),
+            ScheduledJob('news', timedelta(minutes=config.news_refresh_minutes),
+                         self._refresh_news),
+            ScheduledJob('news_feed', timedelta(minutes=config.news_feed_minutes),
+                         self._ingest_news),
+        ]
+        for job in self.jobs[2:]:
+            job.next_run = self._next_run(job, now)
+
+    async def run_forever(self):
+        self._stopping = asyncio.Event()
+        self.logger.info("Scheduler started: %s", ", ".join(
+            f"{job.name} every {job.interval}" for job in self.jobs
+        ))
+        try:
+            while not self._stopping.is_set():
+                await self.run_pending()
+                wake = min(job.next_run for job in self.jobs)
+                delay = max(0.0, (wake - market_now()).total_seconds())
+                self.logger.debug("Next job at %s", wake.isoformat())
+                try:
+                    # Wake periodically so a suspended host doesn't oversleep
+                    await asyncio.wait_for(self._stopping.wait(), timeout=min(delay, 300.0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.scanner.fundamentals.stop()
+
+    def stop(self):
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run_pending(self, now: Optional[datetime] = None) -> List[str]:
+        """Run every job that is due, in declaration order; returns their names"""
+        now = now or market_now()
+        ran = []
+        for job in self.jobs:
+            if job.next_run > now:
+                continue
+            started = time.perf_counter()
+            try:
+                await job.action()
+                job.failures = 0
+            except Exception as e:
+                job.failures += 1
+                self.logger.error("Scheduled %s job failed (%d in a row): %s", job.name, job.failures, e)
+            job.last_duration = time.perf_counter() - started
+            job.last_run = now
+            job.next_run = self._next_run(job, market_now())
+            self.logger.info("%s job took %.1fs; next run %s",
+                             job.name, job.last_duration, job.next_run.isoformat())
+            ran.append(job.name)
+        return ran
+
+    def _next_run(self, job: ScheduledJob, now: datetime) -> datetime:
+        candidate = now + job.interval
+        if not job.market_hours_only or is_market_open(candidate):
+            return candidate
+        if job.run_after_close and is_market_open(now):
+            # The session ends before the next slot: catch its final bars instead
+            return next_market_close(now) + timedelta(minutes=self.config.close_grace_minutes)
+        return next_market_open(candidate)
+
+    async def _refresh_universe(self):
+        await self.scanner.get_tradable_universe()
+        # The refresh reads scanner.universe, so later reloads change its symbols
+        self.scanner.start_fundamentals_refresh()
+
+    async def _rescan(self):
+        results = await self.scanner.scan_market()
+        if self.on_results:
+            await self.on_results(results, 'history')
+
+    async def _refresh_news(self):
+        if not self.scanner.last_results or not self.scanner.news_providers:
+            return
+        results = await self.scanner.refresh_news()
+        if self.on_results:
+            await self.on_results(results, 'news')
+
+    async def _ingest_news(self):
+        if self.scanner.news_ingestor is None or self.scanner.universe is None:
+            return
+        results = await self.scanner.ingest_news()
+        if results and self.on_results:
+            await self.on_results(results, 'news')
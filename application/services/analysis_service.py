@@ -1,27 +1,50 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 import logging
+import numpy as np
+import pandas as pd
 from trading_platform.domain.models.instrument import Instrument, Signal
 from trading_platform.domain.events.market_event import SignalEvent
 from .market_data_service import MarketDataService, EventBus
 from ..strategies.strategy_interface import TradingStrategy
+from ..indicators.feature_store import FeatureStore
+from ..indicators.indicator_interface import Feature
+from ..options.options_analyzer import OptionsAnalyzer
 
 logger = logging.getLogger(__name__)
 
-class OptionsAnalyzer:
-    async def analyze(self, instrument: Instrument, price: float) -> list[dict]:  # Python 3.9+ syntax
-        return []
+
+def _analyze_in_process(strategy: TradingStrategy,
+                        market_data: pd.DataFrame,
+                        instrument: Instrument,
+                        features: Mapping[Feature, np.ndarray]) -> Signal | None:
+    """Worker-process entry point for cpu_bound strategies"""
+    return asyncio.run(strategy.analyze(market_data, instrument, features))
+
 
 class AnalysisService:
     def __init__(self,
                  market_data_service: MarketDataService,
                  strategies: Sequence[TradingStrategy],
                  options_analyzer: OptionsAnalyzer | None = None,  # Python 3.10+ union type
-                 event_bus: EventBus | None = None):
+                 event_bus: EventBus | None = None,
+                 max_concurrency: int = 8,
+                 executor: Executor | None = None,
+                 feature_store: FeatureStore | None = None):
         self.market_data_service = market_data_service
         self.strategies = strategies
         self.options_analyzer = options_analyzer
         self.event_bus = event_bus
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.feature_store = feature_store or FeatureStore()
+        # Union of every strategy's declared features, computed in one batch per instrument
+        self.required_features = list(dict.fromkeys(
+            f for strategy in strategies for f in strategy.required_features
+        ))
 
     async def analyze_instrument(self,
                                instrument: Instrument,
@@ -32,30 +55,131 @@ class AnalysisService:
             market_data = await self.market_data_service.get_market_data(
                 instrument, start_date, end_date
             )
-            
-            signals = []
-            
-            # Apply each strategy
-            for strategy in self.strategies:
-                signal = await strategy.analyze(market_data, instrument)
-                if signal:
-                    # Add options analysis if available
-                    if self.options_analyzer:
-                        options_data = await self.options_analyzer.analyze(
-                            instrument, signal.price
-                        )
-                        signal.options_data = options_data
-                    
-                    signals.append(signal)
-                    
-                    # Publish signal event
-                    if self.event_bus:
-                        await self.event_bus.publish(
-                            SignalEvent(signal=signal, timestamp=datetime.now())
-                        )
-            
-            return signals
+
+            # Apply all strategies concurrently
+            features = self._features_for(instrument, market_data)
+            signals = await asyncio.gather(*(
+                self._run_strategy(strategy, market_data, instrument, features)
+                for strategy in self.strategies
+            ))
+            signals = await asyncio.gather(*(
+                self._complete_signal(instrument, signal) for signal in signals if signal
+            ))
+            return [signal for signal in signals if signal]
 
         except Exception as e:
             logger.error(f"Error analyzing instrument {instrument.symbol}: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+    async def analyze_many(self,
+                           instruments: Iterable[Instrument],
+                           start_date: datetime,
+                           end_date: datetime) -> AsyncIterator[Signal]:
+        """Analyze instruments concurrently, yielding signals as they complete.
+
+        At most ``max_concurrency`` market data fetches are in flight; a
+        failing instrument is logged and skipped. Raw signals go through a
+        bounded queue to ``max_concurrency`` workers that add options data
+        and publish them, so analysis doesn't wait on either. Closing the
+        iterator early cancels the outstanding work.
+        """
+        raw: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency)
+        done: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze(instrument: Instrument):
+            try:
+                async with semaphore:
+                    market_data = await self.market_data_service.get_market_data(
+                        instrument, start_date, end_date
+                    )
+                features = self._features_for(instrument, market_data)
+                for pending in asyncio.as_completed([
+                    self._run_strategy(strategy, market_data, instrument, features)
+                    for strategy in self.strategies
+                ]):
+                    signal = await pending
+                    if signal:
+                        await raw.put((instrument, signal))
+            except Exception as e:
+                logger.error(f"Error analyzing instrument {instrument.symbol}: {str(e)}")
+
+        async def produce():
+            await asyncio.gather(*(analyze(instrument) for instrument in instruments))
+            for _ in range(self.max_concurrency):
+                await raw.put(None)
+
+        async def complete():
+            while (item := await raw.get()) is not None:
+                signal = await self._complete_signal(*item)
+                if signal:
+                    done.put_nowait(signal)
+            done.put_nowait(None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(complete()) for _ in range(self.max_concurrency)]
+        try:
+            remaining = self.max_concurrency
+            while remaining:
+                signal = await done.get()
+                if signal is None:
+                    remaining -= 1
+                else:
+                    yield signal
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_strategy(self,
+                            strategy: TradingStrategy,
+                            market_data: pd.DataFrame,
+                            instrument: Instrument,
+                            features: Mapping[Feature, np.ndarray]) -> Signal | None:
+        try:
+            features = {f: features[f] for f in strategy.required_features} if features else None
+            if strategy.cpu_bound:
+                signal = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), _analyze_in_process,
+                    strategy, market_data, instrument, features
+                )
+            else:
+                signal = await strategy.analyze(market_data, instrument, features)
+        except Exception as e:
+            logger.error(f"Error in {type(strategy).__name__} for {instrument.symbol}: {str(e)}")
+            return None
+        return signal or None
+
+    async def _complete_signal(self, instrument: Instrument, signal: Signal) -> Signal | None:
+        try:
+            # Add options analysis if available
+            if self.options_analyzer:
+                signal.options_data = await self.options_analyzer.analyze(
+                    instrument, signal.price
+                )
+
+            # Publish signal event
+            if self.event_bus:
+                await self.event_bus.publish(
+                    SignalEvent(signal=signal, timestamp=datetime.now())
+                )
+        except Exception as e:
+            logger.error(f"Error completing signal for {instrument.symbol}: {str(e)}")
+            return None
+        return signal
+
+    def _features_for(self, instrument: Instrument, market_data: pd.DataFrame) -> dict[Feature, np.ndarray]:
+        if not self.required_features or market_data is None or market_data.empty:
+            return {}
+        return self.feature_store.get_many(instrument.symbol, market_data, self.required_features)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        return self._executor
+
+    def close(self):
+        """Shut down the worker pool, if this service created it"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
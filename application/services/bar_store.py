@@ -0,0 +1,131 @@
+import logging
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Interval name (as used by MarketDataProvider) -> length in minutes
+INTERVAL_MINUTES = {
+    '1m': 1, '2m': 2, '5m': 5, '15m': 15, '30m': 30,
+    '60m': 60, '1h': 60, '90m': 90, '1d': 1440,
+}
+SESSION_OPEN_MINUTES = 9 * 60 + 30
+
+_AGGREGATIONS = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+    'Dividends': 'sum',
+    'Stock Splits': 'max',
+}
+
+
+def resample_bars(bars: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Aggregate OHLCV bars to a coarser interval.
+
+    Intraday buckets are anchored at the 09:30 session open (so 1h bars
+    run 09:30-10:30 like the provider's), daily buckets are calendar days
+    in the index's timezone. Empty buckets are dropped.
+    """
+    minutes = INTERVAL_MINUTES[interval]
+    if minutes >= 1440:
+        rule, offset = '1D', None
+    else:
+        rule, offset = f'{minutes}min', pd.Timedelta(minutes=SESSION_OPEN_MINUTES % minutes)
+
+    aggregations = {column: how for column, how in _AGGREGATIONS.items() if column in bars}
+    resampled = bars.resample(rule, origin='start_day', offset=offset).agg(aggregations)
+    return resampled.dropna(subset=['Close'])
+
+
+class BarStore:
+    """Keeps one base-resolution series per symbol and derives coarser intervals from it.
+
+    Derived series are cached; when new base bars are appended only the
+    buckets they touch (normally just the newest, partial one) are
+    recomputed.
+    """
+
+    def __init__(self, base_interval: str = '5m', max_base_history_days: Optional[int] = 60):
+        if base_interval not in INTERVAL_MINUTES:
+            raise ValueError(f"Unsupported base interval: {base_interval}")
+        self.base_interval = base_interval
+        self.base_minutes = INTERVAL_MINUTES[base_interval]
+        # Providers only keep fine-grained history for so long (e.g. 60 days of 5m bars)
+        self.max_base_history_days = max_base_history_days
+        self._base: Dict[str, pd.DataFrame] = {}
+        self._derived: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+    def can_derive(self, interval: str, start_date: Optional[datetime] = None) -> bool:
+        minutes = INTERVAL_MINUTES.get(interval)
+        if minutes is None or minutes < self.base_minutes:
+            return False
+        if minutes < 1440 and minutes % self.base_minutes:
+            return False
+        if start_date is not None and self.max_base_history_days is not None:
+            now = datetime.now(start_date.tzinfo) if start_date.tzinfo else datetime.now()
+            if (now - start_date).days > self.max_base_history_days:
+                return False
+        return True
+
+    def coverage(self, symbol: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        base = self._base.get(symbol)
+        if base is None or base.empty:
+            return None
+        return base.index[0], base.index[-1]
+
+    def set_base(self, symbol: str, bars: pd.DataFrame):
+        """Replace a symbol's base series (drops its derived caches)"""
+        self._base[symbol] = bars.sort_index()
+        self.invalidate(symbol, keep_base=True)
+
+    def append(self, symbol: str, bars: pd.DataFrame):
+        """Add newer base bars and refresh only the affected derived buckets"""
+        if bars.empty:
+            return
+        base = self._base.get(symbol)
+        if base is None or base.empty:
+            self.set_base(symbol, bars)
+            return
+
+        bars = bars.sort_index()
+        if bars.index[0] < base.index[0]:
+            # Older history changes every bucket; rebuild lazily
+            merged = pd.concat([base, bars])
+            self.set_base(symbol, merged[~merged.index.duplicated(keep='last')].sort_index())
+            return
+
+        merged = pd.concat([base[base.index < bars.index[0]], bars])
+        self._base[symbol] = merged
+        first_new = bars.index[0]
+
+        for (cached_symbol, interval), derived in list(self._derived.items()):
+            if cached_symbol != symbol:
+                continue
+            # The bucket containing the first new bar is the last label at or before it
+            labels = derived.index[derived.index <= first_new]
+            recompute_from = labels[-1] if len(labels) else merged.index[0]
+            tail = resample_bars(merged[merged.index >= recompute_from], interval)
+            self._derived[(symbol, interval)] = pd.concat(
+                [derived[derived.index < recompute_from], tail]
+            )
+
+    def get(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        base = self._base.get(symbol)
+        if base is None:
+            return None
+        if interval == self.base_interval:
+            return base
+        derived = self._derived.get((symbol, interval))
+        if derived is None:
+            derived = self._derived[(symbol, interval)] = resample_bars(base, interval)
+        return derived
+
+    def invalidate(self, symbol: str, keep_base: bool = False):
+        if not keep_base:
+            self._base.pop(symbol, None)
+        for key in [key for key in self._derived if key[0] == symbol]:
+            del self._derived[key]
@@ -1,9 +1,12 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 import pandas as pd
 from trading_platform.domain.models.instrument import Instrument
 from trading_platform.domain.events.market_event import MarketEvent
 from trading_platform.infrastructure.data_providers.provider_interface import MarketDataProvider
+from ..utils.market_hours import next_market_open
+from .bar_store import BarStore
 
 class Cache:
     async def get(self, key: str):
@@ -20,25 +23,31 @@ class MarketDataService:
     def __init__(self,
                  provider: MarketDataProvider,
                  cache: Optional[Cache] = None,
-                 event_bus: Optional[EventBus] = None):
+                 event_bus: Optional[EventBus] = None,
+                 bar_store: Optional[BarStore] = None):
         self.provider = provider
         self.cache = cache
         self.event_bus = event_bus
+        self.bar_store = bar_store
 
     async def get_market_data(self,
                             instrument: Instrument,
                             start_date: datetime,
-                            end_date: datetime) -> pd.DataFrame:
-        cache_key = f"{instrument.symbol}:{start_date}:{end_date}"
+                            end_date: datetime,
+                            interval: str = '1d') -> pd.DataFrame:
+        cache_key = f"{instrument.symbol}:{start_date}:{end_date}:{interval}"
         
         if self.cache:
             cached_data = await self.cache.get(cache_key)
             if cached_data is not None:
                 return cached_data
 
-        data = await self.provider.get_historical_data(
-            instrument, start_date, end_date
-        )
+        if self.bar_store and self.bar_store.can_derive(interval, start_date):
+            data = await self._get_derived_data(instrument, start_date, end_date, interval)
+        else:
+            data = await self.provider.get_historical_data(
+                instrument, start_date, end_date, interval
+            )
         
         if self.cache:
             await self.cache.set(cache_key, data)
@@ -47,6 +56,7 @@ class MarketDataService:
             await self.event_bus.publish(
                 MarketEvent(
                     instrument=instrument,
+                    price=Decimal(str(data['Close'].iloc[-1])) if len(data) else None,
                     event_type="DATA_FETCHED",
                     data=data,
                     timestamp=datetime.now()
@@ -54,3 +64,59 @@ class MarketDataService:
             )
             
         return data
+
+    async def get_multi_timeframe(self,
+                                  instrument: Instrument,
+                                  start_date: datetime,
+                                  end_date: datetime,
+                                  intervals: list[str]) -> dict[str, pd.DataFrame]:
+        """Several timeframes for one instrument; derivable ones share a single base fetch"""
+        return {
+            interval: await self.get_market_data(instrument, start_date, end_date, interval)
+            for interval in intervals
+        }
+
+    async def _get_derived_data(self,
+                                instrument: Instrument,
+                                start_date: datetime,
+                                end_date: datetime,
+                                interval: str) -> pd.DataFrame:
+        symbol = instrument.symbol
+        base_interval = self.bar_store.base_interval
+        coverage = self.bar_store.coverage(symbol)
+
+        if coverage is None or _as_index_time(next_market_open(start_date), coverage[0]) < coverage[0]:
+            bars = await self.provider.get_historical_data(
+                instrument, start_date, end_date, base_interval
+            )
+            if coverage is not None:
+                bars = pd.concat([bars, self.bar_store.get(symbol, base_interval)])
+                bars = bars[~bars.index.duplicated(keep='first')]
+            self.bar_store.set_base(symbol, bars)
+        elif next_market_open(self._last_bar_end(coverage[1])) < _as_index_time(end_date, coverage[1]):
+            # A session has traded since the last stored bar; refetch from that bar
+            # so its (possibly partial) bucket is completed
+            bars = await self.provider.get_historical_data(
+                instrument, coverage[1].to_pydatetime(), end_date, base_interval
+            )
+            self.bar_store.append(symbol, bars)
+
+        data = self.bar_store.get(symbol, interval)
+        if data is None or data.empty:
+            return pd.DataFrame() if data is None else data
+        start = _as_index_time(start_date, data.index[0])
+        end = _as_index_time(end_date, data.index[0])
+        return data[(data.index >= start) & (data.index < end)]
+
+    def _last_bar_end(self, last_bar: pd.Timestamp) -> datetime:
+        return (last_bar + pd.Timedelta(minutes=self.bar_store.base_minutes)).to_pydatetime()
+
+
+def _as_index_time(value: datetime, reference: pd.Timestamp) -> pd.Timestamp:
+    """Make ``value`` comparable with a (possibly tz-aware) index timestamp"""
+    value = pd.Timestamp(value)
+    if reference.tzinfo is None:
+        return value.tz_localize(None) if value.tzinfo is not None else value
+    if value.tzinfo is None:
+        return value.tz_localize(reference.tzinfo)
+    return value.tz_convert(reference.tzinfo)
@@ -1,35 +1,49 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Mapping, Optional
 import logging
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier  # Changed from Regressor to Classifier
-from sklearn.preprocessing import StandardScaler
 from ..strategies.strategy_interface import TradingStrategy
+from ..indicators.indicator_interface import Feature, feature
+from ..indicators.feature_store import compute_features
 from trading_platform.domain.models.instrument import Instrument, Signal
 from trading_platform.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Feature column -> indicator
+FEATURES = {
+    'SMA_20': feature('sma', window=20),
+    'SMA_50': feature('sma', window=50),
+    'RSI': feature('rsi', period=14),
+    'Volatility': feature('volatility', window=20),
+    'Momentum': feature('momentum', window=10),
+}
+
 class MLTradingStrategy(TradingStrategy):
+    cpu_bound = True  # Fits a random forest per instrument
+    required_features = tuple(FEATURES.values())
+
     def __init__(self, config: Config):
         self.config = config
-        self.model = RandomForestClassifier(  # Changed to Classifier
-            n_estimators=100,
-            max_depth=5,
-            min_samples_split=5,
-            min_samples_leaf=4,
-            random_state=42
-        )
-        self.scaler = StandardScaler()
+        # Built on first use: importing sklearn costs more than most CLI runs need,
+        # and an unfitted strategy pickles cheaply into worker processes
+        self.model = None
+        self.scaler = None
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+    def _ensure_model(self):
+        if self.model is None:
+            from sklearn.ensemble import RandomForestClassifier  # Changed from Regressor to Classifier
+            from sklearn.preprocessing import StandardScaler
+            self.model = RandomForestClassifier(  # Changed to Classifier
+                n_estimators=100,
+                max_depth=5,
+                min_samples_split=5,
+                min_samples_leaf=4,
+                random_state=42
+            )
+            self.scaler = StandardScaler()
 
     def _calculate_volatility(self, prices: pd.Series, window: int = 20) -> float:
         returns = np.log(prices / prices.shift(1))
@@ -38,7 +52,7 @@ class MLTradingStrategy(TradingStrategy):
     def _calculate_market_condition(self, df: pd.DataFrame) -> float:
         # Calculate various market condition indicators
         recent_volatility = self._calculate_volatility(df['Close'][-20:])
-        rsi = self._calculate_rsi(df['Close']).iloc[-1]
+        rsi = df['RSI'].iloc[-1]
         
         # Penalize high volatility and extreme RSI values
         volatility_penalty = max(0, recent_volatility - 0.2) * 0.5
@@ -48,24 +62,19 @@ class MLTradingStrategy(TradingStrategy):
 
     async def analyze(self,
                      market_data: pd.DataFrame,
-                     instrument: Instrument) -> Optional[Signal]:
+                     instrument: Instrument,
+                     features: Optional[Mapping[Feature, np.ndarray]] = None) -> Optional[Signal]:
         try:
             df = market_data.copy()
             
-            # Calculate technical indicators
-            df['SMA_20'] = df['Close'].rolling(window=20).mean()
-            df['SMA_50'] = df['Close'].rolling(window=50).mean()
-            df['RSI'] = self._calculate_rsi(df['Close'])
-            df['Volatility'] = df['Close'].rolling(window=20).apply(
-                lambda x: np.log(x / x.shift(1)).std() * np.sqrt(252)
-            )
-            
-            # Calculate price momentum
-            df['Returns'] = df['Close'].pct_change()
-            df['Momentum'] = df['Returns'].rolling(window=10).mean()
+            # Technical indicators come precomputed from the feature store when available
+            if features is None:
+                features = compute_features(market_data, self.required_features)
+            for column, spec in FEATURES.items():
+                df[column] = features[spec]
             
             # Prepare features
-            features = [
+            feature_columns = [
                 'Close', 'Volume', 'SMA_20', 'SMA_50', 'RSI', 
                 'Volatility', 'Momentum'
             ]
@@ -76,22 +85,23 @@ class MLTradingStrategy(TradingStrategy):
                 logger.warning(f"Insufficient data for {instrument.symbol}")
                 return None
             
-            X = df[features].values[:-1]
+            X = df[feature_columns].values[:-1]
             y = (df['Close'].shift(-1) > df['Close']).values[:-1]
             
             # Scale features
+            self._ensure_model()
             X_scaled = self.scaler.fit_transform(X)
             
             # Train model and predict
             self.model.fit(X_scaled, y)
             
             # Get current features
-            current_features = df[features].values[-1:]
+            current_features = df[feature_columns].values[-1:]
             current_features_scaled = self.scaler.transform(current_features)
             
             # Get prediction and feature importances
             prediction = self.model.predict_proba(current_features_scaled)[0][1]  # Now works with Classifier
-            feature_importance = dict(zip(features, self.model.feature_importances_))
+            feature_importance = dict(zip(feature_columns, self.model.feature_importances_))
             
             # Calculate market condition adjustment
             market_condition = self._calculate_market_condition(df)
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Mapping, Optional, Sequence
+import numpy as np
 import pandas as pd
 from trading_platform.domain.models.instrument import Instrument, Signal
+from ..indicators.indicator_interface import Feature
 
 class TradingStrategy(ABC):
+    # Strategies that spend their time in Python/NumPy rather than awaiting I/O
+    # set this so AnalysisService runs them in a worker process
+    cpu_bound: bool = False
+    # Indicators the strategy reads; AnalysisService computes them once per
+    # instrument through the shared FeatureStore and passes them in
+    required_features: Sequence[Feature] = ()
+
     @abstractmethod
     async def analyze(self, 
                      market_data: pd.DataFrame,
-                     instrument: Instrument) -> Optional[Signal]:
+                     instrument: Instrument,
+                     features: Optional[Mapping[Feature, np.ndarray]] = None) -> Optional[Signal]:
         pass
@@ -0,0 +1,220 @@
+import csv
+import logging
+import os
+import zlib
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UNIVERSE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'config', 'universe'
+)
+SNAPSHOT_PREFIX = 'constituents_'
+
+# Index membership is stored as a bitmask per symbol
+INDICES = {
+    'SP500': 'S&P 500',
+    'NDX100': 'NASDAQ 100',
+    'R2000': 'Russell 2000',
+}
+INDEX_BITS = {code: 1 << i for i, code in enumerate(INDICES)}
+
+
+class UniverseError(Exception):
+    pass
+
+
+class SymbolInfo(NamedTuple):
+    id: int
+    symbol: str
+    name: str
+    exchange: str
+    sector: str
+    index_mask: int
+
+    def in_index(self, code: str) -> bool:
+        return bool(self.index_mask & INDEX_BITS[code])
+
+
+class SymbolTable:
+    """Interns ticker symbols to dense integer IDs"""
+
+    def __init__(self, symbols: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        for symbol in symbols:
+            self.intern(symbol)
+
+    def intern(self, symbol: str) -> int:
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._ids[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        return symbol_id
+
+    def id_of(self, symbol: str) -> Optional[int]:
+        return self._ids.get(symbol)
+
+    def symbol_of(self, symbol_id: int) -> str:
+        return self._symbols[symbol_id]
+
+    @property
+    def symbols(self) -> List[str]:
+        return self._symbols
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+
+def shard_of(symbol: str, num_shards: int) -> int:
+    """Stable shard assignment: same symbol, same shard, in every process and run"""
+    return zlib.crc32(symbol.encode()) % num_shards
+
+
+class Universe:
+    """Immutable snapshot of the tradable universe.
+
+    IDs are assigned in sorted symbol order, so batches, shards and IDs
+    are deterministic for a given snapshot version.
+    """
+
+    def __init__(self, version: str, infos: List[SymbolInfo]):
+        self.version = version
+        self.infos = infos
+        self.table = SymbolTable(info.symbol for info in infos)
+        self.symbols: Tuple[str, ...] = tuple(self.table.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.table
+
+    def info(self, symbol: str) -> Optional[SymbolInfo]:
+        symbol_id = self.table.id_of(symbol)
+        return None if symbol_id is None else self.infos[symbol_id]
+
+    def members(self, index_code: str) -> List[str]:
+        bit = INDEX_BITS[index_code]
+        return [info.symbol for info in self.infos if info.index_mask & bit]
+
+    def subset(self, symbols: Iterable[str]) -> 'Universe':
+        """Restrict to the given symbols, keeping snapshot metadata where known"""
+        infos = []
+        for i, symbol in enumerate(sorted(set(symbols))):
+            info = self.info(symbol)
+            if info is None:
+                infos.append(SymbolInfo(i, symbol, '', '', '', 0))
+            else:
+                infos.append(info._replace(id=i))
+        return Universe(self.version, infos)
+
+    def shard(self, shard_index: int, num_shards: int) -> List[str]:
+        """Symbols belonging to one of ``num_shards`` stable shards"""
+        if not 0 <= shard_index < num_shards:
+            raise ValueError(f"shard_index must be in [0, {num_shards})")
+        return [s for s in self.symbols if shard_of(s, num_shards) == shard_index]
+
+    def shards(self, num_shards: int) -> List[List[str]]:
+        shards: List[List[str]] = [[] for _ in range(num_shards)]
+        for symbol in self.symbols:
+            shards[shard_of(symbol, num_shards)].append(symbol)
+        return shards
+
+    def batches(self, batch_size: int) -> Iterator[List[str]]:
+        symbols = self.symbols
+        for i in range(0, len(symbols), batch_size):
+            yield list(symbols[i:i + batch_size])
+
+    def num_batches(self, batch_size: int) -> int:
+        return (len(self.symbols) + batch_size - 1) // batch_size
+
+
+class UniverseLoader:
+    """Loads versioned constituent snapshots (``constituents_<version>.csv``).
+
+    Each row is ``symbol,name,exchange,sector,indices`` where ``indices``
+    is a ``|``-separated list of index codes (SP500, NDX100, R2000).
+    Parsed snapshots are cached until the file changes on disk.
+    """
+
+    def __init__(self, directory: str = DEFAULT_UNIVERSE_DIR):
+        self.directory = directory
+        self._cache: Dict[str, Tuple[float, Universe]] = {}
+
+    def available_versions(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            name[len(SNAPSHOT_PREFIX):-len('.csv')]
+            for name in names
+            if name.startswith(SNAPSHOT_PREFIX) and name.endswith('.csv')
+        )
+
+    def load(self,
+             version: Optional[str] = None,
+             indices: Optional[Iterable[str]] = None) -> Universe:
+        """Load a snapshot (latest by default), optionally restricted to some indices"""
+        if version is None:
+            versions = self.available_versions()
+            if not versions:
+                raise UniverseError(f"No universe snapshots found in {self.directory}")
+            version = versions[-1]
+
+        path = os.path.join(self.directory, f"{SNAPSHOT_PREFIX}{version}.csv")
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            raise UniverseError(f"Universe snapshot {version} not found")
+
+        cached = self._cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, self._parse(path, version))
+            self._cache[path] = cached
+        universe = cached[1]
+
+        if indices:
+            mask = 0
+            for code in indices:
+                if code not in INDEX_BITS:
+                    raise UniverseError(f"Unknown index code: {code}")
+                mask |= INDEX_BITS[code]
+            universe = universe.subset(
+                info.symbol for info in universe.infos if info.index_mask & mask
+            )
+        return universe
+
+    def _parse(self, path: str, version: str) -> Universe:
+        rows = {}
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header
+            for row in reader:
+                if not row or not row[0]:
+                    continue
+                row += [''] * (5 - len(row))
+                symbol = row[0].strip().upper()
+                mask = 0
+                for code in row[4].split('|'):
+                    mask |= INDEX_BITS.get(code.strip(), 0)
+                # A symbol listed twice keeps the union of its index memberships
+                if symbol in rows:
+                    mask |= rows[symbol][3]
+                rows[symbol] = (row[1], row[2], row[3], mask)
+
+        infos = [
+            SymbolInfo(id=i, symbol=symbol, name=name, exchange=exchange,
+                       sector=sector, index_mask=mask)
+            for i, (symbol, (name, exchange, sector, mask)) in enumerate(sorted(rows.items()))
+        ]
+        logger.info(f"Loaded universe {version}: {len(infos)} symbols")
+        return Universe(version, infos)
@@ -1,20 +1,290 @@
 import asyncio
+import contextvars
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from functools import wraps
-from typing import Callable
+from typing import Awaitable, Callable, Dict, Optional
 import logging
 
-def async_retry(retries: int = 3, delay: float = 1.0):
+logger = logging.getLogger(__name__)
+
+
+class RetryableError(Exception):
+    """A failure worth retrying: timeouts, dropped connections, 429s and 5xxs"""
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FatalError(Exception):
+    """A failure retrying won't fix: bad requests, auth, malformed responses"""
+
+
+class DeadlineExceeded(FatalError):
+    pass
+
+
+class CircuitOpenError(FatalError):
+    pass
+
+
+def is_retryable(error: BaseException) -> bool:
+    if isinstance(error, (RetryableError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    # Anything else (FatalError, ValueError, KeyError, ...) is a bug or a bad request
+    return False
+
+
+def http_error(status: int, message: str, retry_after: Optional[str] = None) -> Exception:
+    """Classify a non-200 HTTP status"""
+    if status in (408, 425, 429) or status >= 500:
+        try:
+            delay = float(retry_after) if retry_after else None
+        except ValueError:
+            delay = None  # An HTTP date; fall back to backoff
+        return RetryableError(f"{message}: HTTP {status}", retry_after=delay)
+    return FatalError(f"{message}: HTTP {status}")
+
+
+# Absolute time.monotonic() by which the current task's work must finish
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """Bound everything retried inside the block (including tasks it starts) to ``seconds``.
+
+    Nested deadlines only ever shorten the budget. ``None`` adds no limit.
+    """
+    if seconds is None:
+        yield
+        return
+    current = _deadline.get()
+    token = _deadline.set(min(current, time.monotonic() + seconds) if current is not None
+                          else time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none"""
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    call_timeout: Optional[float] = 10.0     # Per attempt
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential delay after the ``attempt``-th failure.
+
+        A server's ``retry_after`` is honoured as given: retrying sooner only
+        earns another rejection. ``max_delay`` bounds our own backoff, and
+        call_with_retry gives up at once if the wait would pass the deadline.
+        """
+        if retry_after is not None:
+            return max(0.0, retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1)))
+
+
+@dataclass
+class RetryStats:
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    successes: int = 0
+    failures: int = 0
+    deadline_exceeded: int = 0
+    rejected: int = 0          # Failed fast on an open circuit
+
+
+class CircuitBreaker:
+    """Fails calls fast while a backend is down.
+
+    Opens after ``failure_threshold`` consecutive retryable failures. After
+    ``reset_timeout`` seconds one trial call is let through (half-open):
+    success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._trial_in_flight = False
+
+    def before_call(self):
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                raise CircuitOpenError(f"{self.name} circuit is half-open; trial call in flight")
+            self._trial_in_flight = True
+
+    def record_success(self):
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        if self.state != self.CLOSED:
+            logger.info(f"{self.name} circuit closed")
+        self.state = self.CLOSED
+
+    def abandon(self):
+        """A call was cancelled before it could tell us anything"""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._trial_in_flight = False
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(f"{self.name} circuit opened after {self.consecutive_failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def report(self) -> Dict:
+        return {'state': self.state, 'consecutive_failures': self.consecutive_failures,
+                'times_opened': self.times_opened}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_stats: Dict[str, RetryStats] = {}
+
+
+def circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """The process-wide breaker for a backend, created on first use"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name, **kwargs)
+    return breaker
+
+
+def retry_stats(name: str) -> RetryStats:
+    return _stats.setdefault(name, RetryStats())
+
+
+def retry_report() -> Dict[str, Dict]:
+    """Retry counters and circuit state per backend"""
+    report = {name: asdict(stats) for name, stats in _stats.items()}
+    for name, breaker in _breakers.items():
+        report.setdefault(name, {}).update(breaker.report())
+    return report
+
+
+async def call_with_retry(call: Callable[[], Awaitable],
+                          policy: RetryPolicy,
+                          name: str,
+                          breaker: Optional[CircuitBreaker] = None):
+    """Await ``call()`` until it succeeds, fails fatally, runs out of attempts or hits the deadline"""
+    stats = retry_stats(name)
+    stats.calls += 1
+    attempt = 0
+    while True:
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            stats.deadline_exceeded += 1
+            raise DeadlineExceeded(f"{name}: deadline passed before attempt {attempt + 1}")
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                stats.rejected += 1
+                raise
+
+        timeout = policy.call_timeout
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        attempt += 1
+        stats.attempts += 1
+        try:
+            result = await (asyncio.wait_for(call(), timeout) if timeout is not None else call())
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.abandon()
+            raise
+        except Exception as e:
+            retryable = is_retryable(e)
+            if breaker is not None:
+                # A 4xx or a parse error still means the backend answered
+                breaker.record_failure() if retryable else breaker.record_success()
+            if not retryable or attempt >= policy.max_attempts:
+                stats.failures += 1
+                raise
+            delay = policy.backoff(attempt, getattr(e, 'retry_after', None))
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                stats.deadline_exceeded += 1
+                raise DeadlineExceeded(f"{name}: no time left to retry after {e!r}") from e
+            stats.retries += 1
+            logger.debug(f"{name}: attempt {attempt} failed ({e!r}); retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            stats.successes += 1
+            return result
+
+
+def async_retry(retries: int = 3,
+                delay: float = 1.0,
+                policy: Optional[RetryPolicy] = None,
+                breaker: Optional[str] = None):
+    """Decorator form of call_with_retry; ``breaker`` names a shared circuit breaker"""
+    policy = policy or RetryPolicy(max_attempts=retries, base_delay=delay)
+
     def decorator(func: Callable):
+        name = breaker or func.__qualname__
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(retries):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < retries - 1:
-                        await asyncio.sleep(delay * (attempt + 1))
-            raise last_exception
+            return await call_with_retry(
+                lambda: func(*args, **kwargs), policy, name,
+                circuit_breaker(breaker) if breaker else None
+            )
         return wrapper
     return decorator
+
+class AsyncRateLimiter:
+    """Token bucket shared by concurrent coroutines: ``calls`` per ``period`` seconds"""
+
+    def __init__(self, calls: int, period: float, burst: int = 1):
+        self.rate = calls / period
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -0,0 +1,139 @@
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+
+
+def market_now() -> datetime:
+    return datetime.now(MARKET_TZ)
+
+
+def _to_market_tz(now: datetime | None) -> datetime:
+    if now is None:
+        return market_now()
+    if now.tzinfo is None:
+        return now.replace(tzinfo=MARKET_TZ)
+    return now.astimezone(MARKET_TZ)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th ``weekday`` (Mon=0) of a month; n=-1 for the last one"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=64)
+def market_holidays(year: int) -> frozenset:
+    """NYSE full-day closures for a year, from the exchange's standing holiday rules"""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),           # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),           # Washington's Birthday
+        _easter(year) - timedelta(days=2),     # Good Friday
+        _nth_weekday(year, 5, 0, -1),          # Memorial Day
+        _observed(date(year, 7, 4)),           # Independence Day
+        _nth_weekday(year, 9, 0, 1),           # Labor Day
+        _nth_weekday(year, 11, 3, 4),          # Thanksgiving
+        _observed(date(year, 12, 25)),         # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the preceding Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=64)
+def early_closes(year: int) -> frozenset:
+    """Sessions that close at 13:00"""
+    days = {
+        date(year, 7, 3),                                  # Day before Independence Day
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),  # Day after Thanksgiving
+        date(year, 12, 24),                                # Christmas Eve
+    }
+    holidays = market_holidays(year)
+    return frozenset(day for day in days if day.weekday() < 5 and day not in holidays)
+
+
+def is_trading_day(day) -> bool:
+    if isinstance(day, datetime):
+        day = day.date()
+    return day.weekday() < 5 and day not in market_holidays(day.year)
+
+
+def session_close(day: date) -> time:
+    return EARLY_CLOSE if day in early_closes(day.year) else MARKET_CLOSE
+
+
+def is_market_open(now: datetime | None = None) -> bool:
+    """Regular US equity session (09:30 to the close, New York time, trading days)"""
+    now = _to_market_tz(now)
+    day = now.date()
+    return is_trading_day(day) and MARKET_OPEN <= now.time() < session_close(day)
+
+
+def next_market_open(now: datetime | None = None) -> datetime:
+    """Start of the next regular session strictly after ``now`` (or now, if open)"""
+    now = _to_market_tz(now)
+    if is_market_open(now):
+        return now
+    day = now.date()
+    if now.time() >= MARKET_OPEN:
+        day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return datetime.combine(day, MARKET_OPEN, tzinfo=MARKET_TZ)
+
+
+def next_market_close(now: datetime | None = None) -> datetime:
+    """End of the current session, or of the next one if the market is closed"""
+    start = next_market_open(now)
+    return datetime.combine(start.date(), session_close(start.date()), tzinfo=MARKET_TZ)
+
+
+def previous_market_close(now: datetime | None = None) -> datetime:
+    """End of the most recent session that closed at or before ``now``"""
+    now = _to_market_tz(now)
+    day = now.date()
+    if not (is_trading_day(day) and now.time() >= session_close(day)):
+        day = previous_trading_day(day)
+    return datetime.combine(day, session_close(day), tzinfo=MARKET_TZ)
+
+
+def previous_trading_day(day: date) -> date:
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
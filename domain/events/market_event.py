@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Optional
 from ..models.instrument import Instrument, Signal
 
 @dataclass
@@ -16,3 +16,9 @@ class MarketEvent:
 class SignalEvent:
     signal: Signal
     timestamp: datetime
+
+@dataclass
+class ScanCompletedEvent:
+    results: List[Dict]
+    timestamp: datetime
+    scan_id: Optional[str] = None
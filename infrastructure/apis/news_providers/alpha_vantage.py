@@ -1,17 +1,21 @@
 import aiohttp
 import logging
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 from .base import NewsProvider
-from ...utils.async_utils import async_retry
+from trading_platform.application.utils.async_utils import (
+    FatalError, RetryableError, RetryPolicy, call_with_retry, circuit_breaker, http_error
+)
 
 logger = logging.getLogger(__name__)
 
 class AlphaVantageNews(NewsProvider):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, retry_policy: Optional[RetryPolicy] = None):
         self.api_key = api_key
         self.base_url = "https://www.alphavantage.co/query"
+        self.retry_policy = retry_policy or RetryPolicy(base_delay=1.0)
+        self.breaker = circuit_breaker('alpha_vantage')
 
-    @async_retry(retries=3, delay=1.0)
     async def get_news(self, symbol: str, days_back: int = 7) -> List[Dict]:
         params = {
             "function": "NEWS_SENTIMENT",
@@ -19,19 +23,45 @@ class AlphaVantageNews(NewsProvider):
             "apikey": self.api_key,
             "limit": 50  # Adjust based on your needs
         }
+        data = await self._query(params, symbol)
+        return self._process_news(data, days_back)
 
+    async def get_market_news(self, days_back: int = 1) -> List[Dict]:
+        """Latest articles across all tickers; each carries its own per-ticker sentiment"""
+        params = {
+            "function": "NEWS_SENTIMENT",
+            "time_from": (datetime.now() - timedelta(days=days_back)).strftime('%Y%m%dT%H%M'),
+            "sort": "LATEST",
+            "apikey": self.api_key,
+            "limit": 1000
+        }
+        data = await self._query(params, "the market")
+        return self._process_news(data, days_back)
+
+    async def _query(self, params: Dict, subject: str) -> Dict:
+        return await call_with_retry(lambda: self._fetch(params, subject),
+                                     self.retry_policy, 'alpha_vantage', self.breaker)
+
+    async def _fetch(self, params: Dict, subject: str) -> Dict:
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(self.base_url, params=params) as response:
-                    if response.status == 200:
+                    if response.status != 200:
+                        raise http_error(response.status, f"Alpha Vantage news for {subject}",
+                                         response.headers.get('Retry-After'))
+                    try:
                         data = await response.json()
-                        return self._process_news(data, days_back)
-                    else:
-                        logger.error(f"Error fetching news for {symbol}: {response.status}")
-                        return []
-        except Exception as e:
-            logger.error(f"Error in news fetch: {str(e)}")
-            return []
+                    except (aiohttp.ContentTypeError, ValueError) as e:
+                        raise FatalError(f"Malformed Alpha Vantage response for {subject}") from e
+        except aiohttp.ClientError as e:
+            raise RetryableError(f"Alpha Vantage request for {subject} failed: {str(e)}") from e
+
+        # Errors and rate limits come back as 200s
+        if 'Note' in data:
+            raise RetryableError(data['Note'], retry_after=60)
+        if 'Error Message' in data or 'Information' in data:
+            raise FatalError(data.get('Error Message') or data['Information'])
+        return data
 
     def _process_news(self, data: Dict, days_back: int) -> List[Dict]:
         try:
@@ -51,11 +81,15 @@ class AlphaVantageNews(NewsProvider):
                         'url': article['url'],
                         'date': pub_date.isoformat(),
                         'sentiment': article.get('overall_sentiment_score', 0),
-                        'relevance': article.get('relevance_score', 0)
+                        'relevance': article.get('relevance_score', 0),
+                        'tickers': [t['ticker'] for t in article.get('ticker_sentiment', [])],
+                        'ticker_sentiment': {
+                            t['ticker']: float(t.get('ticker_sentiment_score', 0))
+                            for t in article.get('ticker_sentiment', [])
+                        }
                     })
 
             return processed_news
 
-        except Exception as e:
-            logger.error(f"Error processing news data: {str(e)}")
-            return []
+        except (KeyError, TypeError, ValueError) as e:
+            raise FatalError(f"Malformed Alpha Vantage article: {e!r}") from e
@@ -6,4 +6,12 @@ class NewsProvider(ABC):
     @abstractmethod
     async def get_news(self, symbol: str, days_back: int = 7) -> List[Dict]:
         """Get news for a specific symbol"""
-        pass
\ No newline at end of file
+        pass
+
+    async def get_market_news(self, days_back: int = 1) -> List[Dict]:
+        """Recent market-wide articles in one request, each with a ``tickers`` list.
+
+        Providers without a market-wide feed return nothing, and their news
+        is only seen through per-symbol ``get_news`` calls.
+        """
+        return []
\ No newline at end of file
@@ -1,17 +1,22 @@
 import aiohttp
 import logging
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 from .base import NewsProvider
-from ...utils.async_utils import async_retry
+from trading_platform.application.utils.async_utils import (
+    FatalError, RetryableError, RetryPolicy, call_with_retry, circuit_breaker, http_error
+)
 
 logger = logging.getLogger(__name__)
 
 class FinnHubNews(NewsProvider):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, retry_policy: Optional[RetryPolicy] = None):
         self.api_key = api_key
         self.base_url = "https://finnhub.io/api/v1/company-news"
+        self.market_news_url = "https://finnhub.io/api/v1/news"
+        self.retry_policy = retry_policy or RetryPolicy(base_delay=1.0)
+        self.breaker = circuit_breaker('finnhub')
 
-    @async_retry(retries=3, delay=1.0)
     async def get_news(self, symbol: str, days_back: int = 7) -> List[Dict]:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
@@ -26,18 +31,36 @@ class FinnHubNews(NewsProvider):
             "to": end_date.strftime('%Y-%m-%d')
         }
 
+        data = await self._query(self.base_url, headers, params, symbol)
+        return self._process_news(data)
+
+    async def get_market_news(self, days_back: int = 1) -> List[Dict]:
+        """General market news; tickers come from each article's ``related`` field"""
+        headers = {"X-Finnhub-Token": self.api_key}
+        data = await self._query(self.market_news_url, headers, {"category": "general"}, "the market")
+        cutoff = (datetime.now() - timedelta(days=days_back)).timestamp()
+        return self._process_news([article for article in data if article.get('datetime', 0) >= cutoff])
+
+    async def _query(self, url: str, headers: Dict, params: Dict, subject: str) -> List[Dict]:
+        return await call_with_retry(lambda: self._fetch(url, headers, params, subject),
+                                     self.retry_policy, 'finnhub', self.breaker)
+
+    async def _fetch(self, url: str, headers: Dict, params: Dict, subject: str) -> List[Dict]:
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, headers=headers, params=params) as response:
-                    if response.status == 200:
+                async with session.get(url, headers=headers, params=params) as response:
+                    if response.status != 200:
+                        raise http_error(response.status, f"Finnhub news for {subject}",
+                                         response.headers.get('Retry-After'))
+                    try:
                         data = await response.json()
-                        return self._process_news(data)
-                    else:
-                        logger.error(f"Error fetching news for {symbol}: {response.status}")
-                        return []
-        except Exception as e:
-            logger.error(f"Error in news fetch: {str(e)}")
-            return []
+                    except (aiohttp.ContentTypeError, ValueError) as e:
+                        raise FatalError(f"Malformed Finnhub response for {subject}") from e
+        except aiohttp.ClientError as e:
+            raise RetryableError(f"Finnhub request for {subject} failed: {str(e)}") from e
+        if not isinstance(data, list):
+            raise FatalError(f"Unexpected Finnhub response for {subject}: {str(data)[:200]}")
+        return data
 
     def _process_news(self, articles: List[Dict]) -> List[Dict]:
         try:
@@ -51,14 +74,14 @@ class FinnHubNews(NewsProvider):
                     'url': article['url'],
                     'date': datetime.fromtimestamp(article['datetime']).isoformat(),
                     'sentiment': self._calculate_sentiment(article['summary']),
-                    'relevance': 1.0  # FinnHub doesn't provide relevance scores
+                    'relevance': 1.0,  # FinnHub doesn't provide relevance scores
+                    'tickers': [t for t in article.get('related', '').split(',') if t]
                 })
 
             return processed_news
 
-        except Exception as e:
-            logger.error(f"Error processing news data: {str(e)}")
-            return []
+        except (KeyError, TypeError, ValueError) as e:
+            raise FatalError(f"Malformed Finnhub article: {e!r}") from e
 
     def _calculate_sentiment(self, text: str) -> float:
         # Simple sentiment calculation - replace with more sophisticated analysis
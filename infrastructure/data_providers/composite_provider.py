@@ -0,0 +1,277 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
+import pandas as pd
+from .provider_interface import DataProviderError, MarketDataProvider
+from trading_platform.domain.models.instrument import Instrument
+
+logger = logging.getLogger(__name__)
+
+Call = Callable[[MarketDataProvider], Awaitable[Any]]
+
+
+class ProviderStats:
+    """Rolling latencies and outcomes of one provider's recent requests"""
+
+    def __init__(self, name: str, window: int = 200):
+        self.name = name
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)   # True for a good response
+        self.requests = 0
+        self.failures = 0
+        self.hedges = 0        # Requests sent to it as the hedge
+        self.hedge_wins = 0    # ... that beat the primary
+        self.cancelled = 0     # Requests abandoned because another provider answered first
+        self.last_error: Optional[str] = None
+
+    def record(self, latency: float, ok: bool, error: Optional[str] = None):
+        self.requests += 1
+        self.latencies.append(latency)
+        self.outcomes.append(ok)
+        if not ok:
+            self.failures += 1
+            self.last_error = error
+
+    def record_cancelled(self, latency: float):
+        # It took at least this long; leaving it out would pull the p95 down
+        self.cancelled += 1
+        self.latencies.append(latency)
+
+    @property
+    def samples(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def expected_cost(self) -> float:
+        """Median latency inflated by the chance of having to go elsewhere; 0 until sampled"""
+        median = self.quantile(0.5)
+        if median is None:
+            return 0.0
+        return median / max(1.0 - self.error_rate, 0.01)
+
+    def report(self) -> Dict:
+        p50, p95 = self.quantile(0.5), self.quantile(0.95)
+        return {
+            'requests': self.requests,
+            'failures': self.failures,
+            'error_rate': round(self.error_rate, 3),
+            'p50_ms': round(p50 * 1000, 1) if p50 is not None else None,
+            'p95_ms': round(p95 * 1000, 1) if p95 is not None else None,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'cancelled': self.cancelled,
+            'last_error': self.last_error,
+        }
+
+
+class CompositeProvider(MarketDataProvider):
+    """Routes each request across several providers by observed latency and error rate.
+
+    Providers are tried cheapest first (median latency, inflated by error
+    rate); ones failing more than ``max_error_rate`` go last. If the
+    primary hasn't answered within its own ``hedge_quantile`` latency, the
+    next provider gets the same request. The first good response wins and
+    the other request is cancelled. A failure or an empty frame moves on to
+    the next provider. Cancelling a thread-backed call (e.g. yfinance) frees
+    the caller at once, but the worker thread still runs to completion.
+    Bulk bar requests are ranked and hedged on their own statistics;
+    symbols missing from the winner's batch are asked of the others.
+    """
+
+    def __init__(self,
+                 providers: Mapping[str, MarketDataProvider],
+                 hedge_quantile: float = 0.95,
+                 min_samples: int = 20,
+                 max_error_rate: float = 0.5,
+                 window: int = 200):
+        if not providers:
+            raise ValueError("CompositeProvider needs at least one provider")
+        # Insertion order is the preference until there are latencies to go on
+        self.providers = dict(providers)
+        self.hedge_quantile = hedge_quantile
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.stats = {name: ProviderStats(name, window) for name in self.providers}
+        # A bulk request takes many times longer than a single one; tracked apart
+        # so neither skews the other's ranking or hedge delay
+        self.bulk_stats = {name: ProviderStats(name, window) for name in self.providers}
+
+    async def get_historical_data(self,
+                                instrument: Instrument,
+                                start_date: datetime,
+                                end_date: datetime,
+                                interval: str = '1d') -> pd.DataFrame:
+        return await self._route(
+            f"{interval} bars for {instrument.symbol}",
+            lambda provider: provider.get_historical_data(instrument, start_date, end_date, interval)
+        )
+
+    async def get_bulk_historical_data(self,
+                                       symbols: list[str],
+                                       start: date,
+                                       end: Optional[date] = None) -> dict[str, pd.DataFrame]:
+        """The whole batch from one provider (hedged like any request); symbols it lacks from the others"""
+        winner, bars = await self._route_with_winner(
+            f"daily bars for {len(symbols)} symbols",
+            lambda provider: provider.get_bulk_historical_data(symbols, start, end),
+            self.bulk_stats
+        )
+        bars = dict(bars)
+        others = [name for name in self.ranked(self.bulk_stats) if name != winner]
+        missing = [symbol for symbol in symbols if symbol not in bars]
+        if missing and others:
+            try:
+                _, rest = await self._route_with_winner(
+                    f"daily bars for {len(missing)} symbols missing from {winner}",
+                    lambda provider: provider.get_bulk_historical_data(missing, start, end),
+                    self.bulk_stats, others
+                )
+                bars.update(rest)
+            except DataProviderError as e:
+                logger.warning(str(e))
+        return bars
+
+    async def get_options_data(self, instrument: Instrument) -> dict:
+        return await self._route(f"options data for {instrument.symbol}",
+                                 lambda provider: provider.get_options_data(instrument))
+
+    async def get_option_expirations(self, instrument: Instrument) -> list[str]:
+        return await self._route(f"option expirations for {instrument.symbol}",
+                                 lambda provider: provider.get_option_expirations(instrument))
+
+    async def get_option_chain(self, instrument: Instrument, expiration: str) -> dict[str, pd.DataFrame]:
+        return await self._route(f"{expiration} option chain for {instrument.symbol}",
+                                 lambda provider: provider.get_option_chain(instrument, expiration))
+
+    def ranked(self, stats: Optional[Dict[str, ProviderStats]] = None) -> List[str]:
+        """Provider names in the order the next request (or bulk request, given ``bulk_stats``) will try them"""
+        stats_by_name = stats if stats is not None else self.stats
+
+        def key(name: str):
+            stats = stats_by_name[name]
+            unhealthy = len(stats.outcomes) >= self.min_samples and stats.error_rate > self.max_error_rate
+            return unhealthy, stats.expected_cost()
+        return sorted(self.providers, key=key)
+
+    def health(self, bulk: bool = False) -> Dict[str, Dict]:
+        """Per-provider latency and error report, in routing order"""
+        stats = self.bulk_stats if bulk else self.stats
+        return {name: dict(stats[name].report(), rank=rank)
+                for rank, name in enumerate(self.ranked(stats), 1)}
+
+    def log_health(self):
+        for name, report in self.health().items():
+            logger.info(f"Provider {name}: {report['requests']} requests, "
+                        f"{report['error_rate']:.1%} errors, p50 {report['p50_ms']} ms, "
+                        f"p95 {report['p95_ms']} ms, {report['hedges']} hedges "
+                        f"({report['hedge_wins']} won), {report['cancelled']} cancelled")
+        for name, report in self.health(bulk=True).items():
+            if report['requests']:
+                logger.info(f"Provider {name}: {report['requests']} bulk requests, "
+                            f"{report['error_rate']:.1%} errors, p50 {report['p50_ms']} ms, "
+                            f"p95 {report['p95_ms']} ms, {report['hedges']} hedges "
+                            f"({report['hedge_wins']} won), {report['cancelled']} cancelled")
+
+    async def _route(self, what: str, call: Call):
+        _, result = await self._route_with_winner(what, call)
+        return result
+
+    async def _route_with_winner(self, what: str, call: Call,
+                                 stats: Optional[Dict[str, ProviderStats]] = None,
+                                 candidates: Optional[List[str]] = None) -> Tuple[str, Any]:
+        """The first good result and the provider it came from, trying ``candidates`` (default: all, ranked)"""
+        stats = stats if stats is not None else self.stats
+        remaining = list(candidates) if candidates is not None else self.ranked(stats)
+        errors = []
+        while remaining:
+            primary = remaining.pop(0)
+            attempts = {asyncio.ensure_future(self._timed(stats[primary], call)): primary}
+            delay = self._hedge_delay(stats[primary]) if remaining else None
+            if delay is not None:
+                try:
+                    done, _ = await asyncio.wait(attempts, timeout=delay)
+                except asyncio.CancelledError:
+                    for task in attempts:
+                        task.cancel()
+                    raise
+                if not done:
+                    backup = remaining.pop(0)
+                    stats[backup].hedges += 1
+                    logger.debug(f"{primary} slower than {delay * 1000:.0f} ms for {what}; hedging with {backup}")
+                    attempts[asyncio.ensure_future(self._timed(stats[backup], call))] = backup
+            winner, result = await self._first_good(attempts, errors)
+            if winner is not None:
+                if winner != primary:
+                    stats[winner].hedge_wins += 1
+                return winner, result
+        raise DataProviderError(f"No provider returned {what}: {'; '.join(errors)}")
+
+    def _hedge_delay(self, stats: ProviderStats) -> Optional[float]:
+        if stats.samples < self.min_samples:
+            return None
+        return stats.quantile(self.hedge_quantile)
+
+    async def _first_good(self, attempts: Dict[asyncio.Future, str], errors: List[str]):
+        """Wait for the first attempt to succeed; cancel the rest"""
+        pending: Set[asyncio.Future] = set(attempts)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return attempts[task], task.result()
+                    errors.append(f"{attempts[task]}: {error}")
+            return None, None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _timed(self, stats: ProviderStats, call: Call):
+        start = time.monotonic()
+        try:
+            result = await call(self.providers[stats.name])
+        except asyncio.CancelledError:
+            stats.record_cancelled(time.monotonic() - start)
+            raise
+        except NotImplementedError as e:
+            # Unsupported, not unhealthy: don't let it count against the provider
+            raise DataProviderError(str(e))
+        except Exception as e:
+            stats.record(time.monotonic() - start, False, str(e))
+            raise
+        if result is None or (isinstance(result, (pd.DataFrame, dict)) and len(result) == 0):
+            stats.record(time.monotonic() - start, False, "no data")
+            raise DataProviderError("no data")
+        stats.record(time.monotonic() - start, True)
+        return result
+
+
+def build_market_data_provider(config, request_tracker, data_config) -> MarketDataProvider:
+    """yfinance alone, or behind a CompositeProvider with local files when ``data_config.local_data_dir`` is set.
+
+    ``data_config`` is the scanner configuration's DataConfig section.
+    """
+    from .yfinance_provider import YFinanceProvider
+    yfinance = YFinanceProvider(config, request_tracker)
+    if not data_config.local_data_dir:
+        return yfinance
+    from .local_file_provider import LocalFileProvider
+    return CompositeProvider(
+        {'local': LocalFileProvider(data_config.local_data_dir), 'yfinance': yfinance},
+        hedge_quantile=data_config.hedge_quantile
+    )
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import pandas as pd
+from .provider_interface import DataProviderError, MarketDataProvider
+from trading_platform.application.utils.market_hours import (
+    MARKET_TZ, is_market_open, market_now, previous_market_close
+)
+from trading_platform.domain.models.instrument import Instrument
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = ('.parquet', '.csv')
+_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days', 'wk': 'weeks'}
+
+
+def _interval_length(interval: str) -> Optional[pd.Timedelta]:
+    for suffix, unit in _UNITS.items():
+        count = interval[:-len(suffix)]
+        if interval.endswith(suffix) and count.isdigit():
+            return pd.Timedelta(**{unit: int(count)})
+    return None
+
+
+class LocalFileProvider(MarketDataProvider):
+    """Bars from a directory of CSV or Parquet files (a local mirror or an export).
+
+    Files are named ``<SYMBOL>_<interval>.parquet`` or ``.csv``; daily bars
+    may also be plain ``<SYMBOL>.csv``. The first column is the timestamp.
+    Parquet needs pyarrow or fastparquet installed. A file is re-read only
+    when its modification time changes. A file that stops short of the
+    last bar the market could have produced before ``end_date`` is stale:
+    the request fails, so a CompositeProvider moves on to another provider.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._frames: Dict[str, Tuple[float, pd.DataFrame]] = {}
+
+    async def get_historical_data(self,
+                                instrument: Instrument,
+                                start_date: datetime,
+                                end_date: datetime,
+                                interval: str = '1d') -> pd.DataFrame:
+        path = self._path(instrument.symbol, interval)
+        if path is None:
+            raise DataProviderError(f"No local {interval} bars for {instrument.symbol}")
+        try:
+            frame = await asyncio.get_running_loop().run_in_executor(None, self._read, path)
+        except Exception as e:
+            logger.error(f"Error reading {path}: {str(e)}")
+            raise DataProviderError(f"Failed to read local data for {instrument.symbol}")
+
+        expected = self._expected_last_bar(end_date, interval)
+        if expected is not None and len(frame):
+            last = frame.index[-1]
+            if last.tz is None:
+                last = last.tz_localize(MARKET_TZ)
+            if last < expected:
+                raise DataProviderError(f"Local {interval} bars for {instrument.symbol} "
+                                        f"end at {frame.index[-1]}; stale")
+
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        if frame.index.tz is not None:
+            start = start.tz_localize(frame.index.tz) if start.tz is None else start
+            end = end.tz_localize(frame.index.tz) if end.tz is None else end
+        # End is exclusive, as with yfinance
+        return frame[(frame.index >= start) & (frame.index < end)]
+
+    async def get_options_data(self, instrument: Instrument) -> dict:
+        raise NotImplementedError(f"{type(self).__name__} does not provide options data")
+
+    @staticmethod
+    def _expected_last_bar(end_date: datetime, interval: str) -> Optional[pd.Timestamp]:
+        """Earliest acceptable start of a file's last bar for a request ending at ``end_date``"""
+        step = _interval_length(interval)
+        if step is None:
+            return None
+        cutoff = pd.Timestamp(end_date)
+        cutoff = cutoff.tz_localize(MARKET_TZ) if cutoff.tz is None else cutoff.tz_convert(MARKET_TZ)
+        cutoff = min(cutoff, pd.Timestamp(market_now()))
+        if step >= pd.Timedelta(days=1):
+            # The bar of the last completed session (or the period containing it)
+            last_session = pd.Timestamp(previous_market_close(cutoff).date()).tz_localize(MARKET_TZ)
+            return last_session - step + pd.Timedelta(days=1)
+        # One bar may still be in progress
+        last_open = cutoff if is_market_open(cutoff) else pd.Timestamp(previous_market_close(cutoff))
+        return last_open - 2 * step
+
+    def _path(self, symbol: str, interval: str) -> Optional[str]:
+        names = [f"{symbol}_{interval}"] + ([symbol] if interval == '1d' else [])
+        for name in names:
+            for extension in EXTENSIONS:
+                path = os.path.join(self.directory, name + extension)
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def _read(self, path: str) -> pd.DataFrame:
+        mtime = os.path.getmtime(path)
+        cached = self._frames.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if path.endswith('.parquet'):
+            frame = pd.read_parquet(path)
+            if not isinstance(frame.index, pd.DatetimeIndex):
+                frame = frame.set_index(frame.columns[0])
+        else:
+            frame = pd.read_csv(path, index_col=0)
+        try:
+            frame.index = pd.to_datetime(frame.index)
+        except ValueError:
+            # Offsets that change with DST
+            frame.index = pd.to_datetime(frame.index, utc=True)
+        frame = frame.sort_index()
+        self._frames[path] = (mtime, frame)
+        return frame
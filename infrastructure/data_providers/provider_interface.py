@@ -1,8 +1,13 @@
+import asyncio
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Optional
 import pandas as pd
 from trading_platform.domain.models.instrument import Instrument
 
+class DataProviderError(Exception):
+    pass
+
 class MarketDataProvider(ABC):
     @abstractmethod
     async def get_historical_data(self, 
@@ -14,4 +19,32 @@ class MarketDataProvider(ABC):
     
     @abstractmethod
     async def get_options_data(self, instrument: Instrument) -> dict:  # Python 3.9+ syntax
-        pass
\ No newline at end of file
+        pass
+
+    async def get_bulk_historical_data(self,
+                                       symbols: list[str],
+                                       start: date,
+                                       end: Optional[date] = None) -> dict[str, pd.DataFrame]:
+        """Daily bars for many symbols, keyed by symbol; symbols without bars are left out.
+
+        ``end`` is exclusive (None: up to now). Bars are split- and dividend-
+        adjusted, with 'Dividends' and 'Stock Splits' columns where the source
+        has them. This default fetches the symbols one by one, concurrently.
+        """
+        start_date = datetime.combine(start, datetime.min.time())
+        end_date = datetime.combine(end, datetime.min.time()) if end is not None else datetime.now() + timedelta(days=1)
+        frames = await asyncio.gather(*(
+            self.get_historical_data(Instrument(symbol), start_date, end_date) for symbol in symbols
+        ), return_exceptions=True)
+        return {
+            symbol: frame for symbol, frame in zip(symbols, frames)
+            if isinstance(frame, pd.DataFrame) and not frame.empty
+        }
+
+    async def get_option_expirations(self, instrument: Instrument) -> list[str]:
+        """Expiration dates (YYYY-MM-DD) with listed options"""
+        raise NotImplementedError(f"{type(self).__name__} does not provide options data")
+
+    async def get_option_chain(self, instrument: Instrument, expiration: str) -> dict[str, pd.DataFrame]:
+        """Calls and puts for one expiration, as {'calls': df, 'puts': df}"""
+        raise NotImplementedError(f"{type(self).__name__} does not provide options data")
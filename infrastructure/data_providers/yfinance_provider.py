@@ -1,37 +1,40 @@
 import asyncio
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 import pandas as pd
-import yfinance as yf
 from concurrent.futures import ThreadPoolExecutor
-from ratelimit import limits, sleep_and_retry
 import logging
-from .provider_interface import MarketDataProvider
+from .provider_interface import DataProviderError, MarketDataProvider
 from trading_platform.domain.models.instrument import Instrument
 from trading_platform.config import Config, RequestTracker
+from trading_platform.application.utils.async_utils import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
-class DataProviderError(Exception):
-    pass
+def _yf():
+    # yfinance is slow to import; load it on the first request, not with the module
+    import yfinance
+    return yfinance
 
 class YFinanceProvider(MarketDataProvider):
     def __init__(self, config: Config, request_tracker: RequestTracker):
         self.config = config
         self.request_tracker = request_tracker
         self.executor = ThreadPoolExecutor()
+        # Awaitable limiter: concurrent callers queue up without blocking the event loop
+        self.history_rate_limiter = AsyncRateLimiter(1, 1, burst=config.stock_request_burst)
 
-    @sleep_and_retry
-    @limits(calls=1, period=1)
     async def get_historical_data(self,
                                 instrument: Instrument,
                                 start_date: datetime,
                                 end_date: datetime,
                                 interval: str = '1d') -> pd.DataFrame:
         try:
+            await self.history_rate_limiter.acquire()
             self.request_tracker.log_stock_request()
             stock = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
-                lambda: yf.Ticker(instrument.symbol)
+                lambda: _yf().Ticker(instrument.symbol)
             )
             
             df = await asyncio.get_event_loop().run_in_executor(
@@ -44,20 +47,60 @@ class YFinanceProvider(MarketDataProvider):
             logger.error(f"Error fetching historical data: {str(e)}")
             raise DataProviderError(f"Failed to fetch data for {instrument.symbol}")
             
+    async def get_bulk_historical_data(self,
+                                       symbols: list[str],
+                                       start: date,
+                                       end: Optional[date] = None) -> dict[str, pd.DataFrame]:
+        """One yf.download request for the whole batch (yfinance threads it per symbol)"""
+        try:
+            await self.history_rate_limiter.acquire()
+            self.request_tracker.log_stock_request()
+            data = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                lambda: _yf().download(
+                    symbols, start=str(start), end=str(end) if end is not None else None,
+                    group_by='ticker', auto_adjust=True, actions=True, threads=True, progress=False
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error downloading bars for {len(symbols)} symbols: {str(e)}")
+            raise DataProviderError(f"Failed to download bars for {len(symbols)} symbols")
+        
+        if isinstance(data.columns, pd.MultiIndex):
+            available = set(data.columns.get_level_values(0))
+            frames = {symbol: data[symbol] for symbol in symbols if symbol in available}
+        elif len(symbols) == 1:
+            frames = {symbols[0]: data}
+        else:
+            frames = {}
+        # Symbols missing from a batch come back as all-NaN rows
+        frames = {symbol: frame.dropna(how='all') for symbol, frame in frames.items()}
+        return {symbol: frame for symbol, frame in frames.items() if len(frame)}
+
     async def get_options_data(self, instrument: Instrument):  # Removed return type hint
+        return {'expiration_dates': await self.get_option_expirations(instrument)}
+
+    async def get_option_expirations(self, instrument: Instrument) -> list[str]:
         try:
             self.request_tracker.log_options_request()
-            stock = await asyncio.get_event_loop().run_in_executor(
+            return list(await asyncio.get_running_loop().run_in_executor(
                 self.executor,
-                lambda: yf.Ticker(instrument.symbol)
-            )
-            
-            options_data = await asyncio.get_event_loop().run_in_executor(
+                lambda: _yf().Ticker(instrument.symbol).options
+            ))
+        except Exception as e:
+            logger.error(f"Error fetching option expirations: {str(e)}")
+            raise DataProviderError(f"Failed to fetch option expirations for {instrument.symbol}")
+
+    async def get_option_chain(self, instrument: Instrument, expiration: str) -> dict[str, pd.DataFrame]:
+        try:
+            self.request_tracker.log_options_request()
+            chain = await asyncio.get_running_loop().run_in_executor(
                 self.executor,
-                lambda: stock.options
+                lambda: _yf().Ticker(instrument.symbol).option_chain(expiration)
             )
-            
-            return {'expiration_dates': options_data}
+            return {'calls': chain.calls, 'puts': chain.puts}
         except Exception as e:
-            logger.error(f"Error fetching options data: {str(e)}")
-            raise DataProviderError(f"Failed to fetch options data for {instrument.symbol}")
\ No newline at end of file
+            logger.error(f"Error fetching option chain: {str(e)}")
+            raise DataProviderError(
+                f"Failed to fetch {expiration} option chain for {instrument.symbol}"
+            )
@@ -0,0 +1,55 @@
+import asyncio
+import inspect
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Any], Any]
+
+
+class InMemoryEventBus:
+    """In-process publish/subscribe keyed by event class.
+
+    Handlers may be plain functions or coroutines; a handler registered
+    for a base class also receives its subclasses. A failing handler is
+    logged and does not affect the others or the publisher.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Type, List[Handler]] = defaultdict(list)
+
+    def subscribe(self, event_type: Type, handler: Handler):
+        self._handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type: Type, handler: Handler):
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def subscribe_queue(self, event_type: Type, maxsize: int = 1000) -> asyncio.Queue:
+        """Deliver events into a bounded queue; when it is full the oldest event is dropped"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+        def enqueue(event):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+        queue.handler = enqueue
+        self.subscribe(event_type, enqueue)
+        return queue
+
+    def unsubscribe_queue(self, event_type: Type, queue: asyncio.Queue):
+        self.unsubscribe(event_type, queue.handler)
+
+    async def publish(self, event: Any):
+        for event_type in type(event).__mro__:
+            for handler in list(self._handlers.get(event_type, ())):
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Error in {type(event).__name__} handler {handler!r}: {str(e)}")
@@ -0,0 +1,416 @@
+import asyncio
+import dataclasses
+import inspect
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type
+import numpy as np
+import pandas as pd
+from trading_platform.domain.events.market_event import MarketEvent, SignalEvent
+from trading_platform.domain.models.instrument import Instrument, Signal
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'TPEVLOG1'
+SEGMENT_SUFFIX = '.seg'
+INDEX_SUFFIX = '.idx.npy'
+
+# Record header: payload length, CRC32 of symbol + payload, kind, timestamp (ns), symbol length.
+# The symbol follows, then padding so the payload starts 8-byte aligned.
+_RECORD = struct.Struct('<IIBqH')
+# Bar block header: rows, columns, metadata length; then metadata JSON, padding,
+# the int64 index and one float64 array per column
+_BLOCK = struct.Struct('<IHI')
+
+MARKET_BARS = 1     # MarketEvent whose data is a bar DataFrame, stored as a columnar block
+MARKET = 2          # Any other MarketEvent, as JSON
+SIGNAL = 3          # SignalEvent, as JSON
+
+KIND_TYPES = {MARKET_BARS: MarketEvent, MARKET: MarketEvent, SIGNAL: SignalEvent}
+
+INDEX_DTYPE = np.dtype([('timestamp', '<i8'), ('offset', '<i8'), ('kind', 'u1'), ('symbol', 'S16')])
+
+
+class EventLogError(Exception):
+    pass
+
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+
+def _ns(ts: datetime) -> int:
+    return pd.Timestamp(ts).value
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _encode_bars(event: MarketEvent) -> bytes:
+    frame: pd.DataFrame = event.data
+    index = frame.index
+    meta = {
+        'columns': [str(c) for c in frame.columns],
+        'dtypes': [str(dtype) for dtype in frame.dtypes],
+        'tz': str(index.tz) if getattr(index, 'tz', None) is not None else None,
+        'event_type': event.event_type,
+        'price': str(event.price) if event.price is not None else None,
+        'instrument': dataclasses.asdict(event.instrument),
+    }
+    meta_bytes = json.dumps(meta, separators=(',', ':')).encode()
+    head = _BLOCK.pack(len(frame), len(frame.columns), len(meta_bytes)) + meta_bytes
+    head += b'\0' * _pad(len(head))
+    # Aware indexes are stored as UTC, which (unlike wall time) is unambiguous across DST
+    stamps = pd.DatetimeIndex(index).tz_convert('UTC').tz_localize(None) if meta['tz'] else pd.DatetimeIndex(index)
+    values = frame.to_numpy(dtype=np.float64)
+    # Columnar: the index, then each column contiguously
+    nanos = stamps.to_numpy().astype('datetime64[ns]').view('<i8')
+    return head + nanos.tobytes() + np.ascontiguousarray(values.T, dtype='<f8').tobytes()
+
+
+def _decode_bars(buffer, start: int, timestamp: int) -> MarketEvent:
+    rows, n_columns, meta_len = _BLOCK.unpack_from(buffer, start)
+    pos = start + _BLOCK.size
+    meta = json.loads(bytes(buffer[pos:pos + meta_len]))
+    pos += meta_len
+    pos += _pad(pos - start)
+    index = np.frombuffer(buffer, dtype='<i8', count=rows, offset=pos)
+    pos += 8 * rows
+    columns = np.frombuffer(buffer, dtype='<f8', count=rows * n_columns, offset=pos).reshape(n_columns, rows)
+    stamps = pd.DatetimeIndex(index.astype('datetime64[ns]'))
+    if meta['tz']:
+        stamps = stamps.tz_localize('UTC').tz_convert(meta['tz'])
+    # Copied off the map so frames outlive the reader
+    values = columns.copy()
+    if all(dtype == 'float64' for dtype in meta['dtypes']):
+        frame = pd.DataFrame(values.T, index=stamps, columns=meta['columns'])
+    else:
+        frame = pd.DataFrame(
+            {name: values[i] if dtype == 'float64' else values[i].astype(dtype)
+             for i, (name, dtype) in enumerate(zip(meta['columns'], meta['dtypes']))},
+            index=stamps, copy=False
+        )
+    return MarketEvent(
+        instrument=Instrument(**meta['instrument']),
+        price=Decimal(meta['price']) if meta['price'] is not None else None,
+        timestamp=pd.Timestamp(timestamp).to_pydatetime(),
+        event_type=meta['event_type'],
+        data=frame,
+    )
+
+
+def _encode_json(event) -> bytes:
+    return json.dumps(dataclasses.asdict(event), separators=(',', ':'), default=_json_default).encode()
+
+
+def _decode_market(payload: Dict, timestamp: int) -> MarketEvent:
+    return MarketEvent(
+        instrument=Instrument(**payload['instrument']),
+        price=Decimal(payload['price']) if payload['price'] is not None else None,
+        timestamp=pd.Timestamp(timestamp).to_pydatetime(),
+        event_type=payload['event_type'],
+        data=payload['data'],
+    )
+
+
+def _decode_signal(payload: Dict, timestamp: int) -> SignalEvent:
+    signal = payload['signal']
+    signal['instrument'] = Instrument(**signal['instrument'])
+    signal['price'] = Decimal(signal['price'])
+    signal['timestamp'] = datetime.fromisoformat(signal['timestamp'])
+    return SignalEvent(signal=Signal(**signal), timestamp=pd.Timestamp(timestamp).to_pydatetime())
+
+
+def _symbol_of(event) -> str:
+    instrument = event.signal.instrument if isinstance(event, SignalEvent) else event.instrument
+    return instrument.symbol
+
+
+def _segment_name(sequence: int) -> str:
+    return f"{sequence:08d}"
+
+
+def _scan_segment(buffer, size: int) -> Tuple[np.ndarray, int]:
+    """Index a segment's records; returns the index and the length of its valid prefix"""
+    entries = []
+    pos = len(MAGIC)
+    while pos + _RECORD.size <= size:
+        length, crc, kind, timestamp, symbol_len = _RECORD.unpack_from(buffer, pos)
+        body = pos + _RECORD.size
+        payload = body + symbol_len + _pad(body + symbol_len)
+        end = payload + length
+        if kind not in KIND_TYPES or end > size:
+            break
+        symbol = bytes(buffer[body:body + symbol_len])
+        if zlib.crc32(buffer[payload:end], zlib.crc32(symbol)) != crc:
+            break
+        entries.append((timestamp, pos, kind, symbol))
+        pos = end
+    return np.array(entries, dtype=INDEX_DTYPE), pos
+
+
+class EventLog:
+    """Append-only, segmented binary log of MarketEvents and SignalEvents.
+
+    Each segment is a run of checksummed records: bar payloads as columnar
+    blocks (an int64 index plus one float64 array per column, 8-byte
+    aligned so readers can map them straight out of the file), everything
+    else as JSON. A segment is sealed once it reaches ``segment_bytes`` and
+    gets a sidecar index of (timestamp, offset, kind, symbol). A record torn
+    by a crash is cut off when the log is reopened.
+
+    ``append`` writes synchronously and is not thread-safe. Events from an
+    attached bus are encoded and written in order on one writer thread, never
+    on the event loop; ``drain`` waits for them.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024, fsync: bool = False):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self.appended = 0
+        # Index entries of the active segment, so sealing doesn't re-read it
+        self._entries: List[Tuple[int, int, int, bytes]] = []
+        self._writes: Set[asyncio.Future] = set()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='event-log-writer')
+        os.makedirs(directory, exist_ok=True)
+        sequences = _segment_sequences(directory)
+        self._sequence = sequences[-1] if sequences else 0
+        self._file = None
+        if sequences and os.path.exists(self._path(INDEX_SUFFIX)):
+            # Sealed before a crash, before its successor was created
+            self._sequence += 1
+            sequences = []
+        self._open_segment(resume=bool(sequences))
+
+    def append(self, event) -> int:
+        """Write one event; returns its offset in the current segment"""
+        if isinstance(event, SignalEvent):
+            kind, payload = SIGNAL, _encode_json(event)
+        elif isinstance(event, MarketEvent):
+            if isinstance(event.data, pd.DataFrame):
+                kind, payload = MARKET_BARS, _encode_bars(event)
+            else:
+                kind, payload = MARKET, _encode_json(event)
+        else:
+            raise EventLogError(f"Cannot log {type(event).__name__}")
+
+        symbol = _symbol_of(event).encode()
+        timestamp = _ns(event.timestamp)
+        offset = self._file.tell()
+        body = offset + _RECORD.size + len(symbol)
+        crc = zlib.crc32(payload, zlib.crc32(symbol))
+        self._file.write(_RECORD.pack(len(payload), crc, kind, timestamp, len(symbol))
+                         + symbol + b'\0' * _pad(body) + payload)
+        self._entries.append((timestamp, offset, kind, symbol))
+        self.appended += 1
+        if self._file.tell() >= self.segment_bytes:
+            self._seal()
+            self._sequence += 1
+            self._open_segment(resume=False)
+        return offset
+
+    def attach(self, event_bus):
+        """Record every MarketEvent and SignalEvent published on the bus"""
+        event_bus.subscribe(MarketEvent, self._on_event)
+        event_bus.subscribe(SignalEvent, self._on_event)
+
+    def detach(self, event_bus):
+        event_bus.unsubscribe(MarketEvent, self._on_event)
+        event_bus.unsubscribe(SignalEvent, self._on_event)
+
+    async def drain(self):
+        """Wait until every event received from a bus has been written"""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def flush(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Finish queued writes and close the active segment"""
+        self._writer.shutdown(wait=True)
+        self._close_segment()
+
+    def __enter__(self) -> 'EventLog':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _on_event(self, event):
+        future = asyncio.get_running_loop().run_in_executor(self._writer, self.append, event)
+        self._writes.add(future)
+        future.add_done_callback(self._write_done)
+
+    def _write_done(self, future: asyncio.Future):
+        self._writes.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Error writing to event log {self.directory}: {str(future.exception())}")
+
+    def _close_segment(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def _path(self, suffix: str = SEGMENT_SUFFIX) -> str:
+        return os.path.join(self.directory, _segment_name(self._sequence) + suffix)
+
+    def _open_segment(self, resume: bool):
+        path = self._path()
+        if resume and os.path.getsize(path) > len(MAGIC):
+            with open(path, 'rb') as f:
+                data = f.read()
+            if data[:len(MAGIC)] != MAGIC:
+                raise EventLogError(f"{path} is not an event log segment")
+            index, valid = _scan_segment(data, len(data))
+            self._entries = [tuple(entry) for entry in index.tolist()]
+            if valid < len(data):
+                logger.warning(f"Dropping {len(data) - valid} bytes of partial records from {path}")
+                with open(path, 'r+b') as f:
+                    f.truncate(valid)
+            self._file = open(path, 'ab')
+            return
+        self._entries = []
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+
+    def _seal(self):
+        self._close_segment()
+        np.save(self._path(INDEX_SUFFIX), np.array(self._entries, dtype=INDEX_DTYPE))
+
+
+def _segment_sequences(directory: str) -> List[int]:
+    if not os.path.isdir(directory):
+        return []
+    return sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(directory)
+                  if name.endswith(SEGMENT_SUFFIX) and name[:-len(SEGMENT_SUFFIX)].isdigit())
+
+
+class EventLogReader:
+    """Memory-mapped reader over an EventLog directory.
+
+    Records are selected through the segment indexes (sidecar files for
+    sealed segments, a header-only scan for the active one), so filtering
+    by time, symbol or event type never decodes a payload it skips.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._segments: List[Tuple[mmap.mmap, np.ndarray]] = []
+        for sequence in _segment_sequences(directory):
+            path = os.path.join(directory, _segment_name(sequence) + SEGMENT_SUFFIX)
+            if os.path.getsize(path) <= len(MAGIC):
+                continue
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            index_path = os.path.join(directory, _segment_name(sequence) + INDEX_SUFFIX)
+            if os.path.exists(index_path):
+                index = np.load(index_path)
+            else:
+                index, _ = _scan_segment(buffer, len(buffer))
+            self._segments.append((buffer, index))
+
+    def __len__(self) -> int:
+        return sum(len(index) for _, index in self._segments)
+
+    def select(self,
+               start: Optional[datetime] = None,
+               end: Optional[datetime] = None,
+               symbols: Optional[Iterable[str]] = None,
+               types: Optional[Sequence[Type]] = None) -> Iterator[Tuple[mmap.mmap, np.void]]:
+        """Index entries matching the filters, in log order; ``end`` is exclusive"""
+        wanted_symbols = np.array([s.encode() for s in symbols], dtype='S16') if symbols is not None else None
+        wanted_kinds = [kind for kind, cls in KIND_TYPES.items() if types is None or cls in types]
+        for buffer, index in self._segments:
+            mask = np.isin(index['kind'], wanted_kinds)
+            if start is not None:
+                mask &= index['timestamp'] >= _ns(start)
+            if end is not None:
+                mask &= index['timestamp'] < _ns(end)
+            if wanted_symbols is not None:
+                mask &= np.isin(index['symbol'], wanted_symbols)
+            for entry in index[mask]:
+                yield buffer, entry
+
+    def read(self, **filters) -> Iterator[Any]:
+        """Decoded events matching ``select``'s filters"""
+        for buffer, entry in self.select(**filters):
+            yield self._decode(buffer, entry)
+
+    def bars(self, **filters) -> Dict[str, pd.DataFrame]:
+        """Every recorded bar block per symbol, concatenated into one frame (later records win)"""
+        filters['types'] = (MarketEvent,)
+        blocks: Dict[str, List[pd.DataFrame]] = {}
+        for buffer, entry in self.select(**filters):
+            if entry['kind'] == MARKET_BARS:
+                event = self._decode(buffer, entry)
+                blocks.setdefault(event.instrument.symbol, []).append(event.data)
+        result = {}
+        for symbol, frames in blocks.items():
+            frame = pd.concat(frames) if len(frames) > 1 else frames[0]
+            result[symbol] = frame[~frame.index.duplicated(keep='last')].sort_index()
+        return result
+
+    async def replay(self, target, **filters) -> int:
+        """Publish events to an event bus (or pass them to a handler) as fast as they decode; returns the count"""
+        publish: Callable = target.publish if hasattr(target, 'publish') else target
+        count = 0
+        for event in self.read(**filters):
+            result = publish(event)
+            if inspect.isawaitable(result):
+                await result
+            count += 1
+        return count
+
+    async def replay_strategy(self, strategy, **filters) -> AsyncIterator[Signal]:
+        """Run a strategy over the recorded bars, yielding the signals it produces"""
+        filters['types'] = (MarketEvent,)
+        for buffer, entry in self.select(**filters):
+            if entry['kind'] != MARKET_BARS:
+                continue
+            event = self._decode(buffer, entry)
+            signal = await strategy.analyze(event.data, event.instrument)
+            if signal is not None:
+                yield signal
+
+    def close(self):
+        for buffer, _ in self._segments:
+            buffer.close()
+        self._segments = []
+
+    def __enter__(self) -> 'EventLogReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _decode(buffer, entry):
+        offset = int(entry['offset'])
+        length, _, kind, timestamp, symbol_len = _RECORD.unpack_from(buffer, offset)
+        body = offset + _RECORD.size + symbol_len
+        payload = body + _pad(body)
+        if kind == MARKET_BARS:
+            return _decode_bars(buffer, payload, timestamp)
+        document = json.loads(buffer[payload:payload + length])
+        if kind == SIGNAL:
+            return _decode_signal(document, timestamp)
+        return _decode_market(document, timestamp)
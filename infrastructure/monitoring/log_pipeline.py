@@ -0,0 +1,243 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Fields every LogRecord carries; anything else was passed through ``extra``
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+class TextFormatter(logging.Formatter):
+    """Plain text formatter that notes records dropped by the symbol filter"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            text += f" ({suppressed} earlier messages for {record.symbol} suppressed)"
+        return text
+
+
+class ColorFormatter(TextFormatter):
+    """Formatter that colorizes messages by level (and success style)"""
+
+    def __init__(self, fmt: str, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        from colorama import init, Fore, Style
+        init()
+        self.reset = Style.RESET_ALL
+        self.colors = {
+            logging.DEBUG: Style.DIM,
+            logging.INFO: Fore.GREEN,
+            logging.WARNING: Fore.YELLOW,
+            logging.ERROR: Fore.RED,
+            logging.CRITICAL: Fore.RED + Style.BRIGHT,
+        }
+        self.success_color = Fore.CYAN
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        if getattr(record, 'style', None) == 'success':
+            color = self.success_color
+        else:
+            color = self.colors.get(record.levelno, '')
+        return f"{color}{text}{self.reset}"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers in production"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SymbolRateLimitFilter(logging.Filter):
+    """Sample and rate limit records tagged with a ``symbol``.
+
+    Records below WARNING are sampled (1 in ``sample_rate``) and every
+    symbol gets a token bucket of ``burst`` records refilled at ``rate``
+    per second. Records without a symbol always pass. The number of
+    dropped records is reported on the next record that gets through.
+    """
+
+    def __init__(self, sample_rate: int = 1, rate: float = 5.0, burst: int = 10):
+        super().__init__()
+        self.sample_rate = max(1, sample_rate)
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        symbol = getattr(record, 'symbol', None)
+        if symbol is None:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            # [tokens, last refill, records seen, records dropped]
+            bucket = self._buckets.get(symbol)
+            if bucket is None:
+                bucket = self._buckets[symbol] = [float(self.burst), now, 0, 0]
+            bucket[2] += 1
+
+            if record.levelno < logging.WARNING and (bucket[2] - 1) % self.sample_rate:
+                bucket[3] += 1
+                return False
+
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[3] += 1
+                return False
+            bucket[0] -= 1
+
+            if bucket[3]:
+                record.suppressed = bucket[3]
+                bucket[3] = 0
+        return True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves message formatting to the writer thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class LogPipeline:
+    """Queue-based logging: callers enqueue records, a background thread writes them"""
+
+    def __init__(self,
+                 level: str = 'INFO',
+                 json_output: bool = False,
+                 color: Optional[bool] = None,
+                 symbol_sample_rate: int = 1,
+                 symbol_rate_limit: float = 5.0,
+                 symbol_burst: int = 10,
+                 stream=None):
+        stream = stream or sys.stderr
+        if json_output:
+            formatter = JsonFormatter()
+        else:
+            if color is None:
+                color = hasattr(stream, 'isatty') and stream.isatty()
+            fmt = '%(asctime)s - %(levelname)s - %(message)s'
+            datefmt = '%Y-%m-%d %H:%M:%S'
+            formatter = ColorFormatter(fmt, datefmt) if color else TextFormatter(fmt, datefmt)
+
+        self.stream_handler = logging.StreamHandler(stream)
+        self.stream_handler.setFormatter(formatter)
+
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = _DeferredQueueHandler(self.queue)
+        self.queue_handler.addFilter(
+            SymbolRateLimitFilter(symbol_sample_rate, symbol_rate_limit, symbol_burst)
+        )
+        self.listener = logging.handlers.QueueListener(
+            self.queue, self.stream_handler, respect_handler_level=True
+        )
+        self.level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+
+    def start(self):
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(self.level)
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Flush pending records and stop the writer thread"""
+        if self.listener._thread is not None:
+            self.listener.stop()
+        self.stream_handler.flush()
+
+
+def configure_logging(logging_config=None, **overrides) -> LogPipeline:
+    """Install the logging pipeline on the root logger, replacing any previous one"""
+    global _pipeline
+    options = {}
+    if logging_config is not None:
+        options = {
+            'level': logging_config.level,
+            'json_output': logging_config.json_output,
+            'color': logging_config.color,
+            'symbol_sample_rate': logging_config.symbol_sample_rate,
+            'symbol_rate_limit': logging_config.symbol_rate_limit,
+            'symbol_burst': logging_config.symbol_burst,
+        }
+    options.update(overrides)
+
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+        _pipeline = LogPipeline(**options)
+        _pipeline.start()
+        return _pipeline
+
+
+def _ensure_logging():
+    # Mirror basicConfig: only install a default pipeline if nobody configured logging
+    if _pipeline is None and not logging.getLogger().handlers:
+        configure_logging()
+
+
+class ScanLogger:
+    """Logger for per-symbol scan output with lazy %-style formatting.
+
+    Arguments are only interpolated by the writer thread, and nothing is
+    built at all when the level is disabled. Pass ``symbol=`` to make a
+    record subject to per-symbol sampling and rate limiting.
+    """
+
+    def __init__(self, name: str):
+        _ensure_logging()
+        self.logger = logging.getLogger(name)
+
+    def _log(self, level: int, msg: str, args: tuple, symbol: Optional[str],
+             style: Optional[str] = None, exc_info=None):
+        if not self.logger.isEnabledFor(level):
+            return
+        extra = {}
+        if symbol is not None:
+            extra['symbol'] = symbol
+        if style is not None:
+            extra['style'] = style
+        self.logger.log(level, msg, *args, exc_info=exc_info, extra=extra or None, stacklevel=3)
+
+    def debug(self, msg: str, *args, symbol: Optional[str] = None):
+        self._log(logging.DEBUG, msg, args, symbol)
+
+    def info(self, msg: str, *args, symbol: Optional[str] = None):
+        self._log(logging.INFO, msg, args, symbol)
+
+    def warning(self, msg: str, *args, symbol: Optional[str] = None):
+        self._log(logging.WARNING, msg, args, symbol)
+
+    def error(self, msg: str, *args, symbol: Optional[str] = None, exc_info=None):
+        self._log(logging.ERROR, msg, args, symbol, exc_info=exc_info)
+
+    def success(self, msg: str, *args, symbol: Optional[str] = None):
+        self._log(logging.INFO, msg, args, symbol, style='success')
@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ShardTask:
+    scan_id: str
+    shard_index: int
+    symbols: List[str]
+    attempt: int = 0
+    reply_to: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ShardTask':
+        return cls(**data)
+
+
+@dataclass
+class ShardResult:
+    scan_id: str
+    shard_index: int
+    attempt: int
+    worker_id: str
+    results: List[Dict] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    funnel: Dict = field(default_factory=dict)
+    started: bool = False   # A notice that a worker picked the shard up, not a result
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ShardResult':
+        return cls(**data)
+
+
+class ScanBroker(ABC):
+    """Transport between a ScanCoordinator and its workers"""
+
+    async def start(self, scan_id: str):
+        pass
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def submit(self, task: ShardTask):
+        pass
+
+    @abstractmethod
+    async def next_result(self, timeout: float) -> Optional[ShardResult]:
+        """Next shard result or pickup notice, or None if nothing arrived within ``timeout``"""
+        pass
+
+
+class WorkerBroker(ScanBroker):
+    """A broker that also serves ScanWorkers running their own consume loop"""
+
+    @abstractmethod
+    async def next_task(self) -> ShardTask:
+        pass
+
+    @abstractmethod
+    async def publish_started(self, task: ShardTask, worker_id: str):
+        """Tell the coordinator a worker has picked the task up"""
+        pass
+
+    @abstractmethod
+    async def publish_result(self, task: ShardTask, result: ShardResult):
+        pass
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Optional, Tuple
+import aio_pika
+from .broker_interface import ShardResult, ShardTask, WorkerBroker
+
+logger = logging.getLogger(__name__)
+
+TASK_QUEUE = "scan.shards"
+
+
+def _json_default(value):
+    # numpy scalars and anything else exposing .item()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class AmqpScanBroker(WorkerBroker):
+    """Shard distribution over RabbitMQ, for workers running on other hosts.
+
+    Tasks go to a shared durable queue; each scan gets its own reply queue.
+    A worker only acks a task after publishing its result, so shards held
+    by a worker that dies are redelivered to another one.
+    """
+
+    def __init__(self, connection_url: str):
+        self.connection_url = connection_url
+        self.connection = None
+        self.channel = None
+        self.task_queue = None
+        self.result_queue = None
+        self._results: asyncio.Queue = asyncio.Queue()
+        self._tasks: Optional[asyncio.Queue] = None
+        self._inflight: Dict[Tuple[str, int, int], aio_pika.abc.AbstractIncomingMessage] = {}
+
+    async def connect(self):
+        if self.connection is None:
+            self.connection = await aio_pika.connect_robust(self.connection_url)
+            self.channel = await self.connection.channel()
+            await self.channel.set_qos(prefetch_count=1)
+            self.task_queue = await self.channel.declare_queue(TASK_QUEUE, durable=True)
+
+    async def start(self, scan_id: str):
+        await self.connect()
+        self.result_queue = await self.channel.declare_queue(
+            f"scan.results.{scan_id}", auto_delete=True
+        )
+        await self.result_queue.consume(self._on_result)
+
+    async def _on_result(self, message: aio_pika.abc.AbstractIncomingMessage):
+        async with message.process():
+            await self._results.put(ShardResult.from_dict(json.loads(message.body)))
+
+    async def _on_task(self, message: aio_pika.abc.AbstractIncomingMessage):
+        task = ShardTask.from_dict(json.loads(message.body))
+        self._inflight[(task.scan_id, task.shard_index, task.attempt)] = message
+        await self._tasks.put(task)
+
+    async def close(self):
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+
+    async def _publish(self, routing_key: str, payload: Dict):
+        await self.channel.default_exchange.publish(
+            aio_pika.Message(
+                body=json.dumps(payload, default=_json_default).encode(),
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+            ),
+            routing_key=routing_key
+        )
+
+    async def submit(self, task: ShardTask):
+        task.reply_to = self.result_queue.name
+        await self._publish(TASK_QUEUE, task.to_dict())
+
+    async def next_result(self, timeout: float) -> Optional[ShardResult]:
+        try:
+            return await asyncio.wait_for(self._results.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def next_task(self) -> ShardTask:
+        if self._tasks is None:
+            await self.connect()
+            self._tasks = asyncio.Queue()
+            await self.task_queue.consume(self._on_task)
+        return await self._tasks.get()
+
+    async def publish_started(self, task: ShardTask, worker_id: str):
+        # Not acked: the task stays with this worker until its result is published
+        await self._publish(task.reply_to, ShardResult(task.scan_id, task.shard_index, task.attempt,
+                                                       worker_id, started=True).to_dict())
+
+    async def publish_result(self, task: ShardTask, result: ShardResult):
+        await self._publish(task.reply_to, result.to_dict())
+        message = self._inflight.pop((task.scan_id, task.shard_index, task.attempt), None)
+        if message is not None:
+            await message.ack()
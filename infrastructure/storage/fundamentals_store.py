@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompanyFundamentals:
+    symbol: str
+    company_name: str = ''
+    sector: str = ''
+    industry: str = ''
+    market_cap: int = 0
+    shares_outstanding: int = 0
+    beta: Optional[float] = None
+    currency: str = ''
+    updated_at: float = 0.0  # epoch seconds; 0 = never fetched from the provider
+
+
+def _fetch_from_yfinance(symbol: str) -> CompanyFundamentals:
+    import yfinance as yf
+    info = yf.Ticker(symbol).info
+    return CompanyFundamentals(
+        symbol=symbol,
+        company_name=info.get('longName') or info.get('shortName', ''),
+        sector=info.get('sector', ''),
+        industry=info.get('industry', ''),
+        market_cap=info.get('marketCap') or 0,
+        shares_outstanding=info.get('sharesOutstanding') or 0,
+        beta=info.get('beta'),
+        currency=info.get('currency', ''),
+        updated_at=time.time()
+    )
+
+
+class FundamentalsStore:
+    """In-memory company metadata with bulk background refresh and a disk snapshot.
+
+    Lookups never touch the network: scans read whatever is in memory and
+    stale or missing symbols are refreshed in bulk by ``refresh`` (or the
+    scheduled loop started with ``start``), then written back to disk.
+    Fetches run on a pool kept until ``stop``, which drops queued fetches
+    rather than waiting on them.
+    """
+
+    def __init__(self,
+                 path: str,
+                 max_age_hours: float = 24.0,
+                 refresh_concurrency: int = 8,
+                 save_every: int = 200,
+                 fetcher: Callable[[str], CompanyFundamentals] = _fetch_from_yfinance):
+        self.path = path
+        self.max_age = max_age_hours * 3600
+        self.refresh_concurrency = refresh_concurrency
+        self.save_every = save_every
+        self.fetcher = fetcher
+        self._data: Dict[str, CompanyFundamentals] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.load()
+
+    def get(self, symbol: str) -> Optional[CompanyFundamentals]:
+        return self._data.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def seed(self, entries: Iterable[CompanyFundamentals]):
+        """Fill in symbols we know nothing about (e.g. from the universe snapshot)"""
+        for entry in entries:
+            self._data.setdefault(entry.symbol, entry)
+
+    def stale_symbols(self, symbols: Iterable[str]) -> List[str]:
+        cutoff = time.time() - self.max_age
+        stale = []
+        for symbol in symbols:
+            entry = self._data.get(symbol)
+            if entry is None or entry.updated_at < cutoff:
+                stale.append(symbol)
+        return stale
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading fundamentals from {self.path}: {str(e)}")
+            return
+        self._data = {symbol: CompanyFundamentals(**entry) for symbol, entry in raw.items()}
+        logger.info(f"Loaded fundamentals for {len(self._data)} symbols")
+
+    def save(self):
+        self._write({symbol: asdict(entry) for symbol, entry in self._data.items()})
+
+    def _write(self, payload: Dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.path)
+
+    async def refresh(self, symbols: Iterable[str], force: bool = False) -> int:
+        """Fetch metadata for stale (or all, with ``force``) symbols; returns how many were updated"""
+        async with self._refresh_lock:
+            symbols = list(symbols) if force else self.stale_symbols(symbols)
+            if not symbols:
+                return 0
+
+            loop = asyncio.get_running_loop()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.refresh_concurrency,
+                                                    thread_name_prefix='fundamentals')
+            updated = 0
+            # Persist after every chunk so an interrupted refresh keeps its progress
+            for i in range(0, len(symbols), self.save_every):
+                chunk = symbols[i:i + self.save_every]
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(self._executor, self.fetcher, symbol) for symbol in chunk),
+                    return_exceptions=True
+                )
+                for symbol, result in zip(chunk, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Error fetching fundamentals for {symbol}: {str(result)}")
+                    else:
+                        self._data[symbol] = result
+                        updated += 1
+
+                payload = {symbol: asdict(entry) for symbol, entry in self._data.items()}
+                await loop.run_in_executor(None, self._write, payload)
+
+            logger.info(f"Refreshed fundamentals for {updated}/{len(symbols)} symbols")
+            return updated
+
+    def start(self, symbols: Callable[[], Iterable[str]], interval_minutes: float = 60.0):
+        """Refresh stale symbols in the background every ``interval_minutes``"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(symbols, interval_minutes * 60))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._executor is not None:
+            # Fetches already running finish on their own; queued ones are dropped
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _refresh_loop(self, symbols: Callable[[], Iterable[str]], interval: float):
+        while True:
+            try:
+                await self.refresh(symbols())
+            except Exception as e:
+                logger.error(f"Fundamentals refresh failed: {str(e)}")
+            await asyncio.sleep(interval)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from trading_platform.domain.events.market_event import ScanCompletedEvent, SignalEvent
+from trading_platform.domain.models.instrument import Signal
+
+logger = logging.getLogger(__name__)
+
+
+class ResultsRepository(ABC):
+    """Durable history of scan results and signals.
+
+    Writes take whole batches (one scan, many signals) so a backend can
+    commit them together. Queries are iterators that fetch ``batch_size``
+    rows at a time, so reading years of history doesn't load it all.
+
+    On an attached event bus, signals are buffered and written in batches
+    of ``max_pending`` or every ``flush_interval`` seconds. Scans and signal
+    batches are written in order on one writer thread, never on the event
+    loop.
+    """
+
+    def __init__(self, flush_interval: float = 1.0, max_pending: int = 500):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: List[Signal] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._writes: Set[asyncio.Future] = set()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='results-writer')
+
+    @abstractmethod
+    def save_scan(self, results: Iterable[Dict], timestamp: datetime, scan_id: Optional[str] = None) -> int:
+        """Store one scan's results; returns the number written"""
+
+    @abstractmethod
+    def save_signals(self, signals: Iterable[Signal]) -> int:
+        """Store signals in one batch; returns the number written"""
+
+    @abstractmethod
+    def scan_results(self,
+                     symbol: Optional[str] = None,
+                     start: Optional[datetime] = None,
+                     end: Optional[datetime] = None,
+                     min_score: Optional[float] = None,
+                     batch_size: int = 1000) -> Iterator[Dict]:
+        """Stored results, oldest first; each carries its ``scan_id`` and ``scan_time``"""
+
+    @abstractmethod
+    def signals(self,
+                symbol: Optional[str] = None,
+                signal_type: Optional[str] = None,
+                min_confidence: Optional[float] = None,
+                start: Optional[datetime] = None,
+                end: Optional[datetime] = None,
+                batch_size: int = 1000) -> Iterator[Signal]:
+        """Stored signals, oldest first; ``end`` is exclusive"""
+
+    @abstractmethod
+    def consecutive_signal_days(self,
+                                days: int,
+                                signal_type: Optional[str] = None,
+                                min_confidence: Optional[float] = None,
+                                until: Optional[date] = None) -> List[str]:
+        """Symbols that signalled on each of the last ``days`` days with any signals, up to ``until``"""
+
+    def attach(self, event_bus):
+        """Persist scans and signals as they are published"""
+        event_bus.subscribe(ScanCompletedEvent, self._on_scan_completed)
+        event_bus.subscribe(SignalEvent, self._on_signal)
+
+    def detach(self, event_bus):
+        event_bus.unsubscribe(ScanCompletedEvent, self._on_scan_completed)
+        event_bus.unsubscribe(SignalEvent, self._on_signal)
+
+    async def flush(self):
+        """Write buffered signals and wait for every queued write"""
+        self._submit_pending()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def close(self):
+        """Finish queued writes; signals still buffered are written here, synchronously"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._writer.shutdown(wait=True)
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.save_signals(batch)
+
+    def _on_scan_completed(self, event: ScanCompletedEvent):
+        # Shallow copies: the scanner may update its result dicts while the writer serializes them
+        self._submit(self.save_scan, [dict(result) for result in event.results],
+                     event.timestamp, event.scan_id)
+
+    def _on_signal(self, event: SignalEvent):
+        self._pending.append(event.signal)
+        if len(self._pending) >= self.max_pending:
+            self._submit_pending()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.flush_interval, self._submit_pending)
+
+    def _submit_pending(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._submit(self.save_signals, batch)
+
+    def _submit(self, write, *args):
+        future = asyncio.get_running_loop().run_in_executor(self._writer, write, *args)
+        self._writes.add(future)
+        future.add_done_callback(self._write_done)
+
+    def _write_done(self, future: asyncio.Future):
+        self._writes.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Error writing to {type(self).__name__}: {str(future.exception())}")
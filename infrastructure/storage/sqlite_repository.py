@@ -0,0 +1,258 @@
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from trading_platform.domain.models.instrument import Instrument, Signal
+from .repository_interface import ResultsRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    scan_id TEXT PRIMARY KEY,
+    ts TEXT NOT NULL,
+    results INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scan_results (
+    scan_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    score REAL,
+    price REAL,
+    volume REAL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scan_results_symbol_ts ON scan_results (symbol, ts);
+CREATE INDEX IF NOT EXISTS scan_results_ts ON scan_results (ts);
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    type TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    price TEXT NOT NULL,
+    prediction REAL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS signals_symbol_ts ON signals (symbol, ts);
+CREATE INDEX IF NOT EXISTS signals_type_ts ON signals (type, ts);
+CREATE INDEX IF NOT EXISTS signals_confidence ON signals (confidence);
+CREATE INDEX IF NOT EXISTS signals_day_symbol ON signals (day, symbol);
+-- Days with at least one signal, so "the last N days" is an index lookup
+CREATE TABLE IF NOT EXISTS signal_days (day TEXT PRIMARY KEY) WITHOUT ROWID;
+"""
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    # numpy scalars and anything else exposing .item()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, default=_json_default, separators=(',', ':'))
+
+
+def _ts(value: datetime) -> str:
+    # Fixed width, so text order is time order
+    return value.isoformat(sep=' ', timespec='microseconds')
+
+
+def _number(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class SQLiteResultsRepository(ResultsRepository):
+    """ResultsRepository in a local SQLite file.
+
+    Runs in WAL mode, so queries stream from their own connection while
+    scans are being written. Each batch is one ``executemany`` in one
+    transaction. Scan results and signals are indexed by (symbol, time);
+    signals also by type and confidence.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, max_pending: int = 500):
+        super().__init__(flush_interval, max_pending)
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: durable across a crash of the process, not necessarily of the OS
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    # Writes
+
+    def save_scan(self, results: Iterable[Dict], timestamp: datetime, scan_id: Optional[str] = None) -> int:
+        scan_id = scan_id or uuid.uuid4().hex
+        ts = _ts(timestamp)
+        rows = [
+            (scan_id, result['symbol'], ts, _number(result.get('score')),
+             _number(result.get('current_price')), _number(result.get('volume')), _dumps(result))
+            for result in results
+        ]
+        with self._lock, self._conn:
+            # A re-saved scan (e.g. a resumed one) replaces its earlier rows
+            self._conn.execute("DELETE FROM scan_results WHERE scan_id = ?", (scan_id,))
+            self._conn.executemany(
+                "INSERT INTO scan_results (scan_id, symbol, ts, score, price, volume, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute("INSERT OR REPLACE INTO scans (scan_id, ts, results) VALUES (?, ?, ?)",
+                               (scan_id, ts, len(rows)))
+        return len(rows)
+
+    def save_signals(self, signals: Iterable[Signal]) -> int:
+        rows = []
+        for signal in signals:
+            extra = {'technical_indicators': signal.technical_indicators,
+                     'options_data': signal.options_data,
+                     'reason': signal.reason,
+                     'instrument': dataclasses.asdict(signal.instrument)}
+            rows.append((signal.instrument.symbol, _ts(signal.timestamp), signal.timestamp.date().isoformat(),
+                         signal.type, float(signal.confidence), str(signal.price),
+                         _number(signal.prediction), _dumps(extra)))
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO signals (symbol, ts, day, type, confidence, price, prediction, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.executemany("INSERT OR IGNORE INTO signal_days (day) VALUES (?)",
+                                   {(row[2],) for row in rows})
+        return len(rows)
+
+    # Queries
+
+    def scan_results(self,
+                     symbol: Optional[str] = None,
+                     start: Optional[datetime] = None,
+                     end: Optional[datetime] = None,
+                     min_score: Optional[float] = None,
+                     batch_size: int = 1000) -> Iterator[Dict]:
+        where, params = self._filters(symbol=symbol, start=start, end=end)
+        if min_score is not None:
+            where.append("score >= ?")
+            params.append(min_score)
+        sql = f"SELECT scan_id, ts, payload FROM scan_results{self._where(where)} ORDER BY ts, symbol"
+        for scan_id, ts, payload in self._stream(sql, params, batch_size):
+            result = json.loads(payload)
+            result['scan_id'] = scan_id
+            result['scan_time'] = datetime.fromisoformat(ts)
+            yield result
+
+    def signals(self,
+                symbol: Optional[str] = None,
+                signal_type: Optional[str] = None,
+                min_confidence: Optional[float] = None,
+                start: Optional[datetime] = None,
+                end: Optional[datetime] = None,
+                batch_size: int = 1000) -> Iterator[Signal]:
+        where, params = self._filters(symbol=symbol, start=start, end=end)
+        if signal_type is not None:
+            where.append("type = ?")
+            params.append(signal_type)
+        if min_confidence is not None:
+            where.append("confidence >= ?")
+            params.append(min_confidence)
+        sql = (f"SELECT ts, type, confidence, price, prediction, payload FROM signals{self._where(where)} "
+               f"ORDER BY ts, id")
+        for ts, signal_type_, confidence, price, prediction, payload in self._stream(sql, params, batch_size):
+            extra = json.loads(payload)
+            yield Signal(
+                instrument=Instrument(**extra['instrument']),
+                type=signal_type_,
+                confidence=confidence,
+                timestamp=datetime.fromisoformat(ts),
+                price=Decimal(price),
+                technical_indicators=extra['technical_indicators'],
+                prediction=prediction,
+                options_data=extra['options_data'],
+                reason=extra['reason'],
+            )
+
+    def consecutive_signal_days(self,
+                                days: int,
+                                signal_type: Optional[str] = None,
+                                min_confidence: Optional[float] = None,
+                                until: Optional[date] = None) -> List[str]:
+        until = (until or date.today()).isoformat()
+        with self._lock:
+            recent = [day for day, in self._conn.execute(
+                "SELECT day FROM signal_days WHERE day <= ? ORDER BY day DESC LIMIT ?", (until, days)
+            )]
+        if len(recent) < days:
+            return []
+        where = [f"day IN ({', '.join('?' * len(recent))})"]
+        params: List = list(recent)
+        if signal_type is not None:
+            where.append("type = ?")
+            params.append(signal_type)
+        if min_confidence is not None:
+            where.append("confidence >= ?")
+            params.append(min_confidence)
+        sql = (f"SELECT symbol FROM signals{self._where(where)} "
+               f"GROUP BY symbol HAVING COUNT(DISTINCT day) = ? ORDER BY symbol")
+        return [symbol for symbol, in self._stream(sql, params + [days], batch_size=1000)]
+
+    def close(self):
+        super().close()
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _filters(symbol: Optional[str], start: Optional[datetime], end: Optional[datetime]) -> Tuple[List[str], List]:
+        where, params = [], []
+        if symbol is not None:
+            where.append("symbol = ?")
+            params.append(symbol)
+        if start is not None:
+            where.append("ts >= ?")
+            params.append(_ts(start))
+        if end is not None:
+            where.append("ts < ?")
+            params.append(_ts(end))
+        return where, params
+
+    @staticmethod
+    def _where(clauses: List[str]) -> str:
+        return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    def _stream(self, sql: str, params: List, batch_size: int) -> Iterator[Tuple]:
+        """Rows ``batch_size`` at a time, from a read-only connection (a snapshot, under WAL)"""
+        if self.path == ':memory:':
+            # Nothing else can open an in-memory database; read it in place
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+            yield from rows
+            return
+        conn = sqlite3.connect(f"file:{os.path.abspath(self.path)}?mode=ro", uri=True)
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
@@ -0,0 +1,165 @@
+import asyncio
+import dataclasses
+import json
+import os
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from trading_platform.domain.events.market_event import ScanCompletedEvent, SignalEvent
+from trading_platform.domain.models.instrument import Signal
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    # numpy scalars and anything else exposing .item()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def dumps(value) -> bytes:
+    return json.dumps(value, default=_json_default, separators=(',', ':')).encode()
+
+
+def signal_to_dict(signal: Signal) -> Dict:
+    return dataclasses.asdict(signal)
+
+
+class Page:
+    """A serialized response body with its ETag"""
+    __slots__ = ('body', 'etag')
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+
+
+class ResultsStore:
+    """Latest scan results and recent signals, kept serialized for serving.
+
+    Everything is serialized when it arrives (from the event bus), not when
+    it is requested, so a read is a dictionary lookup. ETags combine a
+    per-process epoch with a version number that changes on every update.
+    """
+
+    def __init__(self, max_signals: int = 1000, max_cached_pages: int = 256):
+        self.max_cached_pages = max_cached_pages
+        self._epoch = os.urandom(4).hex()
+
+        self.scan_version = 0
+        self.scan_time: Optional[datetime] = None
+        self._scan_results: List[Dict] = []
+        self._scan_by_symbol: Dict[str, bytes] = {}
+        self._scan_pages: Dict[Tuple[int, int], Page] = {}
+
+        self.signal_version = 0
+        self._signals: Deque[Tuple[int, Dict, bytes]] = deque(maxlen=max_signals)
+        self._signals_by_symbol: Dict[str, List[Dict]] = {}
+        self._signal_pages: Dict[Tuple[int, int], Page] = {}
+        self._listeners: Set[asyncio.Queue] = set()
+
+    # Ingest
+
+    def attach(self, event_bus):
+        event_bus.subscribe(ScanCompletedEvent, self.on_scan_completed)
+        event_bus.subscribe(SignalEvent, self.on_signal)
+
+    def on_scan_completed(self, event: ScanCompletedEvent):
+        self.update_scan(event.results, event.timestamp)
+
+    def on_signal(self, event: SignalEvent):
+        self.add_signal(event.signal)
+
+    def update_scan(self, results: List[Dict], scan_time: Optional[datetime] = None):
+        # Round-trip through JSON once so pages only slice plain data
+        self._scan_results = json.loads(dumps(results))
+        self._scan_by_symbol = {
+            result['symbol']: dumps(result) for result in self._scan_results if 'symbol' in result
+        }
+        self.scan_time = scan_time or datetime.now()
+        self.scan_version += 1
+        self._scan_pages = {}
+
+    def add_signal(self, signal: Signal):
+        self.signal_version += 1
+        payload = json.loads(dumps(signal_to_dict(signal)))
+        body = dumps(payload)
+        self._signals.append((self.signal_version, payload, body))
+        symbol_signals = self._signals_by_symbol.setdefault(signal.instrument.symbol, [])
+        symbol_signals.insert(0, payload)
+        del symbol_signals[20:]
+        self._signal_pages = {}
+
+        for queue in self._listeners:
+            if queue.full():
+                queue.get_nowait()  # Slow client: drop its oldest pending event
+            queue.put_nowait((self.signal_version, body))
+
+    # Reads
+
+    def scan_page(self, offset: int, limit: int) -> Page:
+        page = self._scan_pages.get((offset, limit))
+        if page is None:
+            page = self._cache(self._scan_pages, (offset, limit), Page(
+                dumps({
+                    'version': self.scan_version,
+                    'scan_time': self.scan_time,
+                    'total': len(self._scan_results),
+                    'offset': offset,
+                    'limit': limit,
+                    'results': self._scan_results[offset:offset + limit],
+                }),
+                f'"{self._epoch}-s{self.scan_version}-{offset}-{limit}"'
+            ))
+        return page
+
+    def signal_page(self, offset: int, limit: int) -> Page:
+        page = self._signal_pages.get((offset, limit))
+        if page is None:
+            newest_first = [payload for _, payload, _ in reversed(self._signals)]
+            page = self._cache(self._signal_pages, (offset, limit), Page(
+                dumps({
+                    'version': self.signal_version,
+                    'total': len(newest_first),
+                    'offset': offset,
+                    'limit': limit,
+                    'signals': newest_first[offset:offset + limit],
+                }),
+                f'"{self._epoch}-g{self.signal_version}-{offset}-{limit}"'
+            ))
+        return page
+
+    def symbol_detail(self, symbol: str) -> Optional[Page]:
+        scan_result = self._scan_by_symbol.get(symbol)
+        signals = self._signals_by_symbol.get(symbol)
+        if scan_result is None and signals is None:
+            return None
+        body = b''.join((
+            b'{"symbol":', dumps(symbol),
+            b',"scan_result":', scan_result or b'null',
+            b',"signals":', dumps(signals or []), b'}'
+        ))
+        return Page(body, f'"{self._epoch}-d{self.scan_version}.{self.signal_version}-{symbol}"')
+
+    def signals_since(self, event_id: int) -> List[Tuple[int, bytes]]:
+        return [(version, body) for version, _, body in self._signals if version > event_id]
+
+    # Streaming
+
+    def listen(self, maxsize: int = 256) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._listeners.add(queue)
+        return queue
+
+    def unlisten(self, queue: asyncio.Queue):
+        self._listeners.discard(queue)
+
+    def _cache(self, pages: Dict, key: Tuple[int, int], page: Page) -> Page:
+        if len(pages) >= self.max_cached_pages:
+            pages.clear()
+        pages[key] = page
+        return page
@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import logging
+import signal
+from aiohttp import web
+from trading_platform.infrastructure.messaging.event_bus import InMemoryEventBus
+from .results_store import Page, ResultsStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+HEARTBEAT_SECONDS = 15.0
+
+STORE_KEY = web.AppKey('results_store', ResultsStore)
+
+
+def _pagination(request: web.Request) -> tuple[int, int]:
+    try:
+        offset = max(0, int(request.query.get('offset', 0)))
+        limit = min(MAX_PAGE_SIZE, max(1, int(request.query.get('limit', DEFAULT_PAGE_SIZE))))
+    except ValueError:
+        raise web.HTTPBadRequest(text="offset and limit must be integers")
+    return offset, limit
+
+
+def _respond(request: web.Request, page: Page) -> web.Response:
+    headers = {'ETag': page.etag, 'Cache-Control': 'no-cache'}
+    if request.headers.get('If-None-Match') == page.etag:
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=page.body, content_type='application/json', headers=headers)
+
+
+async def health(request: web.Request) -> web.Response:
+    store = request.app[STORE_KEY]
+    return web.json_response({
+        'status': 'ok',
+        'scan_version': store.scan_version,
+        'scan_time': store.scan_time.isoformat() if store.scan_time else None,
+        'signal_version': store.signal_version,
+    })
+
+
+async def get_scan(request: web.Request) -> web.Response:
+    return _respond(request, request.app[STORE_KEY].scan_page(*_pagination(request)))
+
+
+async def get_signals(request: web.Request) -> web.Response:
+    return _respond(request, request.app[STORE_KEY].signal_page(*_pagination(request)))
+
+
+async def get_symbol(request: web.Request) -> web.Response:
+    page = request.app[STORE_KEY].symbol_detail(request.match_info['symbol'].upper())
+    if page is None:
+        raise web.HTTPNotFound(text="No scan result or signal for this symbol")
+    return _respond(request, page)
+
+
+async def stream_signals(request: web.Request) -> web.StreamResponse:
+    """Server-sent events: one ``signal`` event per new Signal, resumable via Last-Event-ID"""
+    store = request.app[STORE_KEY]
+    response = web.StreamResponse(headers={
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    await response.prepare(request)
+
+    queue = store.listen()
+    try:
+        last_sent = 0
+        last_event_id = request.headers.get('Last-Event-ID')
+        if last_event_id and last_event_id.isdigit():
+            last_sent = int(last_event_id)
+            for event_id, body in store.signals_since(last_sent):
+                await response.write(b'id: %d\nevent: signal\ndata: %s\n\n' % (event_id, body))
+                last_sent = event_id
+
+        while True:
+            try:
+                event_id, body = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                await response.write(b': keep-alive\n\n')
+                continue
+            if event_id <= last_sent:
+                # Queued while the replay was being written; already sent
+                continue
+            await response.write(b'id: %d\nevent: signal\ndata: %s\n\n' % (event_id, body))
+            last_sent = event_id
+    except ConnectionResetError:
+        pass
+    finally:
+        store.unlisten(queue)
+    return response
+
+
+def create_app(store: ResultsStore) -> web.Application:
+    """Read-only API over a ResultsStore; requests never reach the scanner or a provider"""
+    app = web.Application()
+    app[STORE_KEY] = store
+    app.router.add_get('/health', health)
+    app.router.add_get('/api/scan', get_scan)
+    app.router.add_get('/api/signals', get_signals)
+    app.router.add_get('/api/signals/stream', stream_signals)
+    app.router.add_get('/api/symbols/{symbol}', get_symbol)
+    return app
+
+
+async def scan_loop(event_bus: InMemoryEventBus, interval_minutes: float):
+    """Rescan on the market-hours schedule and publish results, refreshed bars and signals for the hits on the bus"""
+    from trading_platform.application.config.config import Config as ScannerConfig
+    from trading_platform.application.scanners.market_scanner import MarketScanner
+    from trading_platform.application.scanners.publishing import ScanPublisher, build_signal_analysis
+    from trading_platform.application.scanners.scheduler import ScanScheduler
+
+    scanner_config = ScannerConfig()
+    scanner_config.scheduler.history_refresh_minutes = interval_minutes
+    scanner = MarketScanner(scanner_config, event_bus=event_bus)
+    # One provider for the scanner's bulk downloads and the per-symbol analysis
+    analysis_service = build_signal_analysis(event_bus, scanner.get_bar_provider())
+    try:
+        await ScanScheduler(scanner, scanner_config.scheduler,
+                            on_results=ScanPublisher(scanner, event_bus, analysis_service)).run_forever()
+    finally:
+        analysis_service.close()
+
+
+def _stop_on_scan_failure(task: asyncio.Task):
+    """Shut the server down rather than keep serving results that will never update"""
+    if task.cancelled() or task.exception() is None:
+        return
+    logger.error(f"Scan loop failed, shutting down: {task.exception()!r}", exc_info=task.exception())
+    # The same path as Ctrl-C: run_app stops serving and runs every cleanup context
+    signal.raise_signal(signal.SIGINT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve scan results and signals over HTTP")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--scan-interval', type=float, default=15.0,
+                        help="Minutes between scans during market hours (0 disables the built-in scanner)")
+    parser.add_argument('--access-log', action='store_true',
+                        help="Log every request (costs throughput under dashboard polling)")
+    parser.add_argument('--event-log', metavar='DIR',
+                        help="Record market data and signal events to a binary event log for replay")
+    parser.add_argument('--results-db', metavar='PATH',
+                        help="Keep every scan's results and all signals in a queryable SQLite database")
+    args = parser.parse_args()
+
+    from trading_platform.application.config.config import Config as ScannerConfig
+    from trading_platform.infrastructure.monitoring.log_pipeline import configure_logging
+    configure_logging(ScannerConfig().logging)
+
+    event_bus = InMemoryEventBus()
+    store = ResultsStore()
+    store.attach(event_bus)
+    app = create_app(store)
+
+    if args.event_log:
+        from trading_platform.infrastructure.messaging.event_log import EventLog
+
+        async def record_events(app: web.Application):
+            event_log = EventLog(args.event_log)
+            event_log.attach(event_bus)
+            yield
+            event_log.detach(event_bus)
+            await event_log.drain()
+            event_log.close()
+        app.cleanup_ctx.append(record_events)
+
+    if args.results_db:
+        from trading_platform.infrastructure.storage.sqlite_repository import SQLiteResultsRepository
+
+        async def persist_results(app: web.Application):
+            repository = SQLiteResultsRepository(args.results_db)
+            repository.attach(event_bus)
+            yield
+            repository.detach(event_bus)
+            await repository.flush()
+            repository.close()
+        app.cleanup_ctx.append(persist_results)
+
+    if args.scan_interval > 0:
+        async def start_scanning(app: web.Application):
+            task = asyncio.create_task(scan_loop(event_bus, args.scan_interval))
+            task.add_done_callback(_stop_on_scan_failure)
+            yield
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        app.cleanup_ctx.append(start_scanning)
+
+    web.run_app(app, host=args.host, port=args.port,
+                access_log=logging.getLogger('aiohttp.access') if args.access_log else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import asyncio
+import os
 from datetime import datetime, timedelta
 from trading_platform.config import Config, RequestTracker
+from trading_platform.application.config.config import DataConfig
 from trading_platform.domain.models.instrument import Instrument
-from trading_platform.infrastructure.data_providers.yfinance_provider import YFinanceProvider
+from trading_platform.infrastructure.data_providers.composite_provider import (
+    CompositeProvider, build_market_data_provider
+)
 from trading_platform.application.services.market_data_service import MarketDataService
 from trading_platform.application.services.analysis_service import AnalysisService, OptionsAnalyzer
 from trading_platform.application.strategies.ml_strategy import MLTradingStrategy
@@ -14,7 +18,8 @@ async def main():
     
     # Set up infrastructure
     request_tracker = RequestTracker()
-    data_provider = YFinanceProvider(config, request_tracker)
+    data_config = DataConfig(local_data_dir=os.getenv('LOCAL_DATA_DIR') or None)
+    data_provider = build_market_data_provider(config, request_tracker, data_config)
     market_data_service = MarketDataService(data_provider)
     
     # Set up strategies
@@ -26,7 +31,7 @@ async def main():
     analysis_service = AnalysisService(
         market_data_service=market_data_service,
         strategies=strategies,
-        options_analyzer=OptionsAnalyzer()
+        options_analyzer=OptionsAnalyzer(data_provider, config)
     )
     
     # Process instruments
@@ -35,15 +40,14 @@ async def main():
         for symbol in config.symbols
     ]
     
-    for instrument in instruments:
-        # Fetch 200 days of data to ensure enough history for analysis
-        signals = await analysis_service.analyze_instrument(
-            instrument,
+    # Fetch 200 days of data to ensure enough history for analysis; signals
+    # are printed as soon as each instrument finishes
+    try:
+        async for signal in analysis_service.analyze_many(
+            instruments,
             start_date=datetime.now() - timedelta(days=200),  # Increased from 30 to 200 days
             end_date=datetime.now()
-        )
-        
-        for signal in signals:
+        ):
             print(f"\nGenerated signal for {signal.instrument.symbol}:")
             print(f"Type: {signal.type}")
             print(f"Confidence: {signal.confidence:.2%}")
@@ -56,6 +60,10 @@ async def main():
                 print(f"- {reason}")
             if signal.options_data:
                 print(f"\nFound {len(signal.options_data)} promising options")
+    finally:
+        analysis_service.close()
+        if isinstance(data_provider, CompositeProvider):
+            data_provider.log_health()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,22 +1,13 @@
 import asyncio
 import logging
-from colorama import init
 from trading_platform.application.config.config import Config
 from trading_platform.application.scanners.market_scanner import MarketScanner
-
-# Initialize colorama
-init()
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+from trading_platform.infrastructure.monitoring.log_pipeline import configure_logging
 
 async def main():
     # Initialize configuration
     config = Config()
+    configure_logging(config.logging)
     
     # Create scanner
     scanner = MarketScanner(config)
@@ -33,6 +24,7 @@ async def main():
             print(f"Company: {stock['company_name']}")
             print(f"Price: ${stock['current_price']:.2f}")
             print(f"Volume: {stock['volume']:,}")
+            print(f"Score: {stock['score']:.2f}")
             print("\nReasons:")
             for reason in stock['reasons']:
                 print(f"- {reason}")
@@ -1,8 +1,9 @@
+import argparse
 import asyncio
 import os
 from dotenv import load_dotenv
 from trading_platform.application.config.config import Config
-from trading_platform.application.scanners.market_scanner import MarketScanner
+from trading_platform.infrastructure.monitoring.log_pipeline import configure_logging
 
 def load_configuration() -> Config:
     # Load environment variables
@@ -20,47 +21,134 @@ def load_configuration() -> Config:
     config.scanner.max_price = float(os.getenv('MAX_PRICE', 1000.0))
     config.scanner.min_volatility = float(os.getenv('MIN_VOLATILITY', 0.15))
     config.scanner.max_volatility = float(os.getenv('MAX_VOLATILITY', 0.50))
+    config.scoring.top_k = int(os.getenv('TOP_K', 25))
+    config.scanner.checkpoint_dir = os.getenv('SCAN_CHECKPOINT_DIR') or None
     
     # News Configuration
     config.news.days_to_analyze = int(os.getenv('NEWS_DAYS_TO_ANALYZE', 7))
     config.news.min_sentiment_score = float(os.getenv('MIN_SENTIMENT_SCORE', 0.2))
     config.news.min_news_volume = float(os.getenv('MIN_NEWS_VOLUME', 0.3))
+    config.news.request_timeout = float(os.getenv('NEWS_REQUEST_TIMEOUT', 10))
+    config.news.scan_budget_seconds = float(os.getenv('NEWS_SCAN_BUDGET', 120))
+    
+    # Market Data Configuration
+    config.data.local_data_dir = os.getenv('LOCAL_DATA_DIR') or None
+    config.data.hedge_quantile = float(os.getenv('HEDGE_QUANTILE', 0.95))
+    
+    # Logging Configuration
+    config.logging.level = os.getenv('LOG_LEVEL', 'INFO')
+    config.logging.json_output = os.getenv('LOG_FORMAT', 'text').lower() == 'json'
+    config.logging.symbol_sample_rate = int(os.getenv('LOG_SYMBOL_SAMPLE_RATE', 1))
+    
+    # Scheduler Configuration (daemon mode)
+    config.scheduler.history_refresh_minutes = float(os.getenv('SCAN_HISTORY_MINUTES', 60))
+    config.scheduler.news_refresh_minutes = float(os.getenv('SCAN_NEWS_MINUTES', 5))
     
     return config
 
+def print_results(promising_stocks):
+    print("\nPromising Stocks Found:")
+    print("=" * 50)
+    for stock in promising_stocks:
+        print(f"\nSymbol: {stock['symbol']}")
+        print(f"Company: {stock['company_name']}")
+        print(f"Price: ${stock['current_price']:.2f}")
+        print(f"Volume: {stock['volume']:,}")
+        print(f"Score: {stock['score']:.2f}")
+        print("\nReasons:")
+        for reason in stock['reasons']:
+            print(f"- {reason}")
+        
+        if 'news_data' in stock and stock['news_data']['recent_news']:
+            print("\nRecent News:")
+            for news in stock['news_data']['recent_news'][:3]:
+                print(f"- {news['title']}")
+        
+        print("-" * 50)
+
+def print_signal(event):
+    signal = event.signal
+    print(f"Signal: {signal.type} {signal.instrument.symbol} at ${float(signal.price):.2f} "
+          f"({signal.confidence:.0%} confidence)")
+
 async def main():
+    parser = argparse.ArgumentParser(description="Scan the market for promising stocks")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running and rescan on a market-hours schedule")
+    parser.add_argument('--scan-id',
+                        help="Resume this scan from its checkpoint journal (needs SCAN_CHECKPOINT_DIR)")
+    parser.add_argument('--signals', action='store_true',
+                        help="Analyze each scan's hits with the ML strategy and report their signals")
+    parser.add_argument('--event-log', metavar='DIR',
+                        help="Record refreshed bars and signals to a binary event log for replay")
+    parser.add_argument('--results-db', metavar='PATH',
+                        help="Keep every scan's results (and signals, with --signals) in a queryable SQLite database")
+    args = parser.parse_args()
+    
     # Load configuration
     config = load_configuration()
+    configure_logging(config.logging)
+    
+    # Imported after argument parsing so --help doesn't pay for pandas
+    from trading_platform.application.scanners.market_scanner import MarketScanner
+    from trading_platform.application.scanners.publishing import ScanPublisher, build_signal_analysis
+    from trading_platform.application.scanners.scheduler import ScanScheduler
+    from trading_platform.domain.events.market_event import SignalEvent
+    from trading_platform.infrastructure.messaging.event_bus import InMemoryEventBus
+    
+    # Initialize scanner; results, refreshed bars and signals are published on the bus
+    event_bus = InMemoryEventBus()
+    scanner = MarketScanner(config, event_bus=event_bus)
+    analysis_service = None
+    if args.signals:
+        analysis_service = build_signal_analysis(event_bus, scanner.get_bar_provider())
+        event_bus.subscribe(SignalEvent, print_signal)
+    publish = ScanPublisher(scanner, event_bus, analysis_service)
     
-    # Initialize scanner
-    scanner = MarketScanner(config)
+    event_log = None
+    if args.event_log:
+        from trading_platform.infrastructure.messaging.event_log import EventLog
+        event_log = EventLog(args.event_log)
+        event_log.attach(event_bus)
+    
+    repository = None
+    if args.results_db:
+        from trading_platform.infrastructure.storage.sqlite_repository import SQLiteResultsRepository
+        repository = SQLiteResultsRepository(args.results_db)
+        repository.attach(event_bus)
     
     try:
-        # Run market scan
-        promising_stocks = await scanner.scan_market()
+        if args.daemon:
+            async def report(results, job):
+                print_results(results)
+                await publish(results, job)
+            await ScanScheduler(scanner, config.scheduler, on_results=report).run_forever()
+            return
         
-        # Print results
-        print("\nPromising Stocks Found:")
-        print("=" * 50)
-        for stock in promising_stocks:
-            print(f"\nSymbol: {stock['symbol']}")
-            print(f"Company: {stock['company_name']}")
-            print(f"Price: ${stock['current_price']:.2f}")
-            print(f"Volume: {stock['volume']:,}")
-            print("\nReasons:")
-            for reason in stock['reasons']:
-                print(f"- {reason}")
-            
-            if 'news_data' in stock and stock['news_data']['recent_news']:
-                print("\nRecent News:")
-                for news in stock['news_data']['recent_news'][:3]:
-                    print(f"- {news['title']}")
-            
-            print("-" * 50)
+        try:
+            # Run market scan
+            promising_stocks = await scanner.scan_market(scan_id=args.scan_id)
             
-    except Exception as e:
-        print(f"Error during market scan: {str(e)}")
-        raise
+            # Print results
+            print_results(promising_stocks)
+            await publish(promising_stocks)
+                
+        except Exception as e:
+            print(f"Error during market scan: {str(e)}")
+            raise
+        finally:
+            await scanner.fundamentals.stop()
+    finally:
+        if analysis_service is not None:
+            analysis_service.close()
+        if event_log is not None:
+            event_log.detach(event_bus)
+            await event_log.drain()
+            event_log.close()
+        if repository is not None:
+            repository.detach(event_bus)
+            await repository.flush()
+            repository.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Make the repository importable as ``trading_platform`` wherever it is checked out"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _package_path() -> str:
+    if REPO_ROOT.name == 'trading_platform':
+        return str(REPO_ROOT.parent)
+    directory = tempfile.mkdtemp(prefix='tp-tests-')
+    os.symlink(REPO_ROOT, os.path.join(directory, 'trading_platform'))
+    return directory
+
+
+PACKAGE_PATH = _package_path()
+if PACKAGE_PATH not in sys.path:
+    sys.path.insert(0, PACKAGE_PATH)
@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+import pandas as pd
+from trading_platform.application.services.analysis_service import AnalysisService
+from trading_platform.application.strategies.strategy_interface import TradingStrategy
+from trading_platform.domain.events.market_event import SignalEvent
+from trading_platform.domain.models.instrument import Instrument, Signal
+from trading_platform.infrastructure.messaging.event_bus import InMemoryEventBus
+
+
+class FakeMarketData:
+    async def get_market_data(self, instrument, start_date, end_date):
+        if instrument.symbol == 'BAD':
+            raise ValueError('no data')
+        return pd.DataFrame({'Close': [10.0, 11.0]})
+
+
+class AlwaysBuy(TradingStrategy):
+    async def analyze(self, market_data, instrument, features=None):
+        return Signal(instrument, 'BUY', 0.9, datetime(2026, 3, 2), Decimal('11'), {}, 0.9)
+
+
+class SlowOptions:
+    """Counts how many options analyses run at once"""
+
+    def __init__(self, fail=()):
+        self.running = self.peak = 0
+        self.fail = fail
+
+    async def analyze(self, instrument, price):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if instrument.symbol in self.fail:
+                raise RuntimeError('chain unavailable')
+            return [{'symbol': instrument.symbol}]
+        finally:
+            self.running -= 1
+
+
+def _service(options, event_bus=None, max_concurrency=3) -> AnalysisService:
+    return AnalysisService(FakeMarketData(), [AlwaysBuy()], options_analyzer=options,
+                           event_bus=event_bus, max_concurrency=max_concurrency)
+
+
+def _instruments(*symbols):
+    return [Instrument(symbol) for symbol in symbols]
+
+
+def test_analyze_many_completes_and_publishes_every_signal():
+    options = SlowOptions(fail=('CCC',))
+    published = []
+
+    async def run():
+        bus = InMemoryEventBus()
+        bus.subscribe(SignalEvent, published.append)
+        service = _service(options, bus)
+        symbols = [f"S{i}" for i in range(12)] + ['BAD', 'CCC']
+        return [s async for s in service.analyze_many(_instruments(*symbols), datetime(2026, 1, 1), datetime(2026, 3, 2))]
+
+    signals = asyncio.run(run())
+
+    # BAD has no data and CCC's options analysis fails; both are logged and skipped
+    assert sorted(s.instrument.symbol for s in signals) == sorted(f"S{i}" for i in range(12))
+    assert all(s.options_data == [{'symbol': s.instrument.symbol}] for s in signals)
+    assert sorted(e.signal.instrument.symbol for e in published) == sorted(s.instrument.symbol for s in signals)
+    # Options analysis runs on a bounded pool of workers, not one task per signal
+    assert options.peak == 3
+
+
+def test_closing_analyze_many_early_cancels_outstanding_work():
+    options = SlowOptions()
+
+    async def run():
+        service = _service(options)
+        signals = service.analyze_many(_instruments(*(f"S{i}" for i in range(20))),
+                                       datetime(2026, 1, 1), datetime(2026, 3, 2))
+        first = await signals.__anext__()
+        await signals.aclose()
+        await asyncio.sleep(0.05)
+        return first
+
+    assert asyncio.run(run()).options_data is not None
+    assert options.running == 0
@@ -0,0 +1,54 @@
+import asyncio
+import time
+import pytest
+from trading_platform.application.utils.async_utils import (
+    DeadlineExceeded, FatalError, RetryableError, RetryPolicy, call_with_retry, deadline, retry_stats
+)
+
+
+def _failing(errors, result='ok'):
+    calls = []
+
+    async def call():
+        calls.append(time.monotonic())
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return call, calls
+
+
+def test_backoff_honours_retry_after_beyond_max_delay():
+    policy = RetryPolicy(max_delay=10.0)
+    assert policy.backoff(1, retry_after=60.0) == 60.0
+    assert 0 <= policy.backoff(10) <= 10.0
+
+
+def test_retry_waits_for_retry_after():
+    call, calls = _failing([RetryableError('rate limited', retry_after=0.1)])
+    policy = RetryPolicy(max_delay=0.01)
+
+    assert asyncio.run(call_with_retry(call, policy, 'test-retry-after')) == 'ok'
+    assert calls[1] - calls[0] >= 0.1
+
+
+def test_retry_after_past_the_deadline_fails_fast():
+    call, calls = _failing([RetryableError('rate limited', retry_after=60.0)])
+
+    async def run():
+        with deadline(5.0):
+            await call_with_retry(call, RetryPolicy(), 'test-deadline')
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(run())
+    assert time.monotonic() - started < 1.0
+    assert len(calls) == 1
+    assert retry_stats('test-deadline').deadline_exceeded == 1
+
+
+def test_fatal_errors_are_not_retried():
+    call, calls = _failing([FatalError('bad request')])
+    with pytest.raises(FatalError):
+        asyncio.run(call_with_retry(call, RetryPolicy(), 'test-fatal'))
+    assert len(calls) == 1
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from trading_platform.application.services.bar_store import BarStore, resample_bars
+
+
+def _five_minute_bars(day: str = '2026-03-02', start: str = '09:30', periods: int = 78) -> pd.DataFrame:
+    index = pd.date_range(f"{day} {start}", periods=periods, freq='5min', tz='America/New_York')
+    close = 100 + np.arange(periods, dtype=float)
+    return pd.DataFrame({'Open': close - 0.5, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': np.full(periods, 100.0)}, index=index)
+
+
+def test_hourly_buckets_are_anchored_at_the_open():
+    bars = _five_minute_bars()
+
+    hourly = resample_bars(bars, '1h')
+
+    assert [ts.strftime('%H:%M') for ts in hourly.index] == \
+        ['09:30', '10:30', '11:30', '12:30', '13:30', '14:30', '15:30']
+    first = hourly.iloc[0]
+    assert (first['Open'], first['High'], first['Low'], first['Close'], first['Volume']) == \
+        (99.5, 112.0, 99.0, 111.0, 1200.0)
+    # The 15:30 bucket only has the last half hour
+    assert hourly['Volume'].iloc[-1] == 600.0
+    daily = resample_bars(bars, '1d')
+    assert len(daily) == 1 and daily['Volume'].iloc[0] == 7800.0
+
+
+def test_appending_bars_matches_a_full_resample():
+    bars = pd.concat([_five_minute_bars('2026-03-02'), _five_minute_bars('2026-03-03')])
+    store = BarStore('5m', max_base_history_days=None)
+    # Split inside an hour bucket, so the partial bucket has to be rebuilt
+    store.set_base('AAA', bars.iloc[:100])
+    for interval in ('15m', '1h', '1d'):
+        store.get('AAA', interval)
+
+    store.append('AAA', bars.iloc[100:])
+
+    for interval in ('15m', '1h', '1d'):
+        pd.testing.assert_frame_equal(store.get('AAA', interval), resample_bars(bars, interval))
+    assert store.get('AAA', '5m') is store._base['AAA']
+    assert store.coverage('AAA') == (bars.index[0], bars.index[-1])
+
+
+def test_can_derive_only_coarser_multiples_within_base_history():
+    store = BarStore('5m', max_base_history_days=60)
+    assert store.can_derive('15m') and store.can_derive('1d')
+    assert not store.can_derive('1m') and not store.can_derive('2m')
+    assert store.can_derive('1h', datetime.now() - timedelta(days=30))
+    assert not store.can_derive('1h', datetime.now() - timedelta(days=90))
+    assert store.get('MISSING', '1h') is None
@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from trading_platform.application.options.chain_cache import OptionsChainCache
+from trading_platform.domain.models.instrument import Instrument
+
+AAA = Instrument('AAA')
+
+
+class SlowChains:
+    def __init__(self, delay: float = 0.05, fail=()):
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+
+    async def get_option_chain(self, instrument, expiration):
+        self.calls.append(expiration)
+        await asyncio.sleep(self.delay)
+        if expiration in self.fail:
+            raise RuntimeError(f"no {expiration} chain")
+        return {'expiration': expiration, 'call': len(self.calls)}
+
+    async def get_option_expirations(self, instrument):
+        return ['2026-04-17', '2026-05-15']
+
+
+def test_concurrent_requests_share_one_fetch_and_then_hit():
+    provider = SlowChains()
+    cache = OptionsChainCache(provider)
+
+    async def run():
+        first = await asyncio.gather(*(cache.get_chain(AAA, '2026-04-17') for _ in range(5)))
+        return first, await cache.get_chain(AAA, '2026-04-17')
+
+    first, again = asyncio.run(run())
+
+    assert provider.calls == ['2026-04-17']
+    assert all(chain is first[0] for chain in first) and again is first[0]
+    assert (cache.stats.misses, cache.stats.coalesced, cache.stats.hits) == (1, 4, 1)
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    provider = SlowChains(fail=('2026-04-17',))
+    cache = OptionsChainCache(provider)
+
+    async def run():
+        results = await asyncio.gather(cache.get_chain(AAA, '2026-04-17'), cache.get_chain(AAA, '2026-04-17'),
+                                       return_exceptions=True)
+        chains = await cache.get_chains(AAA, ['2026-04-17', '2026-05-15'])
+        return results, chains
+
+    results, chains = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert chains['2026-04-17'] is None and chains['2026-05-15']['expiration'] == '2026-05-15'
+    assert provider.calls.count('2026-04-17') == 2
+    assert cache.stats.errors == 2
+
+
+def test_cancelled_fetch_is_reissued_for_the_waiters():
+    provider = SlowChains()
+    cache = OptionsChainCache(provider)
+
+    async def run():
+        owner = asyncio.create_task(cache.get_chain(AAA, '2026-04-17'))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.get_chain(AAA, '2026-04-17'))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await waiter
+
+    assert asyncio.run(run())['call'] == 2
+    assert provider.calls == ['2026-04-17', '2026-04-17']
+
+
+def test_cancelled_waiter_leaves_the_fetch_running():
+    provider = SlowChains()
+    cache = OptionsChainCache(provider)
+
+    async def run():
+        owner = asyncio.create_task(cache.get_chain(AAA, '2026-04-17'))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.get_chain(AAA, '2026-04-17'))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await owner
+
+    assert asyncio.run(run())['call'] == 1
+    assert provider.calls == ['2026-04-17']
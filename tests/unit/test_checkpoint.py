@@ -0,0 +1,102 @@
+import asyncio
+import os
+import time
+import pytest
+from trading_platform.application.config.config import Config
+from trading_platform.application.scanners import market_scanner
+from trading_platform.application.scanners.checkpoint import CheckpointError, ScanJournal, prune_journals
+from trading_platform.application.scanners.funnel import FunnelReport
+from trading_platform.application.scanners.market_scanner import MarketScanner
+from trading_platform.application.universe.universe import SymbolInfo, Universe
+
+
+def _journal(tmp_path, scan_id='scan-1') -> ScanJournal:
+    journal = ScanJournal(str(tmp_path), scan_id)
+    journal.start('20260301', 10, 5, 3)
+    return journal
+
+
+def test_journal_reloads_completed_batches(tmp_path):
+    journal = _journal(tmp_path)
+    journal.record_batch(1, [{'symbol': 'AAA', 'score': 0.5}], FunnelReport())
+    journal.record_batch(2, [], FunnelReport())
+
+    reloaded = ScanJournal(str(tmp_path), 'scan-1')
+    reloaded.start('20260301', 10, 5, 3)
+
+    assert reloaded.completed_batches == {1, 2}
+    assert reloaded.batches[1]['candidates'] == [{'symbol': 'AAA', 'score': 0.5}]
+    assert reloaded.enriched is None and not reloaded.complete
+    with pytest.raises(CheckpointError):
+        ScanJournal(str(tmp_path), 'scan-1').start('20260301', 10, 50, 3)
+
+
+@pytest.mark.parametrize('tail', [b'{"type":"batch","ind', b'{"type":"batch","index":3,"candidates":[],"funnel":{}}'])
+def test_torn_tail_is_dropped_and_appends_stay_readable(tmp_path, tail):
+    journal = _journal(tmp_path)
+    journal.record_batch(1, [], FunnelReport())
+    with open(journal.path, 'ab') as f:
+        f.write(tail)
+
+    resumed = _journal(tmp_path)
+    assert resumed.completed_batches == {1}
+    resumed.record_batch(2, [], FunnelReport())
+    resumed.record_complete()
+
+    assert _journal(tmp_path).completed_batches == {1, 2}
+    assert _journal(tmp_path).complete
+
+
+def test_prune_removes_only_old_journals(tmp_path):
+    old, new = _journal(tmp_path, 'old'), _journal(tmp_path, 'new')
+    os.utime(old.path, (time.time() - 10 * 86400,) * 2)
+
+    assert prune_journals(str(tmp_path), 7) == 1
+    assert not os.path.exists(old.path) and os.path.exists(new.path)
+
+
+def _candidate(symbol: str, score: float) -> dict:
+    technical = {'momentum': 0.05, 'volatility': 0.3, 'rsi': 50.0, 'volume_surge': 2.0}
+    return {'symbol': symbol, 'current_price': 10.0, 'volume': 1e6, 'technical_data': technical,
+            'technical_score': score, 'score': score}
+
+
+def test_interrupted_scan_resumes_after_the_last_completed_batch(tmp_path, monkeypatch):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(market_scanner.asyncio, 'sleep', lambda delay: sleep(0))
+    config = Config()
+    config.fundamentals.path = str(tmp_path / 'fundamentals.json')
+    config.scanner.batch_size = 2
+    config.scanner.checkpoint_dir = str(tmp_path / 'journals')
+    config.scoring.top_k = 3
+    symbols = ['AAA', 'BBB', 'CCC', 'DDD', 'EEE', 'FFF']
+    scanned = []
+
+    def scanner(fail_on=None) -> MarketScanner:
+        instance = MarketScanner(config)
+        instance.universe = Universe('20260301', [SymbolInfo(i, s, '', '', '', 0) for i, s in enumerate(symbols)])
+        instance.start_fundamentals_refresh = lambda: None
+
+        async def scan_batch(batch, top):
+            if batch[0] == fail_on:
+                raise RuntimeError('worker killed')
+            scanned.append(batch)
+            for symbol in batch:
+                top.push(symbols.index(symbol) / 10, symbol, _candidate(symbol, symbols.index(symbol) / 10))
+            return len(batch)
+
+        instance.scan_batch = scan_batch
+        return instance
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(scanner(fail_on='EEE').scan_market('scan-1'))
+    assert scanned == [['AAA', 'BBB'], ['CCC', 'DDD']]
+
+    results = asyncio.run(scanner().scan_market('scan-1'))
+
+    assert scanned[2:] == [['EEE', 'FFF']]
+    assert [r['symbol'] for r in results] == ['FFF', 'EEE', 'DDD']
+    # A finished scan is served from the journal
+    again = scanner()
+    assert [r['symbol'] for r in asyncio.run(again.scan_market('scan-1'))] == ['FFF', 'EEE', 'DDD']
+    assert len(scanned) == 3
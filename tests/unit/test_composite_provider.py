@@ -0,0 +1,99 @@
+import asyncio
+from datetime import date, datetime, timedelta
+import pandas as pd
+import pytest
+from trading_platform.domain.models.instrument import Instrument
+from trading_platform.infrastructure.data_providers.composite_provider import CompositeProvider
+from trading_platform.infrastructure.data_providers.local_file_provider import LocalFileProvider
+from trading_platform.infrastructure.data_providers.provider_interface import DataProviderError, MarketDataProvider
+
+
+def _bars(days: int = 3, end: date = None) -> pd.DataFrame:
+    index = pd.bdate_range(end=end or date.today(), periods=days)
+    return pd.DataFrame({'Close': range(days)}, index=index, dtype=float)
+
+
+class FakeProvider(MarketDataProvider):
+    def __init__(self, delay: float = 0.0, fail: bool = False, symbols=None):
+        self.delay = delay
+        self.fail = fail
+        self.symbols = symbols
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get_historical_data(self, instrument, start_date, end_date, interval='1d'):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail or (self.symbols is not None and instrument.symbol not in self.symbols):
+            raise DataProviderError(f"no {instrument.symbol}")
+        return _bars()
+
+    async def get_options_data(self, instrument):
+        raise NotImplementedError
+
+
+def _get(composite: CompositeProvider, symbol: str = 'AAA'):
+    return composite.get_historical_data(Instrument(symbol), datetime(2026, 1, 1), datetime.now())
+
+
+def test_fails_over_to_the_next_provider():
+    broken, good = FakeProvider(fail=True), FakeProvider()
+    composite = CompositeProvider({'broken': broken, 'good': good})
+
+    bars = asyncio.run(_get(composite))
+
+    assert len(bars) == 3
+    assert composite.stats['broken'].failures == 1
+    assert composite.stats['good'].requests == 1
+
+
+def test_all_providers_failing_raises():
+    composite = CompositeProvider({'a': FakeProvider(fail=True), 'b': FakeProvider(fail=True)})
+    with pytest.raises(DataProviderError):
+        asyncio.run(_get(composite))
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    primary, backup = FakeProvider(delay=5.0), FakeProvider()
+    composite = CompositeProvider({'primary': primary, 'backup': backup}, min_samples=3)
+    for _ in range(3):
+        # History: primary usually answers in 10 ms, backup in 50 ms
+        composite.stats['primary'].record(0.01, True)
+        composite.stats['backup'].record(0.05, True)
+
+    assert len(asyncio.run(asyncio.wait_for(_get(composite), 2.0))) == 3
+    assert composite.stats['backup'].hedges == 1
+    assert composite.stats['backup'].hedge_wins == 1
+    assert primary.cancelled == 1
+
+
+def test_bulk_request_fills_symbols_the_winner_lacks():
+    local, remote = FakeProvider(symbols={'AAA'}), FakeProvider()
+    composite = CompositeProvider({'local': local, 'remote': remote})
+
+    bars = asyncio.run(composite.get_bulk_historical_data(['AAA', 'BBB'], date.today() - timedelta(days=10)))
+
+    assert set(bars) == {'AAA', 'BBB'}
+    assert (local.calls, remote.calls) == (2, 1)
+    assert composite.bulk_stats['local'].requests == 1
+    assert composite.bulk_stats['remote'].requests == 1
+    # Bulk latencies don't feed the single-request statistics
+    assert composite.stats['local'].requests == 0
+
+
+def test_local_files_are_stale_once_the_market_has_moved_on(tmp_path):
+    old = _bars(5, end=date.today() - timedelta(days=30))
+    old.to_csv(tmp_path / 'OLD.csv')
+    provider = LocalFileProvider(str(tmp_path))
+
+    with pytest.raises(DataProviderError, match='stale'):
+        asyncio.run(provider.get_historical_data(Instrument('OLD'), datetime(2020, 1, 1), datetime.now()))
+
+    # A request ending within the file's range is served from it
+    bars = asyncio.run(provider.get_historical_data(Instrument('OLD'), datetime(2020, 1, 1),
+                                                    old.index[-1].to_pydatetime()))
+    assert len(bars) == 4
@@ -0,0 +1,89 @@
+from datetime import date
+import numpy as np
+import pandas as pd
+from trading_platform.application.config.config import Config
+from trading_platform.application.data.corporate_actions import (
+    DIVIDEND, SPLIT, CorporateAction, CorporateActions, split_actions
+)
+from trading_platform.application.indicators.feature_store import FeatureStore
+from trading_platform.application.indicators.indicator_interface import feature
+from trading_platform.application.scanners.market_scanner import MarketScanner
+
+SMA = feature('sma', window=3)
+
+
+def _bars(start: str = '2026-03-02', days: int = 5, close: float = 100.0) -> pd.DataFrame:
+    index = pd.bdate_range(start, periods=days)
+    closes = np.full(days, close)
+    return pd.DataFrame({'Open': closes, 'High': closes + 2, 'Low': closes - 2, 'Close': closes,
+                         'Volume': np.full(days, 1000, dtype=np.int64)}, index=index)
+
+
+def test_split_rescales_cached_bars_in_place():
+    features = FeatureStore()
+    actions = CorporateActions(feature_store=features)
+    bars = _bars()
+    features.get('AAA', bars, SMA)
+    split = CorporateAction('AAA', date(2026, 3, 9), SPLIT, 4.0)
+
+    assert actions.apply('AAA', actions.observe([split]), bars)
+
+    np.testing.assert_allclose(bars['Close'], 25.0)
+    np.testing.assert_allclose(bars['High'], 25.5)
+    assert bars['Volume'].dtype == np.int64 and (bars['Volume'] == 4000).all()
+    assert (actions.applied, actions.rows_rescaled) == (1, 5)
+    np.testing.assert_allclose(features.get('AAA', bars, SMA)[2:], 25.0)
+    # Seen again with the next download: already applied
+    assert actions.observe([split]) == []
+
+
+def test_actions_the_bars_already_reflect_are_only_recorded():
+    actions = CorporateActions()
+    bars = _bars()
+    split = CorporateAction('AAA', date(2026, 3, 4), SPLIT, 2.0)
+
+    assert not actions.apply('AAA', actions.observe([split]), bars)
+    np.testing.assert_allclose(bars['Close'], 100.0)
+    assert actions.actions('AAA') == [split]
+
+
+def test_dividend_is_sized_from_the_reference_close():
+    actions = CorporateActions()
+    bars = _bars()
+    dividend = CorporateAction('AAA', date(2026, 3, 10), DIVIDEND, 2.0)
+    # The fresh adjusted download: the session before the ex-date closed at 80 (after adjustment)
+    reference = _bars('2026-03-09', days=2, close=80.0)
+
+    actions.apply('AAA', actions.observe([dividend]), bars, reference=reference)
+
+    # 2 / (80 + 2) of the price comes off every earlier bar; volume is untouched
+    np.testing.assert_allclose(bars['Close'], 100.0 * (1 - 2.0 / 82.0))
+    assert (bars['Volume'] == 1000).all()
+
+
+def test_split_actions_separates_action_columns():
+    bars = _bars()
+    bars['Stock Splits'] = [0.0, 0.0, 3.0, 0.0, 0.0]
+    bars['Dividends'] = [0.0, 0.5, 0.0, 0.0, np.nan]
+
+    hist, found = split_actions('AAA', bars)
+
+    assert list(hist.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    assert sorted(found, key=lambda a: a.ex_date) == [
+        CorporateAction('AAA', date(2026, 3, 3), DIVIDEND, 0.5),
+        CorporateAction('AAA', date(2026, 3, 4), SPLIT, 3.0),
+    ]
+
+
+def test_scanner_rescales_its_cached_frame(tmp_path):
+    config = Config()
+    config.fundamentals.path = str(tmp_path / 'fundamentals.json')
+    scanner = MarketScanner(config)
+    cached = scanner.bars['AAA'] = _bars()
+
+    split = CorporateAction('AAA', date(2026, 3, 9), SPLIT, 2.0)
+
+    scanner._adjust_for_actions('AAA', [split], _bars('2026-03-09', 1, 50.0))
+
+    assert scanner.bars['AAA'] is cached
+    np.testing.assert_allclose(cached['Close'], 50.0)
@@ -0,0 +1,78 @@
+import asyncio
+from trading_platform.application.config.config import Config
+from trading_platform.application.scanners.distributed_scanner import LocalBroker, ScanCoordinator, ScanWorker
+from trading_platform.application.universe.universe import SymbolInfo, Universe
+from trading_platform.infrastructure.queue.broker_interface import ShardResult, ShardTask
+
+
+def _universe(size: int = 200) -> Universe:
+    return Universe('test', [SymbolInfo(i, f"S{i:03d}", '', 'NYSE', 'Tech', 0) for i in range(size)])
+
+
+def _fake_shards(monkeypatch, seconds, runs):
+    async def run_shard(self, task: ShardTask) -> ShardResult:
+        runs.append((task.shard_index, task.attempt))
+        elapsed = seconds(task)
+        await asyncio.sleep(elapsed)
+        return ShardResult(task.scan_id, task.shard_index, task.attempt, self.worker_id,
+                           results=[{'symbol': task.symbols[0], 'score': float(task.shard_index)}],
+                           elapsed=elapsed)
+
+    monkeypatch.setattr(ScanWorker, 'run_shard', run_shard)
+
+
+def test_queued_shards_are_not_stragglers(monkeypatch):
+    runs = []
+    _fake_shards(monkeypatch, lambda task: 0.05, runs)
+    # 12 shards on 2 workers: the last ones wait ~0.25s in the queue, 5x a shard's run time
+    coordinator = ScanCoordinator(LocalBroker(Config(), num_workers=2), num_workers=2, shards_per_worker=6,
+                                  poll_interval=0.01, top_k=5)
+
+    report = asyncio.run(coordinator.run(_universe()))
+
+    assert report.speculative == 0
+    assert len(runs) == report.shards == 12
+    assert [r['score'] for r in report.results] == [11.0, 10.0, 9.0, 8.0, 7.0]
+
+
+def test_slow_running_shard_is_resubmitted(monkeypatch):
+    runs = []
+
+    def seconds(task):
+        # Only the first copy of shard 0 hangs
+        return 1.0 if task.shard_index == 0 and runs.count((0, 0)) == 1 else 0.02
+
+    _fake_shards(monkeypatch, seconds, runs)
+    coordinator = ScanCoordinator(LocalBroker(Config(), num_workers=3), num_workers=3, shards_per_worker=2,
+                                  poll_interval=0.01)
+
+    report = asyncio.run(coordinator.run(_universe()))
+
+    assert report.speculative == 1
+    assert runs.count((0, 0)) == 2
+    assert report.shard_times[0] == 0.02
+    assert report.failed_shards == []
+
+
+class _FakeScanner:
+    def __init__(self):
+        self.funnel = None
+        self.released = 0
+
+    async def scan_batch(self, symbols, top):
+        top.extend([{'symbol': symbol, 'score': 1.0} for symbol in symbols])
+
+    def release_bars(self):
+        self.released += 1
+
+
+def test_worker_releases_bars_after_every_shard():
+    worker = ScanWorker(Config(), worker_id='w')
+    worker._scanner = _FakeScanner()
+
+    async def run():
+        for index in range(3):
+            await worker.run_shard(ShardTask('scan', index, ['AAA', 'BBB']))
+
+    asyncio.run(run())
+    assert worker._scanner.released == 3
@@ -0,0 +1,107 @@
+import asyncio
+import os
+import threading
+from datetime import datetime
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from trading_platform.domain.events.market_event import MarketEvent, SignalEvent
+from trading_platform.domain.models.instrument import Instrument, Signal
+from trading_platform.infrastructure.messaging import event_log as event_log_module
+from trading_platform.infrastructure.messaging.event_bus import InMemoryEventBus
+from trading_platform.infrastructure.messaging.event_log import EventLog, EventLogReader
+
+
+def _bars_event(symbol: str, day: str = '2026-03-02') -> MarketEvent:
+    index = pd.date_range(day, periods=3, freq='D', tz='America/New_York')
+    frame = pd.DataFrame({'Open': [1.0, 2.0, 3.0], 'Close': [1.5, 2.5, 3.5], 'Volume': [100.0, 200.0, 300.0]},
+                         index=index)
+    return MarketEvent(Instrument(symbol), Decimal('3.5'), datetime(2026, 3, 4, 16), 'BARS_REFRESHED', frame)
+
+
+def _signal_event(symbol: str) -> SignalEvent:
+    signal = Signal(Instrument(symbol), 'BUY', 0.9, datetime(2026, 3, 4, 16, 5), Decimal('3.5'),
+                    {'rsi': 28.5}, 0.9, reason=['oversold'])
+    return SignalEvent(signal, datetime(2026, 3, 4, 16, 5))
+
+
+def test_events_round_trip(tmp_path):
+    bars = _bars_event('AAA')
+    with EventLog(str(tmp_path)) as log:
+        log.append(bars)
+        log.append(_signal_event('BBB'))
+        log.append(MarketEvent(Instrument('CCC'), Decimal('10'), datetime(2026, 3, 4, 16), 'QUOTE', {'bid': 9.9}))
+
+    with EventLogReader(str(tmp_path)) as reader:
+        events = list(reader.read())
+        only_signals = list(reader.read(types=(SignalEvent,)))
+        only_aaa = list(reader.read(symbols=['AAA']))
+
+    assert len(events) == 3
+    # Stored at ns resolution whatever the source's
+    pd.testing.assert_frame_equal(events[0].data, bars.data, check_freq=False, check_index_type=False)
+    assert events[0].price == Decimal('3.5')
+    assert events[1].signal == _signal_event('BBB').signal
+    assert events[2].data == {'bid': 9.9}
+    assert [e.signal.instrument.symbol for e in only_signals] == ['BBB']
+    assert [e.instrument.symbol for e in only_aaa] == ['AAA']
+
+
+def test_torn_tail_is_cut_off_on_reopen(tmp_path):
+    with EventLog(str(tmp_path)) as log:
+        log.append(_bars_event('AAA'))
+        log.append(_bars_event('BBB'))
+    segment = tmp_path / '00000000.seg'
+    size = segment.stat().st_size
+    with open(segment, 'r+b') as f:
+        f.truncate(size - 10)     # A crash in the middle of the second record
+
+    with EventLog(str(tmp_path)) as log:
+        log.append(_signal_event('CCC'))
+
+    with EventLogReader(str(tmp_path)) as reader:
+        symbols = [e.instrument.symbol if isinstance(e, MarketEvent) else e.signal.instrument.symbol
+                   for e in reader.read()]
+    assert symbols == ['AAA', 'CCC']
+
+
+def test_sealed_segment_index_matches_a_rescan(tmp_path):
+    with EventLog(str(tmp_path), segment_bytes=2048) as log:
+        for i in range(12):
+            log.append(_bars_event(f'S{i}'))
+
+    sealed = sorted(name for name in os.listdir(tmp_path) if name.endswith('.idx.npy'))
+    assert sealed
+    for name in sealed:
+        index = np.load(tmp_path / name)
+        data = (tmp_path / name.replace('.idx.npy', '.seg')).read_bytes()
+        rescanned, _ = event_log_module._scan_segment(data, len(data))
+        np.testing.assert_array_equal(index, rescanned)
+    with EventLogReader(str(tmp_path)) as reader:
+        assert [e.instrument.symbol for e in reader.read()] == [f'S{i}' for i in range(12)]
+
+
+def test_attached_log_writes_on_its_writer_thread(tmp_path, monkeypatch):
+    threads = set()
+    encode = event_log_module._encode_bars
+
+    def recording_encode(event):
+        threads.add(threading.current_thread().name)
+        return encode(event)
+    monkeypatch.setattr(event_log_module, '_encode_bars', recording_encode)
+
+    async def run():
+        bus = InMemoryEventBus()
+        log = EventLog(str(tmp_path))
+        log.attach(bus)
+        for symbol in ('AAA', 'BBB', 'CCC'):
+            await bus.publish(_bars_event(symbol))
+        await log.drain()
+        log.detach(bus)
+        log.close()
+
+    asyncio.run(run())
+
+    assert len(threads) == 1 and threading.main_thread().name not in threads
+    with EventLogReader(str(tmp_path)) as reader:
+        assert [e.instrument.symbol for e in reader.read()] == ['AAA', 'BBB', 'CCC']
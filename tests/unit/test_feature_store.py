@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from trading_platform.application.config.config import Config
+from trading_platform.application.indicators.feature_store import FeatureStore, compute_features
+from trading_platform.application.indicators.indicator_interface import feature
+from trading_platform.application.scanners.market_scanner import MarketScanner
+
+RSI = feature('rsi', period=14)
+SMA = feature('sma', window=5)
+
+
+def _bars(days: int = 40) -> pd.DataFrame:
+    index = pd.bdate_range(end=date.today(), periods=days)
+    close = 100 + np.cumsum(np.sin(np.arange(days)))
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': np.full(days, 1e6)}, index=index)
+
+
+def test_features_are_cached_per_data_version():
+    store = FeatureStore()
+    bars = _bars()
+
+    first = store.get_many('AAA', bars, [RSI, SMA])
+    again = store.get_many('AAA', bars.copy(), [RSI, SMA])
+
+    assert again[RSI] is first[RSI]
+    assert (store.stats.hits, store.stats.misses) == (2, 2)
+    assert not first[RSI].flags.writeable
+    # A new bar is a new version
+    longer = store.get('AAA', _bars(41), RSI)
+    assert store.stats.misses == 3
+    np.testing.assert_allclose(longer, compute_features(_bars(41), [RSI])[RSI])
+
+
+def test_refetched_partial_bar_is_a_new_version():
+    store = FeatureStore()
+    bars = _bars()
+    before = store.get('AAA', bars, SMA)
+
+    # Same last timestamp, same length: the session's bar was partial and has moved since
+    updated = bars.copy()
+    updated.iloc[-1, updated.columns.get_loc('Close')] += 5.0
+    after = store.get('AAA', updated, SMA)
+
+    assert after[-1] == before[-1] + 1.0
+    np.testing.assert_allclose(after, compute_features(updated, [SMA])[SMA])
+
+
+def test_rescan_after_a_partial_bar_changes_sees_the_new_close(tmp_path):
+    config = Config()
+    config.fundamentals.path = str(tmp_path / 'fundamentals.json')
+    scanner = MarketScanner(config)
+    bars = _bars()
+    scanner._merge_bars('AAA', bars, covered_from=date.today() - timedelta(days=60))
+    rsi_before = scanner.features.get('AAA', scanner.bars['AAA'], RSI)
+
+    # The refetch of the last session replaces its bar in place
+    refetched = bars.iloc[-1:].copy()
+    refetched['Close'] += 10.0
+    scanner._merge_bars('AAA', refetched, covered_from=bars.index[-1].date())
+    rsi_after = scanner.features.get('AAA', scanner.bars['AAA'], RSI)
+
+    assert len(scanner.bars['AAA']) == len(bars)
+    assert rsi_after[-1] > rsi_before[-1]
+    np.testing.assert_allclose(rsi_after, compute_features(scanner.bars['AAA'], [RSI])[RSI])
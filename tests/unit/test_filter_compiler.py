@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+from trading_platform.application.config.config import DEFAULT_FILTERS, ScannerConfig
+from trading_platform.application.filters.cross_section import CrossSection
+from trading_platform.application.filters.filter_compiler import FilterError, FilterSet
+from trading_platform.application.indicators.feature_store import compute_features
+from trading_platform.application.indicators.indicator_interface import feature
+
+SMA_20 = feature('sma', window=20)
+SMA_50 = feature('sma', window=50)
+RSI_14 = feature('rsi', period=14)
+
+
+def _universe(size: int = 300, seed: int = 7) -> dict:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end='2026-03-02', periods=90)
+    frames = {}
+    for i in range(size):
+        days = int(rng.integers(40, 90))
+        drift, vol = rng.normal(0.002, 0.003), rng.uniform(0.003, 0.04)
+        close = rng.uniform(2, 1200) * np.cumprod(1 + rng.normal(drift, vol, days))
+        volume = rng.uniform(2e5, 3e6) * np.where(np.arange(days) >= days - 5, rng.uniform(0.5, 3.0), 1.0)
+        frames[f"S{i:03d}"] = pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                                            'Volume': volume}, index=dates[-days:])
+    return frames
+
+
+def _baseline(tier: str, hist: pd.DataFrame, c: ScannerConfig) -> bool:
+    """The scanner's per-symbol pandas checks from before the filters were compiled"""
+    close = hist['Close']
+    if tier == 'snapshot':
+        return c.min_price <= close.iloc[-1] <= c.max_price and hist['Volume'].iloc[-1] >= c.min_volume
+    if tier == 'short_history':
+        return c.min_volatility <= close.pct_change().std() * np.sqrt(252) <= c.max_volatility
+    if len(hist) < c.min_history_bars:
+        return False
+    features = compute_features(hist, [SMA_20, SMA_50, RSI_14])
+    return all([
+        hist['Volume'].iloc[-5:].mean() > hist['Volume'].mean() * c.volume_surge_factor,
+        close.iloc[-1] > features[SMA_20][-1],
+        features[SMA_20][-1] > features[SMA_50][-1],
+        c.min_rsi <= features[RSI_14][-1] <= c.max_rsi,
+        close.iloc[-1] / close.iloc[-c.momentum_lookback] - 1 > c.min_momentum,
+    ])
+
+
+@pytest.mark.parametrize('tier', list(DEFAULT_FILTERS))
+def test_default_filters_match_the_baseline_checks(tier):
+    config = ScannerConfig()
+    # Looser thresholds so every tier keeps a meaningful share of the universe
+    config.min_volume, config.volume_surge_factor, config.min_momentum = 500_000, 1.2, 0.0
+    frames = _universe()
+    expected = [symbol for symbol, hist in frames.items() if _baseline(tier, hist, config)]
+    filters = FilterSet(DEFAULT_FILTERS[tier], config)
+
+    # Twice: the second run uses the adaptively reordered predicates
+    for _ in range(2):
+        assert filters.apply(CrossSection(frames)) == expected
+    assert 0 < len(expected) < len(frames)
+    assert sum(filters.last_eliminated.values()) == len(frames) - len(expected)
+
+
+def test_thresholds_are_read_when_the_filters_run():
+    config = ScannerConfig()
+    frames = {'LOW': _universe(1)['S000'].assign(Close=3.0), 'MID': _universe(1)['S000'].assign(Close=50.0)}
+    filters = FilterSet(['min_price <= close <= max_price'], config)
+    section = CrossSection(frames)
+
+    assert filters.apply(section) == ['MID']
+    config.min_price = 1.0
+    assert filters.apply(section) == ['LOW', 'MID']
+
+
+def test_selective_predicates_move_first():
+    frames = _universe()
+    config = ScannerConfig()
+    filters = FilterSet(['bars >= 1', 'close > 1e9'], config)
+    filters.apply(CrossSection(frames))
+    filters.apply(CrossSection(frames))
+    assert [p.expression for p in filters.predicates] == ['close > 1e9', 'bars >= 1']
+
+
+@pytest.mark.parametrize('expression', ['close > ', '__import__("os")', 'close.real > 1', 'unknown_metric > 1',
+                                        'close > "5"'])
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(FilterError):
+        FilterSet([expression], ScannerConfig())
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+import time
+from trading_platform.infrastructure.storage.fundamentals_store import CompanyFundamentals, FundamentalsStore
+
+
+def test_refresh_fetches_stale_symbols_and_persists(tmp_path):
+    path = str(tmp_path / 'fundamentals.json')
+    fetched = []
+
+    def fetcher(symbol):
+        fetched.append(symbol)
+        return CompanyFundamentals(symbol, company_name=f"{symbol} Inc", updated_at=time.time())
+
+    store = FundamentalsStore(path, save_every=2, fetcher=fetcher)
+    store.seed([CompanyFundamentals('AAA'), CompanyFundamentals('BBB', updated_at=time.time())])
+
+    async def run():
+        updated = await store.refresh(['AAA', 'BBB', 'CCC'])
+        await store.stop()
+        return updated
+
+    assert asyncio.run(run()) == 2
+    assert sorted(fetched) == ['AAA', 'CCC']
+    assert FundamentalsStore(path, fetcher=fetcher).get('CCC').company_name == 'CCC Inc'
+
+
+def test_stop_does_not_wait_on_running_or_queued_fetches(tmp_path):
+    release = threading.Event()
+    fetched = []
+
+    def fetcher(symbol):
+        fetched.append(symbol)
+        release.wait(5.0)
+        return CompanyFundamentals(symbol, updated_at=time.time())
+
+    store = FundamentalsStore(str(tmp_path / 'fundamentals.json'), refresh_concurrency=1, fetcher=fetcher)
+
+    async def run():
+        store.start(lambda: ['AAA', 'BBB', 'CCC'])
+        while not fetched:
+            await asyncio.sleep(0.01)
+        started = time.monotonic()
+        await store.stop()
+        return time.monotonic() - started
+
+    try:
+        assert asyncio.run(run()) < 1.0
+    finally:
+        release.set()
+    time.sleep(0.05)
+    # The queued fetches were dropped, not run after the stop
+    assert fetched == ['AAA']
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from trading_platform.application.config.config import Config
+from trading_platform.application.scanners.funnel import FunnelReport
+from trading_platform.application.scanners.market_scanner import MarketScanner
+from trading_platform.application.scanners.ranking import TopK
+from trading_platform.infrastructure.data_providers.provider_interface import MarketDataProvider
+
+DAYS = 120
+
+
+def _series(close: np.ndarray, volume: float) -> pd.DataFrame:
+    index = pd.bdate_range(end=date.today(), periods=len(close))
+    return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                         'Volume': np.full(len(close), volume)}, index=index)
+
+
+# Alternating +-1.5% days: ~24% annualized volatility
+WAVY = 50 * np.cumprod(np.where(np.arange(DAYS) % 2, 1.015, 1 / 1.015))
+BARS = {
+    'CHEAP': _series(np.full(DAYS, 2.0), 5e6),       # Fails the snapshot price filter
+    'FLAT': _series(np.full(DAYS, 50.0), 5e6),       # Fails the volatility filter
+    'WAVY': _series(WAVY, 5e6),
+}
+
+
+class RecordingProvider(MarketDataProvider):
+    def __init__(self):
+        self.requests = []
+
+    async def get_historical_data(self, instrument, start_date, end_date, interval='1d'):
+        raise NotImplementedError
+
+    async def get_options_data(self, instrument):
+        raise NotImplementedError
+
+    async def get_bulk_historical_data(self, symbols, start, end=None):
+        self.requests.append((sorted(symbols), start))
+        end = end or date.today() + timedelta(days=1)
+        return {symbol: BARS[symbol][(BARS[symbol].index >= pd.Timestamp(start))
+                                     & (BARS[symbol].index < pd.Timestamp(end))]
+                for symbol in symbols}
+
+
+def test_each_tier_only_fetches_for_the_previous_tiers_survivors(tmp_path):
+    config = Config()
+    config.fundamentals.path = str(tmp_path / 'fundamentals.json')
+    provider = RecordingProvider()
+    scanner = MarketScanner(config, bar_provider=provider)
+
+    asyncio.run(scanner.scan_batch(['CHEAP', 'FLAT', 'WAVY'], TopK(5)))
+
+    assert [symbols for symbols, _ in provider.requests] == [['CHEAP', 'FLAT', 'WAVY'], ['FLAT', 'WAVY'], ['WAVY']]
+    tiers = scanner.funnel.tiers
+    assert (tiers['snapshot'].symbols_in, tiers['snapshot'].symbols_out) == (3, 2)
+    assert (tiers['short_history'].symbols_in, tiers['short_history'].symbols_out) == (2, 1)
+    assert tiers['detailed'].symbols_in == 1
+    assert [tiers[name].requests for name in ('snapshot', 'short_history', 'detailed')] == [1, 1, 1]
+    assert scanner.funnel.eliminated['min_price <= close <= max_price'] == 1
+    assert scanner.funnel.eliminated['min_volatility <= volatility <= max_volatility'] == 1
+
+
+def test_funnel_reports_merge_and_round_trip():
+    first, second = FunnelReport(), FunnelReport()
+    first.tiers['snapshot'].symbols_in, first.tiers['snapshot'].symbols_out = 100, 40
+    second.tiers['snapshot'].symbols_in, second.tiers['snapshot'].symbols_out = 50, 10
+    first.count_eliminated({'volume >= min_volume': 60})
+    second.count_eliminated({'volume >= min_volume': 40})
+
+    first.merge(FunnelReport.from_dict(second.to_dict()))
+
+    assert first.tiers['snapshot'].pass_rate == 50 / 150
+    assert first.eliminated == {'volume >= min_volume': 100}
+    assert first.summary()[0].startswith('snapshot: 150 -> 50 (33%)')
@@ -0,0 +1,64 @@
+"""Import-time budget for the entry-point modules.
+
+Each module is imported in a fresh interpreter with ``-X importtime``. A
+module fails if it pulls in a dependency meant to load on first use, or
+takes longer than its budget. Set IMPORT_BUDGET_SCALE (e.g. 2) on slow
+machines.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+import pytest
+import trading_platform
+
+# The sys.path entry tests/conftest.py set up for importing ``trading_platform``
+PACKAGE_PATH = str(Path(trading_platform.__path__[0]).parent)
+
+# Libraries that must only load when the code path needing them runs
+DEFERRED = ('yfinance', 'sklearn', 'aiohttp', 'aio_pika', 'colorama', 'scipy')
+
+# Entry module -> budget in milliseconds (pandas alone is ~300ms)
+ENTRY_POINTS = {
+    # What `run_scanner.py --help` loads; the scanner is imported after argument parsing
+    'trading_platform.run_scanner': 250.0,
+    'trading_platform.application.scanners.distributed_scanner': 250.0,
+    'trading_platform.application.scanners.scheduler': 250.0,
+    'trading_platform.infrastructure.monitoring.log_pipeline': 150.0,
+    'trading_platform.application.scanners.market_scanner': 600.0,
+    'trading_platform.application.services.analysis_service': 600.0,
+    'trading_platform.interfaces.cli.main': 700.0,
+}
+
+SCALE = float(os.getenv('IMPORT_BUDGET_SCALE', '1.0'))
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """Cumulative import time in ms and the deferred libraries it loaded"""
+    env = dict(os.environ, PYTHONPATH=PACKAGE_PATH)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=env, cwd=PACKAGE_PATH
+    )
+    assert proc.returncode == 0, proc.stderr.strip().splitlines()[-1]
+
+    elapsed_us, loaded = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        if not name.startswith('  '):
+            elapsed_us += int(cumulative)  # Top-level import
+        loaded.add(name.strip().split('.')[0])
+    return elapsed_us / 1000.0, sorted(loaded.intersection(DEFERRED))
+
+
+@pytest.mark.parametrize('module,budget_ms', ENTRY_POINTS.items())
+def test_import_budget(module, budget_ms):
+    elapsed_ms, deferred_loaded = measure(module)
+    assert not deferred_loaded, f"{module} eagerly imports {', '.join(deferred_loaded)}"
+    assert elapsed_ms <= budget_ms * SCALE, \
+        f"{module}: {elapsed_ms:.0f}ms exceeds {budget_ms * SCALE:.0f}ms budget"
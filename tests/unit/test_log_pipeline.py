@@ -0,0 +1,79 @@
+import io
+import json
+import logging
+import threading
+import time
+import pytest
+from trading_platform.infrastructure.monitoring.log_pipeline import (
+    JsonFormatter, LogPipeline, ScanLogger, SymbolRateLimitFilter
+)
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _record(level=logging.INFO, symbol=None, msg='scanned %s', args=('AAA',)) -> logging.LogRecord:
+    record = logging.LogRecord('scan', level, __file__, 1, msg, args, None)
+    if symbol is not None:
+        record.symbol = symbol
+    return record
+
+
+def test_symbol_filter_samples_rate_limits_and_reports_drops():
+    sampled = SymbolRateLimitFilter(sample_rate=3, rate=0.0, burst=100)
+    passed = [sampled.filter(_record(symbol='AAA')) for _ in range(7)]
+    assert passed == [True, False, False, True, False, False, True]
+    # Warnings are never sampled out
+    assert sampled.filter(_record(logging.WARNING, symbol='AAA'))
+
+    limited = SymbolRateLimitFilter(rate=0.0, burst=2)
+    assert [limited.filter(_record(logging.WARNING, symbol='BBB')) for _ in range(4)] == [True, True, False, False]
+    assert limited.filter(_record(symbol=None))
+
+    # The next record through carries the number dropped before it
+    refilled = SymbolRateLimitFilter(rate=20.0, burst=1)
+    assert refilled.filter(_record(symbol='CCC'))
+    assert not refilled.filter(_record(symbol='CCC'))
+    time.sleep(0.1)
+    record = _record(symbol='CCC')
+    assert refilled.filter(record) and record.suppressed == 1
+
+
+def test_json_formatter_includes_extra_fields():
+    record = _record(symbol='AAA')
+    entry = json.loads(JsonFormatter().format(record))
+    assert (entry['message'], entry['level'], entry['logger'], entry['symbol']) == ('scanned AAA', 'INFO', 'scan', 'AAA')
+
+
+class _Arg:
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread().name)
+        return 'arg'
+
+
+def test_scan_logger_formats_on_the_writer_thread(root_logger):
+    stream = io.StringIO()
+    pipeline = LogPipeline(level='INFO', color=False, stream=stream)
+    pipeline.start()
+    log = ScanLogger('scan-test')
+    arg = _Arg()
+
+    log.debug('hidden %s', arg)
+    log.success('found %s', arg, symbol='AAA')
+    pipeline.stop()
+
+    assert stream.getvalue().strip().endswith('INFO - found arg')
+    # Interpolated once, off the calling thread; never for the disabled debug call
+    assert len(arg.threads) == 1 and arg.threads[0] != threading.current_thread().name
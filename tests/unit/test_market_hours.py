@@ -0,0 +1,40 @@
+from datetime import date, datetime
+from trading_platform.application.utils.market_hours import (
+    EARLY_CLOSE, MARKET_TZ, early_closes, is_market_open, market_holidays, next_market_open,
+    previous_market_close, previous_trading_day
+)
+
+
+def _ny(*args) -> datetime:
+    return datetime(*args, tzinfo=MARKET_TZ)
+
+
+def test_holidays_match_the_published_nyse_calendar():
+    assert market_holidays(2026) == {
+        date(2026, 1, 1), date(2026, 1, 19), date(2026, 2, 16), date(2026, 4, 3), date(2026, 5, 25),
+        date(2026, 6, 19), date(2026, 7, 3), date(2026, 9, 7), date(2026, 11, 26), date(2026, 12, 25),
+    }
+    # Saturday holidays move to Friday, except New Year's Day
+    assert market_holidays(2027) == {
+        date(2027, 1, 1), date(2027, 1, 18), date(2027, 2, 15), date(2027, 3, 26), date(2027, 5, 31),
+        date(2027, 6, 18), date(2027, 7, 5), date(2027, 9, 6), date(2027, 11, 25), date(2027, 12, 24),
+    }
+    assert date(2021, 12, 31) not in market_holidays(2021)
+    assert date(2021, 6, 18) not in market_holidays(2021)   # Before Juneteenth was a market holiday
+
+
+def test_early_closes_skip_weekends_and_holidays():
+    # July 3rd 2026 is the observed Independence Day, not a half day
+    assert early_closes(2026) == {date(2026, 11, 27), date(2026, 12, 24)}
+    assert early_closes(2025) == {date(2025, 7, 3), date(2025, 11, 28), date(2025, 12, 24)}
+    assert is_market_open(_ny(2026, 11, 27, 12, 59))
+    assert not is_market_open(_ny(2026, 11, 27, EARLY_CLOSE.hour, 0))
+
+
+def test_session_boundaries_skip_holidays_and_weekends():
+    assert not is_market_open(_ny(2026, 4, 3, 11))    # Good Friday
+    assert next_market_open(_ny(2026, 4, 2, 16, 30)) == _ny(2026, 4, 6, 9, 30)
+    assert next_market_open(_ny(2026, 4, 6, 8)) == _ny(2026, 4, 6, 9, 30)
+    assert previous_market_close(_ny(2026, 4, 6, 9)) == _ny(2026, 4, 2, 16)
+    assert previous_market_close(_ny(2026, 11, 30, 10)) == _ny(2026, 11, 27, 13)
+    assert previous_trading_day(date(2026, 1, 20)) == date(2026, 1, 16)
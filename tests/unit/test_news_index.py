@@ -0,0 +1,75 @@
+import asyncio
+from datetime import datetime, timedelta
+from trading_platform.application.config.config import Config
+from trading_platform.application.news.news_analyzer import NewsAnalyzer
+from trading_platform.application.news.news_index import NewsIngestor, ReanalysisQueue, TickerNewsIndex
+
+
+def _article(url: str, tickers, hours_ago: float = 1.0, sentiment: float = 0.5, **extra) -> dict:
+    date = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+    return {'url': url, 'title': url, 'date': date, 'tickers': list(tickers), 'sentiment': sentiment, **extra}
+
+
+def test_articles_are_stored_once_and_indexed_per_ticker():
+    index = TickerNewsIndex(max_age_days=7, max_per_ticker=2)
+    merger = _article('u1', ['AAA', 'BBB'], ticker_sentiment={'BBB': -0.6})
+
+    gained = index.add([merger, _article('u2', ['AAA'], hours_ago=5), _article('u3', ['AAA'], hours_ago=3),
+                        _article('u4', ['CCC'], hours_ago=24 * 10)])
+    # Polled again, or from another provider
+    assert index.add([dict(merger)]) == {}
+
+    assert gained == {'AAA': 3, 'BBB': 1}
+    assert len(index) == 3
+    assert [a['url'] for a in index.articles('AAA')] == ['u1', 'u3']   # Newest two
+    assert index.articles('BBB')[0]['sentiment'] == -0.6
+    assert index.articles('AAA')[0]['sentiment'] == 0.5
+    assert index.tickers() == {'AAA', 'BBB'}
+
+
+def test_prune_drops_expired_articles_and_empty_tickers():
+    index = TickerNewsIndex(max_age_days=1)
+    index.add([_article('old', ['AAA'], hours_ago=20), _article('new', ['BBB'], hours_ago=1)])
+    index.max_age = timedelta(hours=10)
+
+    assert index.prune() == 1
+    assert index.tickers() == {'BBB'} and index.articles('AAA') == []
+
+
+def test_queue_holds_each_ticker_once():
+    async def run():
+        queue = ReanalysisQueue()
+        assert queue.put('AAA') and not queue.put('AAA') and queue.put('BBB')
+        assert await queue.get() == 'AAA'
+        assert queue.put('AAA')
+        return queue.drain(limit=1), queue.drain()
+
+    assert asyncio.run(run()) == (['BBB'], ['AAA'])
+
+
+class FeedProvider:
+    def __init__(self, feed):
+        self.feed = feed
+
+    async def get_market_news(self, days_back):
+        if isinstance(self.feed, Exception):
+            raise self.feed
+        return self.feed
+
+
+def test_ingestor_queues_only_accepted_tickers_with_significant_news():
+    feed = [_article(f"a{i}", ['AAA', 'ZZZ']) for i in range(3)] + [_article('b0', ['BBB'])]
+    ingestor = NewsIngestor([FeedProvider(feed), FeedProvider(RuntimeError('feed down'))],
+                            NewsAnalyzer(Config(), []), accept=lambda ticker: ticker != 'ZZZ')
+
+    async def run():
+        return await ingestor.poll_once(), await ingestor.poll_once()
+
+    first, second = asyncio.run(run())
+
+    # BBB's single article isn't significant; ZZZ isn't in the universe
+    assert first == ['AAA']
+    # Nothing new the second time round
+    assert second == [] and len(ingestor.queue) == 1
+    assert ingestor.news_for('AAA')['has_significant_news']
+    assert ingestor.news_for('CCC') is None
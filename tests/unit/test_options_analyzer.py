@@ -0,0 +1,48 @@
+import numpy as np
+from trading_platform.application.options import black_scholes as bs
+from trading_platform.application.options.options_analyzer import OptionsAnalyzer
+from trading_platform.config import Config
+
+
+def test_implied_volatility_round_trips_prices():
+    strike = np.array([80.0, 95.0, 100.0, 105.0, 120.0] * 2)
+    is_call = np.array([True] * 5 + [False] * 5)
+    vol = np.linspace(0.15, 0.6, 10)
+    prices = bs.price(100.0, strike, 0.25, 0.045, vol, is_call)
+
+    iv = bs.implied_volatility(prices, 100.0, strike, 0.25, 0.045, is_call)
+
+    np.testing.assert_allclose(iv, vol, rtol=1e-6)
+
+
+def test_implied_volatility_is_nan_outside_arbitrage_bounds():
+    # Below intrinsic value, and above the spot price for a call
+    iv = bs.implied_volatility(np.array([5.0, 150.0]), 100.0, np.array([80.0, 100.0]), 0.25, 0.045,
+                               np.array([True, True]))
+    assert np.isnan(iv).all()
+
+
+def test_evaluate_filters_with_config_and_prices_survivors():
+    config = Config(max_option_price=10.0, min_open_interest=100, min_volume=10, risk_free_rate=0.045)
+    analyzer = OptionsAnalyzer(provider=None, config=config)
+    strike = np.array([100.0, 100.0, 130.0, 100.0])
+    fair = bs.price(100.0, strike, 30 / 365, 0.045, 0.3, np.array([True, False, True, True]))
+    columns = {
+        'strike': strike,
+        'bid': fair - 0.05,
+        'ask': fair + 0.05,
+        'lastPrice': fair,
+        'volume': np.array([50.0, 50.0, 50.0, 1.0]),           # last one too illiquid
+        'openInterest': np.array([500.0, 900.0, 50.0, 500.0]),  # third below min_open_interest
+        'contract': np.array(['C100', 'P100', 'C130', 'C100b'], dtype=object),
+        'is_call': np.array([True, False, True, True]),
+        'dte': np.full(4, 30.0),
+        'expiration': np.full(4, '2030-01-18', dtype=object),
+    }
+
+    results = analyzer.evaluate(columns, 100.0)
+
+    assert [r['contract'] for r in results] == ['P100', 'C100']   # most open interest first
+    for result in results:
+        assert abs(result['implied_volatility'] - 0.3) < 1e-3
+    assert results[0]['delta'] < 0 < results[1]['delta']
@@ -0,0 +1,49 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from trading_platform.application.data.panel import BarPanel, PanelError
+
+
+def _frame(days: int = 30, offset: float = 0.0, start: str = '2026-01-05') -> pd.DataFrame:
+    index = pd.bdate_range(start, periods=days)
+    close = 100 + offset + np.arange(days, dtype=float)
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': np.full(days, 1e6)}, index=index)
+
+
+def test_frames_round_trip_on_the_union_of_dates():
+    frames = {'AAA': _frame(), 'BBB': _frame(20, 50.0, start='2026-01-19')}
+
+    panel = BarPanel.from_frames(frames)
+
+    assert panel.shape == (5, 2, 30)
+    pd.testing.assert_frame_equal(panel.to_frame('AAA'), frames['AAA'], check_freq=False, check_index_type=False)
+    assert np.isnan(panel.series('BBB')[:10]).all()
+    np.testing.assert_array_equal(panel.latest(), [129.0, 169.0])
+    assert panel.field('Close', days=5).shape == (2, 5)
+    with pytest.raises(PanelError):
+        panel.series('CCC')
+
+
+def test_spilled_panel_reads_and_rolls_like_an_in_memory_one(tmp_path):
+    frames = {symbol: _frame(offset=i * 10.0) for i, symbol in enumerate(('AAA', 'BBB', 'CCC'))}
+    # 5 fields x 3 symbols x 4 bytes = 60 bytes a day: 8 days stay in RAM
+    spilled = BarPanel.from_frames(frames, memory_budget=480, spill_dir=str(tmp_path))
+    in_memory = BarPanel.from_frames(frames)
+
+    assert spilled.spilled and spilled.hot_days == 8
+    assert spilled.footprint()['mapped_bytes'] == 5 * 3 * 22 * 4
+    np.testing.assert_array_equal(spilled.field('Close'), in_memory.field('Close'))
+
+    day = {'Close': np.array([1.0, 2.0, 3.0])}
+    for panel in (spilled, in_memory):
+        panel.append_day(pd.Timestamp('2026-02-16'), day)
+    np.testing.assert_array_equal(spilled.field('Close'), in_memory.field('Close'))
+    assert spilled.dates[-1] == np.datetime64('2026-02-16')
+    with pytest.raises(PanelError):
+        spilled.append_day(pd.Timestamp('2026-02-16'), day)
+
+    path = spilled._spill_path
+    spilled.close()
+    assert not os.path.exists(path)
@@ -0,0 +1,56 @@
+import random
+from trading_platform.application.config.config import ScoringConfig
+from trading_platform.application.scanners.ranking import TopK, rank_results, technical_score
+
+
+def _results(scores) -> list:
+    return [{'symbol': symbol, 'score': score} for symbol, score in scores]
+
+
+def test_ties_resolve_by_symbol_in_any_push_order():
+    scored = _results([('DDD', 1.0), ('AAA', 1.0), ('CCC', 2.0), ('BBB', 1.0), ('EEE', 0.5)])
+    expected = ['CCC', 'AAA', 'BBB']
+
+    for seed in range(20):
+        shuffled = scored[:]
+        random.Random(seed).shuffle(shuffled)
+        top = TopK(3)
+        top.extend(shuffled)
+        assert [r['symbol'] for r in top.items()] == expected
+    assert top.threshold == 1.0 and top.seen == 5
+
+
+def test_merged_shard_selections_equal_one_global_selection():
+    rng = random.Random(3)
+    # Few distinct scores, so ties are everywhere
+    scored = _results((f"S{i:03d}", rng.choice([0.1, 0.2, 0.3])) for i in range(200))
+    single = TopK(25)
+    single.extend(scored)
+
+    merged = TopK(25)
+    for shard in range(4):
+        shard_top = TopK(25)
+        shard_top.extend(scored[shard::4])
+        merged.extend(shard_top.items())
+
+    assert merged.items() == single.items() == rank_results(scored)[:25]
+
+
+def test_push_reports_whether_the_item_was_kept():
+    top = TopK(2)
+    assert top.push(1.0, 'BBB', 'b') and top.push(1.0, 'CCC', 'c')
+    assert top.threshold == 1.0
+    # Same score, earlier symbol: displaces CCC
+    assert top.push(1.0, 'AAA', 'a')
+    assert not top.push(1.0, 'DDD', 'd')
+    assert top.items() == ['a', 'b']
+    assert not TopK(0).push(5.0, 'AAA', 'a')
+
+
+def test_technical_score_weights_clipped_components():
+    config = ScoringConfig()
+    neutral = technical_score({'momentum': 0.0, 'volume_surge': 1.0, 'rsi': 50.0}, config)
+    assert neutral == config.rsi_weight
+    extreme = technical_score({'momentum': 10.0, 'volume_surge': 100.0, 'rsi': 90.0}, config)
+    assert extreme == config.momentum_weight + config.volume_weight
+    assert technical_score({'momentum': float('nan'), 'volume_surge': 1.0, 'rsi': 30.0}, config) == 0.0
@@ -0,0 +1,79 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from aiohttp.test_utils import TestClient, TestServer
+from trading_platform.domain.models.instrument import Instrument, Signal
+from trading_platform.interfaces.api import server
+from trading_platform.interfaces.api.results_store import ResultsStore
+
+
+def _signal(symbol: str) -> Signal:
+    return Signal(instrument=Instrument(symbol), type='BUY', confidence=0.8, timestamp=datetime(2026, 3, 2, 15),
+                  price=Decimal('101.5'), technical_indicators={'rsi': 31.0}, prediction=0.8)
+
+
+def _serve(store: ResultsStore, scenario):
+    async def run():
+        async with TestClient(TestServer(server.create_app(store))) as client:
+            return await scenario(client)
+    return asyncio.run(run())
+
+
+def test_scan_pages_are_paginated_and_revalidated_by_etag():
+    store = ResultsStore()
+    store.update_scan([{'symbol': f'S{i}', 'score': i} for i in range(5)])
+
+    async def scenario(client):
+        response = await client.get('/api/scan', params={'offset': 1, 'limit': 2})
+        body = await response.json()
+        etag = response.headers['ETag']
+        unchanged = await client.get('/api/scan', params={'offset': 1, 'limit': 2}, headers={'If-None-Match': etag})
+        store.update_scan([{'symbol': 'NEW', 'score': 9}])
+        changed = await client.get('/api/scan', params={'offset': 1, 'limit': 2}, headers={'If-None-Match': etag})
+        return body, unchanged.status, changed.status
+
+    body, unchanged, changed = _serve(store, scenario)
+
+    assert body['total'] == 5
+    assert [result['symbol'] for result in body['results']] == ['S1', 'S2']
+    assert (unchanged, changed) == (304, 200)
+
+
+def test_signal_stream_replays_from_last_event_id_then_streams_live():
+    store = ResultsStore()
+    for symbol in ('AAA', 'BBB', 'CCC'):
+        store.add_signal(_signal(symbol))
+
+    async def scenario(client):
+        response = await client.get('/api/signals/stream', headers={'Last-Event-ID': '1'})
+        ids = []
+        while len(ids) < 3:
+            line = (await response.content.readline()).decode()
+            if line.startswith('id: '):
+                ids.append(int(line[4:]))
+                if len(ids) == 2:
+                    store.add_signal(_signal('DDD'))
+        response.close()
+        return ids
+
+    assert _serve(store, scenario) == [2, 3, 4]
+
+
+def test_failed_scan_loop_stops_the_server(monkeypatch):
+    raised = []
+    monkeypatch.setattr(server.signal, 'raise_signal', raised.append)
+
+    async def run():
+        async def fail():
+            raise ImportError("no scanner")
+        failed = asyncio.create_task(fail())
+        cancelled = asyncio.create_task(asyncio.sleep(10))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(failed, cancelled, return_exceptions=True)
+        server._stop_on_scan_failure(cancelled)
+        server._stop_on_scan_failure(failed)
+
+    asyncio.run(run())
+
+    assert raised == [server.signal.SIGINT]
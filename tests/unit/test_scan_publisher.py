@@ -0,0 +1,52 @@
+import asyncio
+from datetime import date
+import pandas as pd
+from trading_platform.application.config.config import Config
+from trading_platform.application.scanners.market_scanner import MarketScanner
+from trading_platform.application.scanners.publishing import ScanPublisher
+from trading_platform.domain.events.market_event import MarketEvent, ScanCompletedEvent
+from trading_platform.infrastructure.data_providers.provider_interface import MarketDataProvider
+from trading_platform.infrastructure.messaging.event_bus import InMemoryEventBus
+
+
+class BulkProvider(MarketDataProvider):
+    async def get_historical_data(self, instrument, start_date, end_date, interval='1d'):
+        raise NotImplementedError
+
+    async def get_options_data(self, instrument):
+        raise NotImplementedError
+
+    async def get_bulk_historical_data(self, symbols, start, end=None):
+        index = pd.bdate_range(end=date.today(), periods=3)
+        return {symbol: pd.DataFrame({'Close': [1.0, 2.0, 3.0], 'Volume': [1e6] * 3, 'Dividends': [0.0] * 3},
+                                     index=index)
+                for symbol in symbols}
+
+
+def _scanner(tmp_path, event_bus) -> MarketScanner:
+    config = Config()
+    config.fundamentals.path = str(tmp_path / 'fundamentals.json')
+    return MarketScanner(config, bar_provider=BulkProvider(), event_bus=event_bus)
+
+
+def test_refreshed_bars_and_results_are_published(tmp_path):
+    bus = InMemoryEventBus()
+    events = []
+    bus.subscribe(MarketEvent, events.append)
+    bus.subscribe(ScanCompletedEvent, events.append)
+    scanner = _scanner(tmp_path, bus)
+    scanner.last_scan_id = 'scan-1'
+
+    async def run():
+        await scanner._refresh_bars(['AAA', 'BBB'])
+        await ScanPublisher(scanner, bus)([{'symbol': 'AAA', 'score': 0.7}], 'news')
+
+    asyncio.run(run())
+
+    bars = [event for event in events if isinstance(event, MarketEvent)]
+    assert [event.instrument.symbol for event in bars] == ['AAA', 'BBB']
+    assert list(bars[0].data.columns) == ['Close', 'Volume']      # Action columns split off
+    assert bars[0].data is not scanner.bars['AAA']
+    completed = events[-1]
+    assert isinstance(completed, ScanCompletedEvent)
+    assert completed.scan_id == 'scan-1' and completed.results[0]['symbol'] == 'AAA'
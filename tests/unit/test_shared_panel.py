@@ -0,0 +1,58 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import pytest
+from trading_platform.application.data.panel import BarPanel, PanelError
+from trading_platform.application.data.shared_panel import (
+    SEGMENT_PREFIX, SharedPanel, SharedPanelHandle, SharedPanelView, sweep_stale_segments
+)
+
+
+def _panel() -> BarPanel:
+    index = pd.bdate_range('2026-01-05', periods=10)
+    frames = {}
+    for i, symbol in enumerate(('AAA', 'BBB')):
+        close = 10.0 * (i + 1) + np.arange(10, dtype=float)
+        frames[symbol] = pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                                       'Volume': np.full(10, 1e6)}, index=index)
+    return BarPanel.from_frames(frames)
+
+
+def _last_close_in_worker(handle: SharedPanelHandle, symbol: str):
+    view = SharedPanelView(handle)
+    try:
+        return float(view.panel.series(symbol)[-1]), float(view.array('rsi_14')[view.panel.symbols.id_of(symbol)])
+    finally:
+        view.close()
+
+
+def test_workers_read_the_owners_segment(tmp_path):
+    panel = _panel()
+    with SharedPanel(panel, arrays={'rsi_14': np.array([40.0, 60.0])}, directory=str(tmp_path)) as shared:
+        view = SharedPanelView(shared.handle)
+        np.testing.assert_array_equal(view.panel.field('Close'), panel.field('Close'))
+        assert 'AAA' in view and shared.handle.arrays == ('rsi_14',)
+        # Mapped read-only: a worker can't corrupt what the others read
+        with pytest.raises(ValueError):
+            view.panel.field('Close')[0, 0] = 0.0
+        with pytest.raises(PanelError):
+            view.array('missing')
+        view.close()
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_last_close_in_worker, shared.handle, 'BBB').result() == (29.0, 60.0)
+
+    assert shared.closed and not os.path.exists(shared.handle.path)
+    with pytest.raises(PanelError):
+        SharedPanelView(shared.handle)
+
+
+def test_segments_of_dead_owners_are_swept(tmp_path):
+    dead = tmp_path / f"{SEGMENT_PREFIX}999999999-abc.bin"
+    alive = tmp_path / f"{SEGMENT_PREFIX}{os.getpid()}-def.bin"
+    dead.write_bytes(b'x')
+    alive.write_bytes(b'x')
+
+    assert sweep_stale_segments(str(tmp_path)) == 1
+    assert not dead.exists() and alive.exists()
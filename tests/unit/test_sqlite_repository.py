@@ -0,0 +1,86 @@
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+from trading_platform.domain.events.market_event import ScanCompletedEvent, SignalEvent
+from trading_platform.domain.models.instrument import Instrument, Signal
+from trading_platform.infrastructure.messaging.event_bus import InMemoryEventBus
+from trading_platform.infrastructure.storage.sqlite_repository import SQLiteResultsRepository
+
+
+def _signal(symbol: str, day: date, signal_type: str = 'BUY', confidence: float = 0.8) -> Signal:
+    return Signal(instrument=Instrument(symbol), type=signal_type, confidence=confidence,
+                  timestamp=datetime(day.year, day.month, day.day, 15, 30), price=Decimal('12.34'),
+                  technical_indicators={'rsi': 40.0}, prediction=confidence, reason=['test'])
+
+
+def test_scans_are_stored_queried_and_replaced(tmp_path):
+    repository = SQLiteResultsRepository(str(tmp_path / 'results.db'))
+    first = datetime(2026, 3, 2, 10)
+    repository.save_scan([{'symbol': 'AAA', 'score': 0.9}, {'symbol': 'BBB', 'score': 0.4}], first, 'scan-1')
+    repository.save_scan([{'symbol': 'AAA', 'score': 0.7}], datetime(2026, 3, 3, 10), 'scan-2')
+    # Re-scored results of scan-1 replace its earlier rows
+    repository.save_scan([{'symbol': 'AAA', 'score': 0.95}], first, 'scan-1')
+
+    aaa = list(repository.scan_results(symbol='AAA'))
+    assert [(r['scan_id'], r['score']) for r in aaa] == [('scan-1', 0.95), ('scan-2', 0.7)]
+    assert aaa[0]['scan_time'] == first
+    assert [r['symbol'] for r in repository.scan_results(min_score=0.8)] == ['AAA']
+    assert list(repository.scan_results(symbol='BBB')) == []
+    repository.close()
+
+
+def test_signals_round_trip_with_filters(tmp_path):
+    repository = SQLiteResultsRepository(str(tmp_path / 'results.db'))
+    repository.save_signals([_signal('AAA', date(2026, 3, 2)),
+                             _signal('BBB', date(2026, 3, 2), 'SELL', 0.6),
+                             _signal('AAA', date(2026, 3, 3), confidence=0.9)])
+
+    stored = list(repository.signals(symbol='AAA', batch_size=1))
+    assert stored == [_signal('AAA', date(2026, 3, 2)), _signal('AAA', date(2026, 3, 3), confidence=0.9)]
+    assert [s.instrument.symbol for s in repository.signals(signal_type='SELL')] == ['BBB']
+    assert len(list(repository.signals(min_confidence=0.85))) == 1
+    assert len(list(repository.signals(start=datetime(2026, 3, 3), end=datetime(2026, 3, 4)))) == 1
+    repository.close()
+
+
+def test_consecutive_signal_days_skips_days_without_signals(tmp_path):
+    repository = SQLiteResultsRepository(str(tmp_path / 'results.db'))
+    # 3/2, 3/4 and 3/5 have signals; 3/3 has none, so it doesn't break a run
+    repository.save_signals([
+        _signal('AAA', date(2026, 3, 2)), _signal('AAA', date(2026, 3, 4)), _signal('AAA', date(2026, 3, 5)),
+        _signal('BBB', date(2026, 3, 4)), _signal('BBB', date(2026, 3, 5)),
+        _signal('CCC', date(2026, 3, 2)), _signal('CCC', date(2026, 3, 5), 'SELL'),
+        _signal('DDD', date(2026, 3, 4), confidence=0.5), _signal('DDD', date(2026, 3, 5)),
+    ])
+
+    assert repository.consecutive_signal_days(3, until=date(2026, 3, 5)) == ['AAA']
+    assert repository.consecutive_signal_days(2, until=date(2026, 3, 5)) == ['AAA', 'BBB', 'DDD']
+    assert repository.consecutive_signal_days(2, min_confidence=0.7, until=date(2026, 3, 5)) == ['AAA', 'BBB']
+    assert repository.consecutive_signal_days(2, signal_type='SELL', until=date(2026, 3, 5)) == []
+    assert repository.consecutive_signal_days(2, until=date(2026, 3, 4)) == ['AAA']
+    # Fewer days with signals than asked for
+    assert repository.consecutive_signal_days(4, until=date(2026, 3, 5)) == []
+    repository.close()
+
+
+def test_attached_repository_batches_published_signals(tmp_path):
+    repository = SQLiteResultsRepository(str(tmp_path / 'results.db'), flush_interval=60.0, max_pending=2)
+    batches = []
+    save_signals = repository.save_signals
+    repository.save_signals = lambda signals: batches.append(len(signals)) or save_signals(signals)
+
+    async def run():
+        bus = InMemoryEventBus()
+        repository.attach(bus)
+        await bus.publish(ScanCompletedEvent([{'symbol': 'AAA', 'score': 0.9}], datetime(2026, 3, 2, 10), 'scan-1'))
+        for symbol in ('AAA', 'BBB', 'CCC'):
+            await bus.publish(SignalEvent(_signal(symbol, date(2026, 3, 2)), datetime(2026, 3, 2, 15, 30)))
+        await repository.flush()
+        repository.detach(bus)
+
+    asyncio.run(run())
+
+    assert batches == [2, 1]
+    assert [s.instrument.symbol for s in repository.signals()] == ['AAA', 'BBB', 'CCC']
+    assert [r['scan_id'] for r in repository.scan_results()] == ['scan-1']
+    repository.close()
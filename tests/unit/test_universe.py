@@ -0,0 +1,70 @@
+import os
+import pytest
+from trading_platform.application.universe.universe import UniverseError, UniverseLoader, shard_of
+
+SNAPSHOT = """symbol,name,exchange,sector,indices
+msft,Microsoft,NASDAQ,Technology,SP500|NDX100
+AAPL,Apple,NASDAQ,Technology,SP500
+IWM1,Small Co,NYSE,Industrials,R2000
+AAPL,Apple,NASDAQ,Technology,NDX100
+"""
+
+
+def _loader(tmp_path, **snapshots) -> UniverseLoader:
+    for version, text in snapshots.items():
+        (tmp_path / f"constituents_{version}.csv").write_text(text)
+    return UniverseLoader(str(tmp_path))
+
+
+def test_loads_latest_snapshot_with_merged_index_membership(tmp_path):
+    loader = _loader(tmp_path, **{'20260101': 'symbol\nOLD\n', '20260301': SNAPSHOT})
+
+    universe = loader.load()
+
+    assert universe.version == '20260301'
+    assert universe.symbols == ('AAPL', 'IWM1', 'MSFT')
+    assert [info.id for info in universe.infos] == [0, 1, 2]
+    assert universe.info('AAPL').in_index('SP500') and universe.info('AAPL').in_index('NDX100')
+    assert universe.members('NDX100') == ['AAPL', 'MSFT']
+    assert loader.load('20260101').symbols == ('OLD',)
+
+
+def test_index_filter_and_errors(tmp_path):
+    loader = _loader(tmp_path, **{'20260301': SNAPSHOT})
+
+    r2000 = loader.load(indices=['R2000'])
+    assert r2000.symbols == ('IWM1',) and r2000.info('IWM1').id == 0
+    with pytest.raises(UniverseError):
+        loader.load(indices=['DOW30'])
+    with pytest.raises(UniverseError):
+        loader.load('19990101')
+    with pytest.raises(UniverseError):
+        UniverseLoader(str(tmp_path / 'missing')).load()
+
+
+def test_snapshot_is_reparsed_only_when_the_file_changes(tmp_path):
+    loader = _loader(tmp_path, **{'20260301': SNAPSHOT})
+    first = loader.load()
+    assert loader.load() is first
+
+    path = tmp_path / 'constituents_20260301.csv'
+    path.write_text(SNAPSHOT + 'NEW,New Co,NYSE,Energy,SP500\n')
+    os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+    assert 'NEW' in loader.load()
+
+
+def test_shards_partition_the_universe_stably(tmp_path):
+    rows = ''.join(f"S{i:04d},,NYSE,,SP500\n" for i in range(500))
+    universe = _loader(tmp_path, **{'20260301': 'symbol,name,exchange,sector,indices\n' + rows}).load()
+
+    shards = universe.shards(7)
+
+    assert sorted(symbol for shard in shards for symbol in shard) == list(universe.symbols)
+    assert all(shards[i] == universe.shard(i, 7) for i in range(7))
+    assert all(shard_of(symbol, 7) == i for i, shard in enumerate(shards) for symbol in shard)
+    # A symbol's shard doesn't depend on what else is in the universe
+    assert universe.subset(shards[3][:10]).shard(3, 7) == shards[3][:10]
+    assert [len(batch) for batch in universe.batches(200)] == [200, 200, 100]
+    assert universe.num_batches(200) == 3
+    with pytest.raises(ValueError):
+        universe.shard(7, 7)